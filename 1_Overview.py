@@ -3,10 +3,16 @@ import pandas as pd
 import utils
 from components.overview_metrics import render_overview_metrics
 from components.overview_medal_distribution import render_overview_medal_distribution
-from components.overview_top_standings import render_overview_top_standings
+from components.overview_top_standings import render_overview_top_standings, render_projected_standings
+from components.performance_panel import render_performance_panel
+from modules.data_loader import load_medal_projection, pin_snapshot
+from modules.progressive import ProgressiveRenderer
 
 st.set_page_config(page_title="LA28 Overview", page_icon="🏠", layout="wide")
 
+# Every table this run reads comes from the same data snapshot
+pin_snapshot()
+
 # Load data
 df_athletes, df_medals, df_events, df_nocs = utils.load_data()
 
@@ -33,13 +39,31 @@ render_overview_metrics(
 )
 
 # --- Visualizations ---
+# Charts get placeholders now and are rendered after the KPIs have painted
+
+progressive = ProgressiveRenderer()
 
 col_charts_1, col_charts_2 = st.columns(2)
 
 # 1. Global Medal Distribution (Pie/Donut)
 with col_charts_1:
-    render_overview_medal_distribution(filtered_medals, selected_medal_types)
+    progressive.defer(render_overview_medal_distribution, filtered_medals, selected_medal_types,
+                      label="Loading medal distribution...")
 
 # 2. Top 10 Medal Standings (Horizontal Bar)
 with col_charts_2:
-    render_overview_top_standings(filtered_medals, selected_medal_types)
+    progressive.defer(render_overview_top_standings, filtered_medals, selected_medal_types,
+                      label="Loading medal standings...")
+
+
+# 3. Projected LA28 Standings: simulated in the background, after the KPIs have painted
+progressive.defer(
+    render_projected_standings, selected_medal_types, selected_countries,
+    prepare=lambda: load_medal_projection(selected_medal_types),
+    label="Simulating LA28 medal standings...",
+)
+
+progressive.run()
+
+# Opt-in performance panel (sidebar), after every section has rendered
+render_performance_panel()
@@ -1,60 +1,183 @@
 """
 Age Distribution Component
 Displays box plot and violin plot for athlete age distribution.
+Charts are drawn from precomputed per-group statistics, not raw athlete rows.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def render_age_distribution(df_filtered: pd.DataFrame):
-    """Render the Athlete Age Distribution section."""
-    st.subheader("📊 Athlete Age Distribution")
+from modules.figure_cache import cached_figure
+from modules.distribution_stats import compute_box_stats, compute_kde_curves
+from modules.profiling import profiled
+from modules.lazy_imports import go
+
+
+GENDER_COLORS = {'Male': '#3498db', 'Female': '#e74c3c'}
 
-    age_data = df_filtered[df_filtered['age'].notna()].copy()
+
+@st.cache_data(show_spinner=False)
+def _get_age_statistics(df_filtered: pd.DataFrame, top_n_sports: int = 10) -> dict:
+    """Compute (and cache per filter state) box and KDE statistics for the age charts."""
+    age_data = df_filtered.loc[df_filtered['age'].notna(), ['gender', 'age', 'disciplines']]
 
     # Clean disciplines for display (remove brackets and quotes)
-    age_data['disciplines_clean'] = age_data['disciplines'].apply(
-        lambda x: str(x).strip("[]'\"}").replace("'", "").replace('"', '') if pd.notna(x) else 'Unknown'
+    age_data = age_data.assign(
+        disciplines_clean=age_data['disciplines'].astype(str)
+        .str.strip("[]'\"}").str.replace("'", "").str.replace('"', '')
+        .where(age_data['disciplines'].notna(), 'Unknown')
+    )
+
+    top_sports = age_data['disciplines_clean'].value_counts().head(top_n_sports).index.tolist()
+    age_sports = age_data[age_data['disciplines_clean'].isin(top_sports)]
+
+    kde_groups, kde_grid, kde_densities = compute_kde_curves(age_sports, ['disciplines_clean', 'gender'], 'age')
+    return {
+        'gender_box': compute_box_stats(age_data, ['gender'], 'age'),
+        'sport_box': compute_box_stats(age_sports, ['disciplines_clean', 'gender'], 'age'),
+        'sports': top_sports,
+        'kde_groups': kde_groups,
+        'kde_grid': kde_grid,
+        'kde_densities': kde_densities,
+    }
+
+
+def create_age_box_chart(box_stats: pd.DataFrame):
+    """Create a box plot by gender from precomputed quartiles and whiskers."""
+    fig = go.Figure()
+    for row in box_stats.itertuples(index=False):
+        fig.add_trace(go.Box(
+            name=row.gender,
+            x=[row.gender],
+            q1=[row.q1],
+            median=[row.median],
+            q3=[row.q3],
+            lowerfence=[row.lowerfence],
+            upperfence=[row.upperfence],
+            mean=[row.mean],
+            marker_color=GENDER_COLORS.get(row.gender),
+        ))
+    fig.update_layout(
+        title='Age Distribution by Gender',
+        xaxis_title='Gender',
+        yaxis_title='Age (years)',
+        height=400,
     )
+    return fig
+
+
+def create_age_violin_chart(stats: dict):
+    """Create split violins by sport from precomputed KDE curves and quartiles."""
+    sports = stats['sports']
+    grid = stats['kde_grid']
+    densities = stats['kde_densities']
+    # Half violin width is 0.45 of a category slot at the global density peak
+    scale = 0.45 / densities.max()
+
+    fig = go.Figure()
+    shown_legend = set()
+    for i, (sport, gender) in enumerate(stats['kde_groups'].itertuples(index=False)):
+        position = sports.index(sport)
+        side = 1 if gender == 'Male' else -1
+        fig.add_trace(go.Scatter(
+            x=list(grid.round(2)) + [grid[-1].round(2), grid[0].round(2)],
+            y=list((position + side * densities[i] * scale).round(3)) + [position, position],
+            fill='toself',
+            mode='lines',
+            line=dict(color=GENDER_COLORS.get(gender, '#95a5a6'), width=1),
+            opacity=0.6,
+            name=gender,
+            legendgroup=gender,
+            showlegend=gender not in shown_legend,
+            hoverinfo='skip',
+        ))
+        shown_legend.add(gender)
+
+    # Interquartile range and median markers on top of each half violin
+    for row in stats['sport_box'].itertuples(index=False):
+        position = sports.index(row.disciplines_clean)
+        side = 1 if row.gender == 'Male' else -1
+        fig.add_trace(go.Scatter(
+            x=[row.q1, row.q3],
+            y=[position + side * 0.05] * 2,
+            mode='lines',
+            line=dict(color='#2c3e50', width=4),
+            legendgroup=row.gender,
+            showlegend=False,
+            hovertemplate=(
+                f"<b>{row.disciplines_clean}</b> – {row.gender} (n={row.count})<br>"
+                f"Q1: {row.q1:.1f}<br>Median: {row.median:.1f}<br>Q3: {row.q3:.1f}<extra></extra>"
+            ),
+        ))
+        fig.add_trace(go.Scatter(
+            x=[row.median],
+            y=[position + side * 0.05],
+            mode='markers',
+            marker=dict(color='white', size=6, line=dict(color='#2c3e50', width=1)),
+            legendgroup=row.gender,
+            showlegend=False,
+            hoverinfo='skip',
+        ))
+
+    fig.update_layout(
+        title='Age Distribution by Top 10 Sports',
+        xaxis_title='Age (years)',
+        yaxis=dict(title='Sport', tickmode='array', tickvals=list(range(len(sports))), ticktext=sports),
+        height=400,
+    )
+    return fig
+
+
+@profiled()
+def prepare_age_distribution(df_filtered: pd.DataFrame) -> tuple:
+    """
+    Compute the age statistics and build both charts (no Streamlit elements).
+
+    Returns:
+        (box figure, violin figure), each None when no ages match the filters
+    """
+    stats = _get_age_statistics(df_filtered)
+
+    fig_box = None
+    if not stats['gender_box'].empty:
+        fig_box = cached_figure(
+            "age_box",
+            lambda: create_age_box_chart(stats['gender_box']),
+            data=(stats['gender_box'],)
+        )
+
+    fig_violin = None
+    if not stats['kde_groups'].empty:
+        fig_violin = cached_figure(
+            "age_violin",
+            lambda: create_age_violin_chart(stats),
+            data=(stats['sport_box'], stats['kde_densities'])
+        )
+    return fig_box, fig_violin
+
+
+@profiled()
+def render_age_distribution(figures: tuple):
+    """Render the Athlete Age Distribution section (see prepare_age_distribution)."""
+    fig_box, fig_violin = figures
+    st.subheader("📊 Athlete Age Distribution")
 
     col1, col2 = st.columns(2)
 
     with col1:
         # Box plot by gender
-        if not age_data.empty:
-            fig_box = px.box(
-                age_data,
-                x='gender',
-                y='age',
-                color='gender',
-                title='Age Distribution by Gender',
-                labels={'age': 'Age (years)', 'gender': 'Gender'},
-                color_discrete_map={'Male': '#3498db', 'Female': '#e74c3c'}
-            )
-            fig_box.update_layout(height=400)
+        if fig_box is not None:
             st.plotly_chart(fig_box, width='stretch')
         else:
             st.info("No age data available for the selected filters.")
 
     with col2:
         # Violin plot by sport (top 10 sports)
-        if not age_data.empty:
-            # Get top 10 sports by athlete count (using cleaned disciplines)
-            top_sports = age_data['disciplines_clean'].value_counts().head(10).index.tolist()
-            age_sports = age_data[age_data['disciplines_clean'].isin(top_sports)]
-            
-            fig_violin = px.violin(
-                age_sports,
-                y='disciplines_clean',
-                x='age',
-                color='gender',
-                title='Age Distribution by Top 10 Sports',
-                labels={'age': 'Age (years)', 'disciplines_clean': 'Sport'},
-                orientation='h',
-                box=True
-            )
-            fig_violin.update_layout(height=400)
+        if fig_violin is not None:
             st.plotly_chart(fig_violin, width='stretch')
         else:
             st.info("No age data available for the selected filters.")
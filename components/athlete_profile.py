@@ -4,8 +4,18 @@ Displays detailed athlete profile, including image, personal info, and coach det
 """
 import streamlit as st
 import pandas as pd
-import requests
 from urllib.parse import quote_plus
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.profiling import profiled
+from modules.lazy_imports import lazy_import
+
+# Heavy dependencies, imported on first use
+requests = lazy_import("requests")
 
 # ============ GOOGLE IMAGE SEARCH FUNCTION ============
 @st.cache_data(ttl=3600, show_spinner=False)
@@ -82,6 +92,7 @@ def get_profile_image_url(name: str, gender: str, country: str = "") -> str:
         return f"https://ui-avatars.com/api/?name={initials}&size=200&background=e74c3c&color=fff&bold=true"
 
 
+@profiled()
 def render_athlete_profile(df_athletes: pd.DataFrame, df_coaches: pd.DataFrame, df_medallists: pd.DataFrame):
     """Render the Athlete Profile Search section."""
     st.subheader("🔍 Athlete Profile Search")
@@ -3,23 +3,20 @@ Continent Medals Bar Component
 Displays a grouped bar chart of medals by continent.
 """
 import streamlit as st
-import plotly.graph_objects as go
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def render_continent_medals_bar(df_filtered: pd.DataFrame):
-    """Render the Continent vs. Medals Comparison section."""
-    st.subheader("📊 Continent vs. Medals Comparison")
-    st.markdown("*Total medals by continent (Gold, Silver, Bronze)*")
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import go
 
-    if df_filtered.empty:
-        st.info("No data available for the selected filters")
-        return
-
-    # Aggregate medals by continent
-    continent_medals = df_filtered.groupby('Continent')[['Gold Medal', 'Silver Medal', 'Bronze Medal']].sum().reset_index()
-    continent_medals = continent_medals.sort_values('Gold Medal', ascending=False)
 
+def create_continent_medals_bar(continent_medals: pd.DataFrame):
+    """Create the grouped bar chart of medals per continent."""
     fig_continent = go.Figure()
     fig_continent.add_trace(go.Bar(
         name='Gold',
@@ -48,4 +45,39 @@ def render_continent_medals_bar(df_filtered: pd.DataFrame):
         height=400,
         hovermode='x unified'
     )
+    return fig_continent
+
+
+@profiled()
+def prepare_continent_medals_bar(df_filtered: pd.DataFrame):
+    """
+    Aggregate medals by continent and build the chart (no Streamlit elements).
+
+    Returns:
+        The figure, or None when no data matches the filters
+    """
+    if df_filtered.empty:
+        return None
+
+    # Aggregate medals by continent
+    continent_medals = df_filtered.groupby('Continent')[['Gold Medal', 'Silver Medal', 'Bronze Medal']].sum().reset_index()
+    continent_medals = continent_medals.sort_values('Gold Medal', ascending=False)
+
+    return cached_figure(
+        "continent_medals_bar",
+        lambda: create_continent_medals_bar(continent_medals),
+        data=(continent_medals,)
+    )
+
+
+@profiled()
+def render_continent_medals_bar(fig_continent):
+    """Render the Continent vs. Medals Comparison section (see prepare_continent_medals_bar)."""
+    st.subheader("📊 Continent vs. Medals Comparison")
+    st.markdown("*Total medals by continent (Gold, Silver, Bronze)*")
+
+    if fig_continent is None:
+        st.info("No data available for the selected filters")
+        return
+
     st.plotly_chart(fig_continent, width='stretch')
@@ -0,0 +1,89 @@
+"""
+Edition Comparison Component
+Shows how each country's medal count changed between two Games editions.
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.editions import CURRENT_EDITION, edition_label, medal_deltas
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+# Countries shown on each side (biggest gains and biggest losses)
+TOP_MOVERS = 10
+
+
+def create_medal_delta_bar(movers: pd.DataFrame, base: str, other: str):
+    """Create the diverging bar chart of medal count changes."""
+    fig = px.bar(
+        movers,
+        x="delta",
+        y="country",
+        orientation="h",
+        color="delta",
+        color_continuous_scale="RdYlGn",
+        color_continuous_midpoint=0,
+        hover_data={"base": True, "other": True, "delta": True},
+        labels={
+            "delta": "Medal change",
+            "country": "",
+            "base": edition_label(base),
+            "other": edition_label(other),
+        },
+        title=f"Medal count change from {edition_label(base)} to {edition_label(other)}",
+    )
+    fig.update_layout(yaxis={"categoryorder": "total ascending"}, coloraxis_showscale=False, height=600)
+    return fig
+
+
+@profiled()
+def render_edition_comparison(editions: list, selected_medals: list):
+    """
+    Render the cross-edition comparison of country medal counts.
+
+    Args:
+        editions: Available editions, oldest first (see modules.editions.list_editions)
+        selected_medals: Medal types to count
+    """
+    st.header("📈 Edition Comparison")
+    st.markdown("How did each country's medal count change between two Games?")
+
+    col_base, col_other = st.columns(2)
+    current = editions.index(CURRENT_EDITION) if CURRENT_EDITION in editions else len(editions) - 1
+    other = col_other.selectbox("Compare", editions, index=current, format_func=edition_label, key="edition_other")
+    base = col_base.selectbox(
+        "Against",
+        editions,
+        # The edition before the compared one (the next one when comparing the oldest)
+        index=editions.index(other) - 1 if editions.index(other) > 0 else 1,
+        format_func=edition_label,
+        key="edition_base",
+    )
+
+    if base == other:
+        st.info("Select two different editions to compare.")
+        return
+
+    deltas = medal_deltas(base, other, selected_medals)
+    movers = pd.concat([deltas.head(TOP_MOVERS), deltas.tail(TOP_MOVERS)]).drop_duplicates("country_code")
+    movers = movers[movers["delta"] != 0]
+
+    if movers.empty:
+        st.info("No country's medal count changed between these editions.")
+        return
+
+    fig = cached_figure(
+        "edition_comparison",
+        lambda: create_medal_delta_bar(movers, base, other),
+        data=(movers,),
+        base=base,
+        other=other
+    )
+    st.plotly_chart(fig, width='stretch')
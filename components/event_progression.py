@@ -0,0 +1,127 @@
+"""
+Event Progression Component
+Drill-down into one event: its rounds, how participants flowed from round to
+round, how the finalists qualified and any participant's path.
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.progression import EventProgression, ProgressionIndex
+from modules.lazy_imports import go
+
+
+PATH_COLUMNS = ["round_name", "stage", "rank", "result", "qualification_mark", "result_WLT"]
+
+
+def create_progression_sankey(progression: EventProgression):
+    """Create a Sankey diagram of the participants moving from round to round."""
+    rounds = progression.rounds
+    position = {code: i for i, code in enumerate(rounds["round_code"])}
+    labels = [f"{name} ({count})" for name, count in zip(rounds["round_name"], rounds["participants"])]
+    edges = progression.edges
+    fig = go.Figure(go.Sankey(
+        arrangement="snap",
+        node=dict(label=labels, pad=20, thickness=16, color="#3498db"),
+        link=dict(
+            source=edges["from_round"].map(position).tolist(),
+            target=edges["to_round"].map(position).tolist(),
+            value=edges["participants"].tolist(),
+            color="rgba(52, 152, 219, 0.3)",
+        ),
+    ))
+    fig.update_layout(title=f"{progression.event_name}: participants per round", height=400)
+    return fig
+
+
+@profiled()
+def render_event_progression(index: ProgressionIndex):
+    """
+    Render the event progression drill-down.
+
+    Args:
+        index: Event progression index (see modules.data_loader.load_event_progression)
+    """
+    st.header("🏁 Event Progression")
+    st.markdown("How did each event unfold, from the first round to the final?")
+
+    if index.events.empty:
+        st.info("No results data available.")
+        return
+
+    col_discipline, col_event = st.columns(2)
+    disciplines = sorted(index.events["discipline_name"].dropna().unique())
+    discipline = col_discipline.selectbox("Discipline", disciplines, key="progression_discipline")
+    events = index.events_for(discipline)
+    event_code = col_event.selectbox(
+        "Event",
+        events["event_code"].tolist(),
+        format_func=dict(zip(events["event_code"], events["event_name"])).get,
+        key="progression_event",
+    )
+
+    progression = index.event(event_code)
+    if progression.rounds.empty:
+        st.info("No round results for this event.")
+        return
+
+    if not progression.edges.empty:
+        fig = cached_figure(
+            "event_progression",
+            lambda: create_progression_sankey(progression),
+            data=(progression.rounds, progression.edges),
+            event=event_code
+        )
+        st.plotly_chart(fig, width='stretch')
+
+    st.dataframe(
+        progression.rounds[["round_name", "start", "units", "participants"]].rename(columns={
+            "round_name": "Round", "start": "Start", "units": "Units", "participants": "Participants",
+        }),
+        hide_index=True,
+        width='stretch',
+    )
+
+    # How the participants of the last round got there
+    last_round = progression.rounds.iloc[-1]
+    if len(progression.rounds) > 1:
+        st.subheader(f"How the {last_round['round_name']} participants qualified")
+        qualifiers = progression.qualifiers()
+        st.dataframe(
+            qualifiers.drop(columns="participant_code").rename(columns={
+                "participant_name": "Participant",
+                "participant_country": "Country",
+                "rank": f"{last_round['round_name']} rank",
+                "result": f"{last_round['round_name']} result",
+            }),
+            hide_index=True,
+            width='stretch',
+        )
+
+    # One participant's path through the event
+    participants = (
+        progression.rows.drop_duplicates("participant_code")
+        .sort_values("participant_name")
+        .set_index("participant_code")["participant_name"]
+    )
+    participant = st.selectbox(
+        "Participant path",
+        participants.index.tolist(),
+        format_func=participants.get,
+        key="progression_participant",
+    )
+    path = progression.participant_path(participant)
+    st.dataframe(
+        path[PATH_COLUMNS].rename(columns={
+            "round_name": "Round", "stage": "Unit", "rank": "Rank", "result": "Result",
+            "qualification_mark": "Mark", "result_WLT": "W/L/T",
+        }),
+        hide_index=True,
+        width='stretch',
+    )
@@ -3,14 +3,103 @@ Event Schedule Component
 Displays the timeline of Olympic events.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def render_event_schedule(df_schedule: pd.DataFrame, selected_sports: list, selected_venues: list):
-    """Render the Event Schedule section with timeline visualization."""
-    st.header("📅 Event Schedule")
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+def create_schedule_timeline(current_data: pd.DataFrame, chart_title: str):
+    """Create the Gantt-style timeline for a slice of the schedule."""
+    # Calculate dynamic height based on number of unique events
+    # 40px per event track + 100px buffer for axis/title
+    n_events = current_data['event'].nunique()
+    dynamic_height = max(200, n_events * 40 + 100)
+
+    fig_timeline = px.timeline(
+        current_data,
+        x_start="start_date",
+        x_end="end_date",
+        y="event",
+        color="discipline",
+        hover_data={
+            "venue": True,
+            "phase": True,
+            "status": True,
+            "gender": True,
+            "start_date": "|%b %d %H:%M",
+            "end_date": "|%H:%M",
+            "discipline": False
+        },
+        title=chart_title,
+        height=dynamic_height,
+        color_discrete_sequence=px.colors.qualitative.Prism
+    )
+    
+    fig_timeline.update_yaxes(
+        autorange="reversed",
+        title_text="",
+        showgrid=True,
+        gridcolor='rgba(200,200,200,0.2)',
+        tickfont=dict(size=12)
+    )
+    
+    fig_timeline.update_xaxes(
+        title_text="",
+        showgrid=True,
+        gridcolor='rgba(200,200,200,0.2)',
+        rangeslider_visible=True,
+        tickformat="%b %d\n%H:%M"
+    )
+
+    fig_timeline.update_layout(
+        template="plotly_white",
+        hovermode="closest",
+        title_font_family="Arial",
+        title_font_size=20,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            title_text=""
+        ),
+        margin=dict(l=20, r=20, t=60, b=20),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    fig_timeline.update_traces(
+        marker_line_color='white',
+        marker_line_width=1,
+        opacity=0.9,
+        hovertemplate="<b>%{y}</b><br>" +
+                      "Start: %{base|%b %d %H:%M}<br>" +
+                      "End: %{x|%b %d %H:%M}<br>" +
+                      "Venue: %{customdata[0]}<br>" +
+                      "Phase: %{customdata[1]}<br>" +
+                      "Status: %{customdata[2]}"
+    )
+    return fig_timeline
 
+
+@profiled()
+def prepare_event_schedule(df_schedule: pd.DataFrame, selected_sports: list, selected_venues: list):
+    """
+    Filter the schedule and build a timeline per tab (no Streamlit elements).
+
+    Returns:
+        List of (tab label, figure or None) for "All Events" and each day; an
+        empty list when no events match, None when the unfiltered schedule
+        is too large to draw
+    """
     schedule_filtered = df_schedule.copy()
 
     if selected_sports:
@@ -20,111 +109,63 @@ def render_event_schedule(df_schedule: pd.DataFrame, selected_sports: list, sele
         schedule_filtered = schedule_filtered[schedule_filtered["venue"].isin(selected_venues)]
 
     if len(schedule_filtered) > 2000 and not (selected_sports or selected_venues):
+        return None
+    if schedule_filtered.empty:
+        return []
+
+    # Ensure dates are datetime objects
+    schedule_filtered["start_date"] = pd.to_datetime(schedule_filtered["start_date"])
+    schedule_filtered["end_date"] = pd.to_datetime(schedule_filtered["end_date"])
+
+    # Create a day column for grouping
+    schedule_filtered["day_group"] = schedule_filtered["start_date"].dt.date
+
+    # Get unique sorted days
+    unique_days = sorted(schedule_filtered["day_group"].unique())
+
+    # Tabs: "All Events" + one for each day
+    day_labels = [day.strftime("%b %d") for day in unique_days]
+    all_labels = ["All Events"] + day_labels
+
+    tabs = []
+    for i, tab_label in enumerate(all_labels):
+        if i == 0:
+            # All Events
+            current_data = schedule_filtered.sort_values(by="start_date")
+            chart_title = f"<b>Full Schedule</b> <br><sup>{len(current_data)} events scheduled</sup>"
+        else:
+            # Specific Day
+            target_day = unique_days[i-1]
+            current_data = schedule_filtered[schedule_filtered["day_group"] == target_day].sort_values(by="start_date")
+            chart_title = f"<b>Schedule for {tab_label}</b> <br><sup>{len(current_data)} events scheduled</sup>"
+
+        fig_timeline = None
+        if not current_data.empty:
+            fig_timeline = cached_figure(
+                "event_schedule",
+                lambda: create_schedule_timeline(current_data, chart_title),
+                data=(current_data,),
+                title=chart_title
+            )
+        tabs.append((tab_label, fig_timeline))
+    return tabs
+
+
+@profiled()
+def render_event_schedule(timelines: list):
+    """Render the Event Schedule section with timeline visualization (see prepare_event_schedule)."""
+    st.header("📅 Event Schedule")
+
+    if timelines is None:
         st.info("ℹ️ The full schedule is very large. Please select a **Sport** or **Venue** in the sidebar to view the Timeline.")
-    elif schedule_filtered.empty:
+    elif not timelines:
         st.warning("⚠️ No events found for the selected combination of filters.")
     else:
-        # Ensure dates are datetime objects
-        schedule_filtered["start_date"] = pd.to_datetime(schedule_filtered["start_date"])
-        schedule_filtered["end_date"] = pd.to_datetime(schedule_filtered["end_date"])
-        
-        # Create a day column for grouping
-        schedule_filtered["day_group"] = schedule_filtered["start_date"].dt.date
-        
-        # Get unique sorted days
-        unique_days = sorted(schedule_filtered["day_group"].unique())
-        
-        # Create tabs: "All Events" + one for each day
-        day_labels = [day.strftime("%b %d") for day in unique_days]
-        all_labels = ["All Events"] + day_labels
-        
-        tabs = st.tabs(all_labels)
-        
-        for i, tab_label in enumerate(all_labels):
-            with tabs[i]:
-                if i == 0:
-                    # All Events
-                    current_data = schedule_filtered.sort_values(by="start_date")
-                    chart_title = f"<b>Full Schedule</b> <br><sup>{len(current_data)} events scheduled</sup>"
-                else:
-                    # Specific Day
-                    target_day = unique_days[i-1]
-                    current_data = schedule_filtered[schedule_filtered["day_group"] == target_day].sort_values(by="start_date")
-                    chart_title = f"<b>Schedule for {tab_label}</b> <br><sup>{len(current_data)} events scheduled</sup>"
-                
-                if current_data.empty:
+        tabs = st.tabs([tab_label for tab_label, _ in timelines])
+
+        for tab, (tab_label, fig_timeline) in zip(tabs, timelines):
+            with tab:
+                if fig_timeline is None:
                     st.info(f"No events found for {tab_label}.")
-                    continue
-
-                # Calculate dynamic height based on number of unique events
-                # 40px per event track + 100px buffer for axis/title
-                n_events = current_data['event'].nunique()
-                dynamic_height = max(200, n_events * 40 + 100)
-
-                fig_timeline = px.timeline(
-                    current_data,
-                    x_start="start_date",
-                    x_end="end_date",
-                    y="event",
-                    color="discipline",
-                    hover_data={
-                        "venue": True,
-                        "phase": True,
-                        "status": True,
-                        "gender": True,
-                        "start_date": "|%b %d %H:%M",
-                        "end_date": "|%H:%M",
-                        "discipline": False
-                    },
-                    title=chart_title,
-                    height=dynamic_height,
-                    color_discrete_sequence=px.colors.qualitative.Prism
-                )
-                
-                fig_timeline.update_yaxes(
-                    autorange="reversed",
-                    title_text="",
-                    showgrid=True,
-                    gridcolor='rgba(200,200,200,0.2)',
-                    tickfont=dict(size=12)
-                )
-                
-                fig_timeline.update_xaxes(
-                    title_text="",
-                    showgrid=True,
-                    gridcolor='rgba(200,200,200,0.2)',
-                    rangeslider_visible=True,
-                    tickformat="%b %d\n%H:%M"
-                )
-
-                fig_timeline.update_layout(
-                    template="plotly_white",
-                    hovermode="closest",
-                    title_font_family="Arial",
-                    title_font_size=20,
-                    legend=dict(
-                        orientation="h",
-                        yanchor="bottom",
-                        y=1.02,
-                        xanchor="right",
-                        x=1,
-                        title_text=""
-                    ),
-                    margin=dict(l=20, r=20, t=60, b=20),
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)'
-                )
-                
-                fig_timeline.update_traces(
-                    marker_line_color='white',
-                    marker_line_width=1,
-                    opacity=0.9,
-                    hovertemplate="<b>%{y}</b><br>" +
-                                  "Start: %{base|%b %d %H:%M}<br>" +
-                                  "End: %{x|%b %d %H:%M}<br>" +
-                                  "Venue: %{customdata[0]}<br>" +
-                                  "Phase: %{customdata[1]}<br>" +
-                                  "Status: %{customdata[2]}"
-                )
-                
-                st.plotly_chart(fig_timeline, width='stretch')
+                else:
+                    st.plotly_chart(fig_timeline, width='stretch')
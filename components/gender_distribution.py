@@ -3,10 +3,18 @@ Gender Distribution Component
 Displays gender distribution by World, Continent, or Country.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+@profiled()
 def render_gender_distribution(df_filtered: pd.DataFrame):
     """Render the Gender Distribution Analysis section."""
     st.subheader("⚖️ Gender Distribution Analysis")
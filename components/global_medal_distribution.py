@@ -3,8 +3,16 @@ Global Medal Distribution Component
 Displays a choropleth map and bar chart of medal distribution by country/continent.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import px
 
 
 # NOC (Olympic) to ISO-3 country code mapping for codes that differ
@@ -174,63 +182,152 @@ def convert_noc_to_iso3(noc_code: str) -> str:
     return NOC_TO_ISO3.get(noc_code, noc_code)
 
 
-def render_global_medal_distribution(
+def filter_medal_types(df_medals: pd.DataFrame, selected_medals: list) -> pd.DataFrame:
+    """Keep the medal rows of the selected types (all rows when none are selected)."""
+    if selected_medals:
+        return df_medals[df_medals["medal_type"].isin(selected_medals)]
+    return df_medals
+
+
+def build_world_map_pivot(medal_analysis_df: pd.DataFrame, selected_medals: list) -> pd.DataFrame:
+    """
+    Count medals per country and medal type for the world map.
+
+    Args:
+        medal_analysis_df: Medal rows (one per medal) with a continent column,
+            already limited to the selected medal types
+        selected_medals: Selected medal types
+
+    Returns:
+        DataFrame with one row per country: country, country_code, continent,
+        a column per medal type, iso3_code and 'Total Medals'
+    """
+    world_map_data = (
+        medal_analysis_df
+        .groupby(["country", "country_code", "continent", "medal_type"])
+        .size()
+        .reset_index(name="total_medals")
+    )
+
+    world_map_pivot = world_map_data.pivot_table(
+        index=["country", "country_code", "continent"],
+        columns="medal_type",
+        values="total_medals",
+        fill_value=0,
+    ).reset_index()
+
+    # Convert NOC codes to ISO-3 for proper map display
+    world_map_pivot["iso3_code"] = world_map_pivot["country_code"].apply(convert_noc_to_iso3)
+
+    # Ensure all selected medal columns exist
+    for medal in selected_medals:
+        if medal not in world_map_pivot.columns:
+            world_map_pivot[medal] = 0
+
+    world_map_pivot["Total Medals"] = world_map_pivot[selected_medals].sum(axis=1)
+    return world_map_pivot
+
+
+def build_continent_medal_counts(medal_analysis_df: pd.DataFrame, selected_continent: str) -> pd.DataFrame:
+    """Count medals per country and medal type within one continent."""
+    continent_filtered_df = medal_analysis_df[medal_analysis_df["continent"] == selected_continent]
+    return (
+        continent_filtered_df
+        .groupby(["country", "medal_type"])
+        .size()
+        .reset_index(name="total_medals")
+    )
+
+
+def create_global_medal_map(world_map_pivot: pd.DataFrame, selected_medals: list):
+    """Create the world choropleth of medal totals."""
+    fig_map_global = px.choropleth(
+        world_map_pivot,
+        locations="iso3_code",
+        locationmode="ISO-3",
+        color="Total Medals",
+        hover_name="country",
+        hover_data={col: True for col in selected_medals if col in world_map_pivot.columns},
+        projection="natural earth",
+        color_continuous_scale=px.colors.sequential.Plasma,
+        title=f"Global Medal Distribution (Filtered: {', '.join([m.split()[0] for m in selected_medals])})",
+    )
+    fig_map_global.update_layout(
+        margin={"r": 0, "t": 40, "l": 0, "b": 0},
+        geo=dict(
+            showframe=False,
+            showcoastlines=True,
+        )
+    )
+    return fig_map_global
+
+
+def create_continent_country_bar(bar_chart_data: pd.DataFrame, selected_continent: str):
+    """Create the bar chart of medals per country within a continent."""
+    fig_bar = px.bar(
+        bar_chart_data,
+        x="country",
+        y="total_medals",
+        color="medal_type",
+        text_auto=True,
+        color_discrete_map={
+            "Gold Medal": "gold",
+            "Silver Medal": "silver",
+            "Bronze Medal": "#cd7f32",
+        },
+        title=f"Medal Count by Country in {selected_continent}",
+        labels={"total_medals": "Total Medals", "country": "Country"},
+    )
+    fig_bar.update_layout(xaxis={"categoryorder": "total descending"})
+    return fig_bar
+
+
+@profiled()
+def prepare_global_medal_distribution(
     df_medals: pd.DataFrame,
     selected_medals: list,
     selected_continent: str
-):
-    """Render the Global Medal Distribution section with choropleth and bar chart."""
-    st.header("🌎 Global Medal Distribution by Type")
-    st.markdown("Visualizes the total count of **selected medal types** for all countries.")
-
-    medal_analysis_df = df_medals.copy()
+) -> tuple:
+    """
+    Aggregate the medals and build the world map and continent charts (no Streamlit elements).
 
-    if selected_medals:
-        medal_analysis_df = medal_analysis_df[medal_analysis_df["medal_type"].isin(selected_medals)]
+    Returns:
+        (world map figure, continent bar figure), each None when no medals match
+    """
+    medal_analysis_df = filter_medal_types(df_medals, selected_medals)
 
+    fig_map_global = None
     if not medal_analysis_df.empty:
-        world_map_data = (
-            medal_analysis_df
-            .groupby(["country", "country_code", "continent", "medal_type"])
-            .size()
-            .reset_index(name="total_medals")
-        )
+        world_map_pivot = build_world_map_pivot(medal_analysis_df, selected_medals)
 
-        world_map_pivot = world_map_data.pivot_table(
-            index=["country", "country_code", "continent"],
-            columns="medal_type",
-            values="total_medals",
-            fill_value=0,
-        ).reset_index()
-
-        # Convert NOC codes to ISO-3 for proper map display
-        world_map_pivot["iso3_code"] = world_map_pivot["country_code"].apply(convert_noc_to_iso3)
-
-        # Ensure all selected medal columns exist
-        for medal in selected_medals:
-            if medal not in world_map_pivot.columns:
-                world_map_pivot[medal] = 0
-
-        world_map_pivot["Total Medals"] = world_map_pivot[selected_medals].sum(axis=1)
-
-        fig_map_global = px.choropleth(
-            world_map_pivot,
-            locations="iso3_code",
-            locationmode="ISO-3",
-            color="Total Medals",
-            hover_name="country",
-            hover_data={col: True for col in selected_medals if col in world_map_pivot.columns},
-            projection="natural earth",
-            color_continuous_scale=px.colors.sequential.Plasma,
-            title=f"Global Medal Distribution (Filtered: {', '.join([m.split()[0] for m in selected_medals])})",
+        fig_map_global = cached_figure(
+            "global_medal_map",
+            lambda: create_global_medal_map(world_map_pivot, selected_medals),
+            data=(world_map_pivot,),
+            selected_medals=selected_medals
         )
-        fig_map_global.update_layout(
-            margin={"r": 0, "t": 40, "l": 0, "b": 0},
-            geo=dict(
-                showframe=False,
-                showcoastlines=True,
-            )
+
+    bar_chart_data = build_continent_medal_counts(medal_analysis_df, selected_continent)
+
+    fig_bar = None
+    if not bar_chart_data.empty:
+        fig_bar = cached_figure(
+            "continent_medal_bar",
+            lambda: create_continent_country_bar(bar_chart_data, selected_continent),
+            data=(bar_chart_data,),
+            selected_continent=selected_continent
         )
+    return fig_map_global, fig_bar
+
+
+@profiled()
+def render_global_medal_distribution(figures: tuple, selected_continent: str):
+    """Render the Global Medal Distribution section with choropleth and bar chart (see prepare_global_medal_distribution)."""
+    fig_map_global, fig_bar = figures
+    st.header("🌎 Global Medal Distribution by Type")
+    st.markdown("Visualizes the total count of **selected medal types** for all countries.")
+
+    if fig_map_global is not None:
         st.plotly_chart(fig_map_global, width='stretch')
     else:
         st.info("Please select at least one medal type in the sidebar.")
@@ -238,31 +335,7 @@ def render_global_medal_distribution(
     # Continent comparison
     st.subheader(f"📊 Medal Comparison for **{selected_continent}**")
 
-    continent_filtered_df = medal_analysis_df[medal_analysis_df["continent"] == selected_continent]
-
-    if not continent_filtered_df.empty:
-        bar_chart_data = (
-            continent_filtered_df
-            .groupby(["country", "medal_type"])
-            .size()
-            .reset_index(name="total_medals")
-        )
-
-        fig_bar = px.bar(
-            bar_chart_data,
-            x="country",
-            y="total_medals",
-            color="medal_type",
-            text_auto=True,
-            color_discrete_map={
-                "Gold Medal": "gold",
-                "Silver Medal": "silver",
-                "Bronze Medal": "#cd7f32",
-            },
-            title=f"Medal Count by Country in {selected_continent}",
-            labels={"total_medals": "Total Medals", "country": "Country"},
-        )
-        fig_bar.update_layout(xaxis={"categoryorder": "total descending"})
+    if fig_bar is not None:
         st.plotly_chart(fig_bar, width='stretch')
     else:
         st.warning(f"⚠️ No medal data for **{selected_continent}** with current filters.")
@@ -1,17 +1,23 @@
 """
 Head-to-Head Country Comparison Component
-Tug-of-war style visualization comparing two countries.
+Tug-of-war style visualization comparing two countries, radar chart for more.
 """
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
 import sys
 import os
 
 # Add parent directory to path for module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from modules.helpers import country_summary
+from modules.figure_cache import cached_figure
+from modules.helpers import COUNTRY_SUMMARY_COLUMNS
+from modules.profiling import profiled
+from modules.lazy_imports import go
+
+
+# Maximum number of countries in one comparison
+MAX_COMPARED_COUNTRIES = 10
 
 
 def create_tug_of_war_chart(summary_a: dict, summary_b: dict, country_a: str, country_b: str):
@@ -138,36 +144,88 @@ def create_tug_of_war_chart(summary_a: dict, summary_b: dict, country_a: str, co
     return fig
 
 
-def render_head_to_head(df_medals: pd.DataFrame):
-    """Render the Head-to-Head Country Comparison section."""
+def create_radar_chart(df_compared: pd.DataFrame):
+    """Create a radar chart comparing several countries on every summary stat."""
+    # Normalize each stat by the best selected country so scales are comparable
+    maxima = df_compared.max().replace(0, 1)
+    normalized = df_compared / maxima * 100
+
+    fig = go.Figure()
+    for country in df_compared.index:
+        raw = df_compared.loc[country]
+        fig.add_trace(go.Scatterpolar(
+            r=list(normalized.loc[country]) + [normalized.loc[country].iloc[0]],
+            theta=COUNTRY_SUMMARY_COLUMNS + [COUNTRY_SUMMARY_COLUMNS[0]],
+            customdata=list(raw) + [raw.iloc[0]],
+            fill='toself',
+            opacity=0.6,
+            name=country,
+            hovertemplate=f"<b>{country}</b><br>%{{theta}}: %{{customdata}}<extra></extra>"
+        ))
+
+    fig.update_layout(
+        height=500,
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100], showticklabels=False)),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.2, xanchor="center", x=0.5),
+        paper_bgcolor='rgba(0,0,0,0)',
+        margin=dict(l=60, r=60, t=40, b=40),
+    )
+    return fig
+
+
+@profiled()
+def render_head_to_head(df_summary: pd.DataFrame):
+    """
+    Render the Head-to-Head Country Comparison section.
+
+    Args:
+        df_summary: Per-country summary table indexed by country
+                    (see modules.helpers.build_country_summary_table)
+    """
     st.header("⚔️ Head-to-Head Tug of War")
     st.markdown("Watch countries battle it out! The bar shows who dominates each stat.")
 
-    countries = sorted(df_medals["country"].unique())
-    col_sel1, col_sel2 = st.columns(2)
+    countries = df_summary.index.tolist()
+    selected = st.multiselect(
+        "🌍 Countries to compare",
+        countries,
+        default=countries[:2],
+        max_selections=MAX_COMPARED_COUNTRIES,
+        key="h2h_countries",
+    )
+
+    if len(selected) < 2:
+        st.info("Select at least two countries to compare.")
+        return
 
-    with col_sel1:
-        country_a = st.selectbox("🔵 Country A", countries, key="country_a")
+    df_compared = df_summary.loc[selected]
 
-    countries_b_options = [c for c in countries if c != country_a]
-    with col_sel2:
-        country_b = st.selectbox("🔴 Country B", countries_b_options, index=0, key="country_b")
+    if len(selected) == 2:
+        country_a, country_b = selected
+        fig = cached_figure(
+            "head_to_head",
+            lambda: create_tug_of_war_chart(
+                df_compared.loc[country_a].to_dict(),
+                df_compared.loc[country_b].to_dict(),
+                country_a,
+                country_b
+            ),
+            data=(df_compared,)
+        )
+    else:
+        fig = cached_figure("head_to_head_radar", lambda: create_radar_chart(df_compared), data=(df_compared,))
+    st.plotly_chart(fig, width='stretch')
 
-    if country_a and country_b:
-        summary_a = country_summary(df_medals, country_a)
-        summary_b = country_summary(df_medals, country_b)
+    # Winner announcement, ranked like the official medal table
+    ranking = df_compared.sort_values(["Gold", "Silver", "Bronze"], ascending=False)
+    leader, runner_up = ranking.iloc[0], ranking.iloc[1]
+    if tuple(leader[["Gold", "Silver", "Bronze"]]) == tuple(runner_up[["Gold", "Silver", "Bronze"]]):
+        st.info(f"🤝 It's a tie at the top between **{leader.name}** and **{runner_up.name}**!")
+    else:
+        st.success(
+            f"🏆 **{leader.name}** leads with {leader['Gold']} gold "
+            f"and {leader['Total medals']} medals in total!"
+        )
 
-        # Create and display tug-of-war chart
-        fig = create_tug_of_war_chart(summary_a, summary_b, country_a, country_b)
-        st.plotly_chart(fig, width='stretch')
-        
-        # Winner announcement
-        total_a = sum(int(v) if str(v).isdigit() else 0 for v in summary_a.values())
-        total_b = sum(int(v) if str(v).isdigit() else 0 for v in summary_b.values())
-        
-        if total_a > total_b:
-            st.success(f"🏆 **{country_a}** leads overall with {total_a} total points vs {total_b}!")
-        elif total_b > total_a:
-            st.success(f"🏆 **{country_b}** leads overall with {total_b} total points vs {total_a}!")
-        else:
-            st.info(f"🤝 It's a tie! Both countries have {total_a} total points.")
+    if len(selected) > 2:
+        st.dataframe(ranking, width='stretch')
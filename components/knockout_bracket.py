@@ -0,0 +1,139 @@
+"""
+Knockout Bracket Component
+Draws the main draw of a head-to-head event as a bracket, with its
+repechage, bronze medal and placement matches listed below.
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.bracket import Bracket, BracketIndex
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import go
+
+
+# Vertical space per first-round match, in pixels
+ROW_HEIGHT = 46
+
+
+def _side_label(name, result, won: bool) -> str:
+    result = "" if pd.isna(result) else f" {result}"
+    return f"<b>{name}{result}</b>" if won else f"{name}{result}"
+
+
+def create_bracket_figure(bracket: Bracket):
+    """Create the bracket chart of an event's main draw."""
+    layout = bracket.layout()
+    position = dict(zip(layout["stage_code"], zip(layout["x"], layout["y"])))
+
+    # Elbow connectors from each match to the next match of its winner
+    xs, ys = [], []
+    for stage, next_match in zip(layout["stage_code"], layout["winner_next"]):
+        if next_match in position:
+            (x0, y0), (x1, y1) = position[stage], position[next_match]
+            xs += [x0 + 0.3, x0 + 0.5, x0 + 0.5, x1 - 0.3, None]
+            ys += [y0, y0, y1, y1, None]
+
+    won_a = layout["winner"].notna()
+    labels = [
+        _side_label(a, a_result, won) + "<br>" + _side_label(b, b_result, False)
+        for a, a_result, b, b_result, won in zip(
+            layout["a_participant_name"], layout["a_result"],
+            layout["b_participant_name"], layout["b_result"], won_a,
+        )
+    ]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", line=dict(color="#95a5a6", width=1), hoverinfo="skip"))
+    fig.add_trace(go.Scatter(
+        x=layout["x"],
+        y=layout["y"],
+        mode="markers+text",
+        marker=dict(size=8, color="#3498db"),
+        text=labels,
+        textposition="middle right",
+        textfont=dict(size=10),
+        customdata=layout[["stage", "a_participant_country", "b_participant_country"]],
+        hovertemplate="%{customdata[0]}<br>%{customdata[1]} vs %{customdata[2]}<extra></extra>",
+    ))
+
+    round_names = layout.drop_duplicates("x").sort_values("x")
+    leaves = max(layout["y"].max() + 1, 1)
+    fig.update_layout(
+        title=f"{bracket.event_name}: main draw",
+        showlegend=False,
+        height=max(400, int(leaves * ROW_HEIGHT)),
+        xaxis=dict(
+            tickmode="array",
+            tickvals=round_names["x"].tolist(),
+            ticktext=round_names["stage"].tolist(),
+            side="top",
+            range=[-0.2, round_names["x"].max() + 0.9],
+            showgrid=False,
+            zeroline=False,
+        ),
+        yaxis=dict(autorange="reversed", visible=False),
+        margin=dict(l=10, r=10, t=80, b=10),
+    )
+    return fig
+
+
+def _match_table(matches: pd.DataFrame) -> pd.DataFrame:
+    """One readable row per match."""
+    return pd.DataFrame({
+        "Match": matches["stage"],
+        "Winner": matches["a_participant_name"].where(matches["winner"].notna()),
+        "Result": matches["a_result"].astype(str) + " – " + matches["b_result"].astype(str),
+        "Opponent": matches["b_participant_name"],
+    })
+
+
+@profiled()
+def render_knockout_bracket(index: BracketIndex):
+    """
+    Render the knockout bracket of a head-to-head event.
+
+    Args:
+        index: Bracket index (see modules.data_loader.load_brackets)
+    """
+    st.header("🥊 Knockout Brackets")
+    st.markdown("Follow a tournament from its first round to the gold medal match.")
+
+    if index.events.empty:
+        st.info("No knockout matches in the results data.")
+        return
+
+    col_discipline, col_event = st.columns(2)
+    disciplines = sorted(index.events["discipline_name"].dropna().unique())
+    discipline = col_discipline.selectbox(
+        "Discipline",
+        disciplines,
+        index=disciplines.index("Tennis") if "Tennis" in disciplines else 0,
+        key="bracket_discipline",
+    )
+    events = index.events_for(discipline)
+    event_code = col_event.selectbox(
+        "Event",
+        events["event_code"].tolist(),
+        format_func=dict(zip(events["event_code"], events["event_name"])).get,
+        key="bracket_event",
+    )
+
+    bracket = index.event(event_code)
+    fig = cached_figure(
+        "knockout_bracket",
+        lambda: create_bracket_figure(bracket),
+        data=(bracket.matches,),
+        event=event_code
+    )
+    st.plotly_chart(fig, width='stretch')
+
+    consolation = bracket.consolation
+    if not consolation.empty:
+        st.subheader("Repechage and placement matches")
+        st.dataframe(_match_table(consolation), hide_index=True, width='stretch')
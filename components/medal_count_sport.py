@@ -3,48 +3,72 @@ Medal Count by Sport Component
 Displays a treemap of medal distribution across sports and events.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def render_medal_count_by_sport(
-    df_medals: pd.DataFrame,
+from modules import query
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+def create_medal_treemap(medals_counts: pd.DataFrame):
+    """Create the treemap of medals across sports and events."""
+    fig_treemap = px.treemap(
+        medals_counts,
+        path=[px.Constant("Medals"), "discipline", "event"],
+        values="count",
+        color="count",
+        color_continuous_scale="Viridis",
+        title="Distribution of Medals across Sports and Events",
+    )
+    fig_treemap.update_traces(root_color="lightgrey")
+    return fig_treemap
+
+
+@profiled()
+def prepare_medal_count_by_sport(
     selected_medals: list,
     selected_countries: list,
     selected_sports: list
 ):
-    """Render the Medal Count by Sport section with treemap visualization."""
-    st.header("🥇 Medal Count by Sport")
+    """
+    Count medals per sport and event and build the treemap (no Streamlit elements).
 
-    medals_filtered = df_medals.copy()
+    Returns:
+        The figure, or None when no medals match the filters
+    """
+    # Filtering and counting run in the configured query backend (pandas or DuckDB)
+    medals_counts = query.aggregate(
+        "medals",
+        by=["discipline", "event"],
+        where={
+            "medal_type": selected_medals,
+            "country": selected_countries,
+            "discipline": selected_sports,
+        },
+    )
 
-    if selected_medals:
-        medals_filtered = medals_filtered[medals_filtered["medal_type"].isin(selected_medals)]
+    if medals_counts.empty:
+        return None
+    return cached_figure(
+        "medal_count_sport",
+        lambda: create_medal_treemap(medals_counts),
+        data=(medals_counts,)
+    )
 
-    if selected_countries:
-        medals_filtered = medals_filtered[medals_filtered["country"].isin(selected_countries)]
 
-    if selected_sports:
-        medals_filtered = medals_filtered[medals_filtered["discipline"].isin(selected_sports)]
+@profiled()
+def render_medal_count_by_sport(fig_treemap):
+    """Render the Medal Count by Sport section with treemap visualization (see prepare_medal_count_by_sport)."""
+    st.header("🥇 Medal Count by Sport")
 
-    if medals_filtered.empty:
+    if fig_treemap is None:
         st.warning("⚠️ No medal data available for the current filters.")
         st.caption("**Tip:** Try clearing the **Sport** filter to view total medal counts.")
     else:
-        medals_counts = (
-            medals_filtered
-            .groupby(["discipline", "event"])
-            .size()
-            .reset_index(name="count")
-        )
-
-        fig_treemap = px.treemap(
-            medals_counts,
-            path=[px.Constant("Medals"), "discipline", "event"],
-            values="count",
-            color="count",
-            color_continuous_scale="Viridis",
-            title="Distribution of Medals across Sports and Events",
-        )
-        fig_treemap.update_traces(root_color="lightgrey")
         st.plotly_chart(fig_treemap, width='stretch')
@@ -3,74 +3,139 @@ Medal Hierarchy Component
 Displays Sunburst and Treemap visualizations for medal hierarchy.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def render_medal_hierarchy(df_filtered: pd.DataFrame, show_gold: bool, show_silver: bool, show_bronze: bool):
-    """Render the Medal Hierarchy section with Sunburst and Treemap."""
+from modules.figure_cache import cached_figure
+from modules.helpers import build_medal_hierarchy, build_hierarchy_from_medals
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+# Drill-down paths over the medal fact table (display label -> columns)
+HIERARCHY_PATHS = {
+    "Continent → Country → Medal Type": ["continent", "country", "medal_type"],
+    "Continent → Country → Sport → Medal Type": ["continent", "country", "discipline", "medal_type"],
+    "Continent → Country → Sport → Event → Medal Type": ["continent", "country", "discipline", "event", "medal_type"],
+    "Sport → Event → Country → Medal Type": ["discipline", "event", "country", "medal_type"],
+}
+
+HIERARCHY_LABELS = {
+    "continent": "Continent",
+    "country": "Country",
+    "discipline": "Sport",
+    "event": "Event",
+    "medal_type": "Medal_Type",
+}
+
+
+@st.cache_data(show_spinner=False)
+def _get_totals_hierarchy(df_filtered: pd.DataFrame, medal_columns: tuple) -> pd.DataFrame:
+    """Cached Continent → Country → Medal Type data for the current filters."""
+    return build_medal_hierarchy(df_filtered, list(medal_columns))
+
+
+def _fact_hierarchy(df_medals: pd.DataFrame, countries: tuple, medal_columns: tuple, path: tuple) -> pd.DataFrame:
+    """Hierarchy over the medal fact table for the current filters and path."""
+    df_countries = df_medals[df_medals["country"].isin(countries)]
+    df_hierarchy = build_hierarchy_from_medals(df_countries, list(path), list(medal_columns))
+    return df_hierarchy.rename(columns=HIERARCHY_LABELS)
+
+
+@st.cache_data(show_spinner=False)
+def _get_fact_hierarchy(_df_medals: pd.DataFrame, medals_version, countries: tuple, medal_columns: tuple, path: tuple) -> pd.DataFrame:
+    """Cached _fact_hierarchy, keyed on the medals version and the filter state (the table is not hashed)."""
+    return _fact_hierarchy(_df_medals, countries, medal_columns, path)
+
+
+def create_hierarchy_chart(chart_fn, df_hierarchy: pd.DataFrame, path: list, path_label: str):
+    """Create a sunburst or treemap (chart_fn) over the given hierarchy path."""
+    chart_name = chart_fn.__name__.capitalize()
+    fig = chart_fn(
+        df_hierarchy,
+        path=path,
+        values='Count',
+        color='Medal_Type',
+        color_discrete_map={'Gold': '#FFD700', 'Silver': '#C0C0C0', 'Bronze': '#CD7F32'},
+        title=f'{chart_name}: {path_label}'
+    )
+    fig.update_layout(height=500)
+    return fig
+
+
+@profiled()
+def render_medal_hierarchy(
+    df_filtered: pd.DataFrame,
+    show_gold: bool,
+    show_silver: bool,
+    show_bronze: bool,
+    df_medals: pd.DataFrame = None,
+    medals_version=None
+):
+    """
+    Render the Medal Hierarchy section with Sunburst and Treemap.
+
+    Args:
+        df_filtered: Filtered medal totals per country (with Continent column)
+        show_gold, show_silver, show_bronze: Medal types to include
+        df_medals: Optional medal fact table (with continent column); enables deeper drill-down paths
+        medals_version: Version of df_medals (see modules.data_loader.table_version); the
+            drill-down hierarchies are cached per version and filter state, and not
+            cached without one
+    """
     st.subheader("🌐 Medal Hierarchy by Continent")
-    st.markdown("*Drill down from Continent → Country → Medal Type*")
 
     if df_filtered.empty:
         st.info("No data available for the selected filters")
         return
 
-    # Prepare data for sunburst/treemap
-    hierarchy_data = []
-    for _, row in df_filtered.iterrows():
-        if show_gold and row['Gold Medal'] > 0:
-            hierarchy_data.append({
-                'Continent': row['Continent'],
-                'Country': row['country'],
-                'Medal_Type': 'Gold',
-                'Count': row['Gold Medal']
-            })
-        if show_silver and row['Silver Medal'] > 0:
-            hierarchy_data.append({
-                'Continent': row['Continent'],
-                'Country': row['country'],
-                'Medal_Type': 'Silver',
-                'Count': row['Silver Medal']
-            })
-        if show_bronze and row['Bronze Medal'] > 0:
-            hierarchy_data.append({
-                'Continent': row['Continent'],
-                'Country': row['country'],
-                'Medal_Type': 'Bronze',
-                'Count': row['Bronze Medal']
-            })
-
-    df_hierarchy = pd.DataFrame(hierarchy_data)
+    medal_columns = tuple(
+        medal for medal, shown in
+        [('Gold Medal', show_gold), ('Silver Medal', show_silver), ('Bronze Medal', show_bronze)]
+        if shown
+    )
+
+    if df_medals is not None:
+        path_label = st.selectbox("Drill-down path", list(HIERARCHY_PATHS.keys()), key="hierarchy_path")
+        path = [HIERARCHY_LABELS[col] for col in HIERARCHY_PATHS[path_label]]
+        filters = (tuple(df_filtered['country']), medal_columns, tuple(HIERARCHY_PATHS[path_label]))
+        if medals_version is not None:
+            df_hierarchy = _get_fact_hierarchy(df_medals, medals_version, *filters)
+        else:
+            df_hierarchy = _fact_hierarchy(df_medals, *filters)
+    else:
+        path_label = "Continent → Country → Medal Type"
+        path = ['Continent', 'Country', 'Medal_Type']
+        df_hierarchy = _get_totals_hierarchy(df_filtered, medal_columns)
+
+    st.markdown(f"*Drill down from {path_label}*")
 
     col1, col2 = st.columns(2)
 
     with col1:
         if not df_hierarchy.empty:
-            fig_sunburst = px.sunburst(
-                df_hierarchy,
-                path=['Continent', 'Country', 'Medal_Type'],
-                values='Count',
-                color='Medal_Type',
-                color_discrete_map={'Gold': '#FFD700', 'Silver': '#C0C0C0', 'Bronze': '#CD7F32'},
-                title='Sunburst: Continent → Country → Medal Type'
+            fig_sunburst = cached_figure(
+                "medal_hierarchy_sunburst",
+                lambda: create_hierarchy_chart(px.sunburst, df_hierarchy, path, path_label),
+                data=(df_hierarchy,),
+                path=path
             )
-            fig_sunburst.update_layout(height=500)
             st.plotly_chart(fig_sunburst, width='stretch')
         else:
             st.info("No data available for the selected filters")
 
     with col2:
         if not df_hierarchy.empty:
-            fig_treemap = px.treemap(
-                df_hierarchy,
-                path=['Continent', 'Country', 'Medal_Type'],
-                values='Count',
-                color='Medal_Type',
-                color_discrete_map={'Gold': '#FFD700', 'Silver': '#C0C0C0', 'Bronze': '#CD7F32'},
-                title='Treemap: Continent → Country → Medal Type'
+            fig_treemap = cached_figure(
+                "medal_hierarchy_treemap",
+                lambda: create_hierarchy_chart(px.treemap, df_hierarchy, path, path_label),
+                data=(df_hierarchy,),
+                path=path
             )
-            fig_treemap.update_layout(height=500)
             st.plotly_chart(fig_treemap, width='stretch')
         else:
             st.info("No data available for the selected filters")
@@ -3,10 +3,45 @@ Overview Medal Distribution Component
 Displays a pie chart of global medal distribution.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+def create_medal_distribution_pie(df_medal_dist: pd.DataFrame):
+    """Create the donut chart of medal counts by type."""
+    fig_pie = px.pie(
+        df_medal_dist, 
+        values='Count', 
+        names='Medal Type', 
+        hole=0.5,
+        color='Medal Type',
+        color_discrete_map={
+            'Gold Medal': '#FFD700',
+            'Silver Medal': '#C0C0C0',
+            'Bronze Medal': '#CD7F32'
+        }
+    )
+    # Professional Styling
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    fig_pie.update_layout(
+        template="plotly_white",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+        margin=dict(t=20, b=20, l=20, r=20)
+    )
+    return fig_pie
+
+
+@profiled()
 def render_overview_medal_distribution(filtered_medals: pd.DataFrame, selected_medal_types: list):
     """Render the Global Medal Distribution pie chart."""
     st.subheader("Global Medal Distribution")
@@ -17,26 +52,10 @@ def render_overview_medal_distribution(filtered_medals: pd.DataFrame, selected_m
         df_medal_dist = pd.DataFrame(list(medal_counts.items()), columns=['Medal Type', 'Count'])
         
         if df_medal_dist['Count'].sum() > 0:
-            fig_pie = px.pie(
-                df_medal_dist, 
-                values='Count', 
-                names='Medal Type', 
-                hole=0.5,
-                color='Medal Type',
-                color_discrete_map={
-                    'Gold Medal': '#FFD700',
-                    'Silver Medal': '#C0C0C0',
-                    'Bronze Medal': '#CD7F32'
-                }
-            )
-            # Professional Styling
-            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-            fig_pie.update_layout(
-                template="plotly_white",
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                showlegend=False,
-                margin=dict(t=20, b=20, l=20, r=20)
+            fig_pie = cached_figure(
+                "overview_medal_distribution",
+                lambda: create_medal_distribution_pie(df_medal_dist),
+                data=(df_medal_dist,)
             )
             st.plotly_chart(fig_pie, width='stretch')
         else:
@@ -4,8 +4,17 @@ Displays high-level KPIs for the dashboard.
 """
 import streamlit as st
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.editions import edition_label
+from modules.profiling import profiled
+
+
+@profiled()
 def render_overview_metrics(
     filtered_athletes: pd.DataFrame,
     filtered_nocs: pd.DataFrame,
@@ -14,8 +23,8 @@ def render_overview_metrics(
     selected_medal_types: list
 ):
     """Render the Overview Metrics section."""
-    st.title("🏅 Paris 2024 Olympic Games Overview")
-    st.caption("A high-level summary of the Paris 2024 Olympic Games.")
+    st.title(f"🏅 {edition_label()} Olympic Games Overview")
+    st.caption(f"A high-level summary of the {edition_label()} Olympic Games.")
     st.divider()
 
     # Calculate Metrics
@@ -1,51 +1,143 @@
 """
 Overview Top Standings Component
-Displays a horizontal bar chart of the top 10 medal standings.
+Displays a horizontal bar chart of the top 10 medal standings, and of the
+projected standings of the next Games.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import px
+
+
+def build_top_standings(filtered_medals: pd.DataFrame, selected_medal_types: list, top_n: int = 10) -> pd.DataFrame:
+    """
+    Rank countries by their total of the selected medal types.
+
+    Args:
+        filtered_medals: Medal totals per country (as in medals_total.csv)
+        selected_medal_types: Medal type columns to add up
+        top_n: Number of countries to keep
+
+    Returns:
+        DataFrame with country and 'Selected Total' columns, best first
+    """
+    # Recalculate 'Total' based on selected medal types for sorting
+    medal_columns = [m_type for m_type in selected_medal_types if m_type in filtered_medals.columns]
+    standings = filtered_medals[['country']].assign(
+        **{'Selected Total': filtered_medals[medal_columns].sum(axis=1) if medal_columns else 0}
+    )
+    return standings.sort_values(by='Selected Total', ascending=False).head(top_n)
+
+
+def create_top_standings_bar(top_10_medals: pd.DataFrame):
+    """Create the horizontal bar chart of the top 10 countries."""
+    fig_bar = px.bar(
+        top_10_medals,
+        x='Selected Total',
+        y='country',
+        orientation='h',
+        text='Selected Total',
+        labels={'Selected Total': 'Total Medals', 'country': ''},
+        color='Selected Total',
+        color_continuous_scale='Viridis'
+    )
+    # Professional Styling
+    fig_bar.update_layout(
+        template="plotly_white",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        yaxis={'categoryorder': 'total ascending'},
+        xaxis=dict(showgrid=False, showticklabels=False),
+        margin=dict(t=20, b=20, l=0, r=0),
+        coloraxis_showscale=False
+    )
+    fig_bar.update_traces(textposition='outside')
+    return fig_bar
+
+
+@profiled()
 def render_overview_top_standings(filtered_medals: pd.DataFrame, selected_medal_types: list):
     """Render the Top 10 Medal Standings bar chart."""
     st.subheader("Top 10 Medal Standings")
     
     if not filtered_medals.empty:
-        # Recalculate 'Total' based on selected medal types for sorting
-        filtered_medals['Selected Total'] = 0
-        for m_type in selected_medal_types:
-            if m_type in filtered_medals.columns:
-                filtered_medals['Selected Total'] += filtered_medals[m_type]
-        
-        # Sort and take top 10
-        top_10_medals = filtered_medals.sort_values(by='Selected Total', ascending=False).head(10)
-        
+        top_10_medals = build_top_standings(filtered_medals, selected_medal_types)
+
         if not top_10_medals.empty and top_10_medals['Selected Total'].sum() > 0:
-            fig_bar = px.bar(
-                top_10_medals,
-                x='Selected Total',
-                y='country',
-                orientation='h',
-                text='Selected Total',
-                labels={'Selected Total': 'Total Medals', 'country': ''},
-                color='Selected Total',
-                color_continuous_scale='Viridis'
+            fig_bar = cached_figure(
+                "overview_top_standings",
+                lambda: create_top_standings_bar(top_10_medals),
+                data=(top_10_medals,)
             )
-            # Professional Styling
-            fig_bar.update_layout(
-                template="plotly_white",
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
-                yaxis={'categoryorder': 'total ascending'},
-                xaxis=dict(showgrid=False, showticklabels=False),
-                margin=dict(t=20, b=20, l=0, r=0),
-                coloraxis_showscale=False
-            )
-            fig_bar.update_traces(textposition='outside')
-            
             st.plotly_chart(fig_bar, width='stretch')
         else:
             st.warning("No medals found for the current selection.")
     else:
         st.warning("No data available for Medal Standings.")
+
+
+def create_projected_standings_bar(top_projected: pd.DataFrame):
+    """Create the horizontal bar chart of projected totals with their intervals."""
+    fig_bar = px.bar(
+        top_projected,
+        x='Selected Total',
+        y='country',
+        orientation='h',
+        error_x=top_projected['Total high'] - top_projected['Selected Total'],
+        error_x_minus=top_projected['Selected Total'] - top_projected['Total low'],
+        hover_data={'Total low': ':.0f', 'Total high': ':.0f', 'P(top)': ':.1%'},
+        labels={'Selected Total': 'Projected Medals', 'country': '', 'P(top)': 'Tops the gold table'},
+        color='Selected Total',
+        color_continuous_scale='Viridis'
+    )
+    fig_bar.update_layout(
+        template="plotly_white",
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        yaxis={'categoryorder': 'total ascending'},
+        xaxis=dict(showgrid=False),
+        margin=dict(t=20, b=20, l=0, r=0),
+        coloraxis_showscale=False
+    )
+    return fig_bar
+
+
+@profiled()
+def render_projected_standings(projected: pd.DataFrame, selected_medal_types: list, selected_countries: list = None):
+    """
+    Render the projected Top 10 standings of the next Games.
+
+    Args:
+        projected: Projected medal table (see modules.data_loader.load_medal_projection)
+        selected_medal_types: Medal types counted in the projected totals
+        selected_countries: Countries to show (default: all)
+    """
+    st.subheader("Projected Top 10 for LA28")
+
+    if selected_countries:
+        projected = projected[projected['country'].isin(selected_countries)]
+    if projected.empty or not selected_medal_types:
+        st.warning("No projection available for the current selection.")
+        return
+
+    top_projected = build_top_standings(projected, selected_medal_types).join(
+        projected[['Total low', 'Total high', 'P(top)']]
+    )
+    fig_bar = cached_figure(
+        "projected_standings",
+        lambda: create_projected_standings_bar(top_projected),
+        data=(top_projected,)
+    )
+    st.plotly_chart(fig_bar, width='stretch')
+    st.caption(
+        "Monte-Carlo simulation of every event, with each participant's strength taken from their "
+        "finish at the last Games. Bars show the mean projected total of the selected medal types, "
+        "and whiskers show the 90% interval. Sport filters do not apply."
+    )
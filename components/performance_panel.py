@@ -0,0 +1,79 @@
+"""
+Performance Panel Component
+Opt-in sidebar panel with per-section timings, payload sizes and cache hits.
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.profiling import PROFILER, PROFILING_ENABLED
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+PANEL_COLUMNS = ["kind", "name", "wall_ms", "rows_in", "rows_out", "figure_bytes", "cache", "error"]
+
+
+def render_performance_panel():
+    """
+    Render the sidebar performance panel for the sections profiled in this run.
+
+    Call it last on a page, after every component (and deferred section) has
+    rendered. Shows the records of the current session since the previous
+    panel render, so fragment reruns in between are included as well.
+    """
+    if not PROFILING_ENABLED:
+        return
+
+    show_panel = st.sidebar.toggle("⏱️ Performance panel", value=False, key="perf_panel")
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    session_id = ctx.session_id if ctx else None
+    last_seq = st.session_state.get("_perf_last_seq", 0)
+    records = PROFILER.records(session_id=session_id, since=last_seq)
+    if records:
+        st.session_state["_perf_last_seq"] = max(r.seq for r in records)
+
+    if not show_panel:
+        return
+
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        if not records:
+            st.caption("No profiled sections in this run.")
+            return
+
+        df_records = pd.DataFrame([vars(r) for r in records])[PANEL_COLUMNS]
+        df_records = df_records.sort_values("wall_ms", ascending=False)
+
+        components = df_records[df_records["kind"] == "component"]
+        loaders = df_records[df_records["kind"] == "loader"]
+
+        col1, col2 = st.columns(2)
+        col1.metric("Components", f"{components['wall_ms'].sum():.0f} ms")
+        col2.metric("Loaders", f"{loaders['wall_ms'].sum():.0f} ms")
+        col1.metric("Figure payload", f"{df_records['figure_bytes'].sum() / 1024:.0f} KB")
+        col2.metric("Cache hits", f"{(loaders['cache'] == 'hit').sum()}/{len(loaders)}")
+
+        st.dataframe(
+            df_records.round({"wall_ms": 1}),
+            hide_index=True,
+            width='stretch'
+        )
+
+        st.download_button(
+            "Download JSON lines",
+            PROFILER.to_jsonl(records),
+            file_name="la28_profile.jsonl",
+            mime="application/x-ndjson",
+            key="perf_download_jsonl"
+        )
+        st.download_button(
+            "Download Prometheus metrics",
+            PROFILER.to_prometheus(),
+            file_name="la28_metrics.prom",
+            mime="text/plain",
+            key="perf_download_prometheus"
+        )
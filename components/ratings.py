@@ -0,0 +1,104 @@
+"""
+Ratings Component
+Elo strength ratings of the athletes, teams and countries of a head-to-head
+discipline, with the rating history of selected participants.
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.ratings import RatingEngine
+from modules.lazy_imports import px
+
+
+TOP_N = 10
+
+# Participants charted by default
+DEFAULT_CHARTED = 5
+
+
+def create_rating_history_chart(history: pd.DataFrame, discipline: str):
+    """Create the line chart of ratings after each match."""
+    fig = px.line(
+        history,
+        x="start",
+        y="rating",
+        color="participant_name",
+        markers=True,
+        hover_data={"stage_code": True},
+        labels={"start": "Match", "rating": "Rating", "participant_name": "", "stage_code": "Unit"},
+        title=f"{discipline}: rating history",
+    )
+    fig.update_layout(height=420, legend=dict(orientation="h", y=-0.2))
+    return fig
+
+
+@profiled()
+def render_ratings(engine: RatingEngine):
+    """
+    Render the head-to-head ratings of one discipline.
+
+    Args:
+        engine: Rating engine (see modules.data_loader.load_ratings)
+    """
+    st.header("📊 Head-to-Head Ratings")
+    st.markdown("Elo ratings from every head-to-head match of the Games, within each discipline.")
+
+    if not len(engine):
+        st.info("No head-to-head results available.")
+        return
+
+    disciplines = sorted(engine.disciplines)
+    col_discipline, col_view = st.columns(2)
+    discipline = col_discipline.selectbox(
+        "Discipline",
+        disciplines,
+        index=disciplines.index("Tennis") if "Tennis" in disciplines else 0,
+        key="ratings_discipline",
+    )
+    view = col_view.radio("Rate", ["Athletes & teams", "Countries"], horizontal=True, key="ratings_view")
+    ratings = engine[discipline]
+
+    if view == "Countries":
+        table = ratings.country_table().head(TOP_N)
+        st.dataframe(
+            table.rename(columns={"country": "Country", "rating": "Rating", "matches": "Matches"}).round({"Rating": 0}),
+            hide_index=True,
+            width='stretch',
+        )
+        return
+
+    table = ratings.participant_table()
+    st.dataframe(
+        table.head(TOP_N).drop(columns="participant_code").rename(columns={
+            "participant_name": "Athlete / Team", "country": "Country", "rating": "Rating", "matches": "Matches",
+        }).round({"Rating": 0}),
+        hide_index=True,
+        width='stretch',
+    )
+
+    names = table.set_index("participant_code")["participant_name"]
+    charted = st.multiselect(
+        "Rating history of",
+        names.index.tolist(),
+        default=names.index[:DEFAULT_CHARTED].tolist(),
+        format_func=names.get,
+        key="ratings_history",
+    )
+    if not charted:
+        return
+
+    history = ratings.history_frame(charted)
+    fig = cached_figure(
+        "rating_history",
+        lambda: create_rating_history_chart(history, discipline),
+        data=(history,),
+        discipline=discipline
+    )
+    st.plotly_chart(fig, width='stretch')
@@ -4,8 +4,16 @@ Displays summary metrics for the filtered data.
 """
 import streamlit as st
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.profiling import profiled
+
+
+@profiled()
 def render_summary_statistics(df_filtered: pd.DataFrame):
     """Render the Summary Statistics section."""
     st.subheader("📈 Summary Statistics")
@@ -3,22 +3,20 @@ Top Countries Medals Component
 Displays a bar chart of the top 20 countries by medal count.
 """
 import streamlit as st
-import plotly.graph_objects as go
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-def render_top_countries_medals(df_filtered: pd.DataFrame):
-    """Render the Top 20 Countries vs. Medals section."""
-    st.subheader("🏆 Top 20 Countries vs. Medals")
-    st.markdown("*Leading nations in the medal race*")
+from modules.figure_cache import cached_figure
+from modules.profiling import profiled
+from modules.lazy_imports import go
 
-    if df_filtered.empty:
-        st.info("No data available for the selected filters")
-        return
-
-    # Get top 20 countries by total medals
-    top20 = df_filtered.nlargest(20, 'Filtered_Total')
 
+def create_top_countries_bar(top20: pd.DataFrame):
+    """Create the grouped bar chart of the top 20 countries."""
     fig_top20 = go.Figure()
     fig_top20.add_trace(go.Bar(
         name='Gold',
@@ -51,4 +49,38 @@ def render_top_countries_medals(df_filtered: pd.DataFrame):
         hovermode='y unified',
         yaxis={'categoryorder': 'total ascending'}
     )
+    return fig_top20
+
+
+@profiled()
+def prepare_top_countries_medals(df_filtered: pd.DataFrame):
+    """
+    Pick the top 20 countries and build the chart (no Streamlit elements).
+
+    Returns:
+        The figure, or None when no data matches the filters
+    """
+    if df_filtered.empty:
+        return None
+
+    # Get top 20 countries by total medals
+    top20 = df_filtered.nlargest(20, 'Filtered_Total')
+
+    return cached_figure(
+        "top_countries_medals",
+        lambda: create_top_countries_bar(top20),
+        data=(top20[['country', 'Gold Medal', 'Silver Medal', 'Bronze Medal']],)
+    )
+
+
+@profiled()
+def render_top_countries_medals(fig_top20):
+    """Render the Top 20 Countries vs. Medals section (see prepare_top_countries_medals)."""
+    st.subheader("🏆 Top 20 Countries vs. Medals")
+    st.markdown("*Leading nations in the medal race*")
+
+    if fig_top20 is None:
+        st.info("No data available for the selected filters")
+        return
+
     st.plotly_chart(fig_top20, width='stretch')
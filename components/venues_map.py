@@ -3,7 +3,6 @@ Venues Map Component
 Displays an interactive 2D map of Olympic venues.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
 import sys
 import os
@@ -11,52 +10,83 @@ import os
 # Add parent directory to path for module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.figure_cache import cached_figure
+from modules.editions import edition_label
 from modules.venue_geocoder import add_coordinates_to_venues, get_venue_type_colors
+from modules.profiling import profiled
+from modules.lazy_imports import px
 
 
-def render_venues_map(df_venues: pd.DataFrame):
-    """Render the Olympic Venues Map section."""
-    st.header("🗺️ Olympic Venues Map")
-    st.markdown("Explore the locations of Olympic venues across Paris and beyond.")
+def create_venues_map(map_data: pd.DataFrame, venue_colors: dict):
+    """Create the scatter map of venue locations."""
+    # Create 2D scatter map with Plotly
+    fig_venues = px.scatter_mapbox(
+        map_data,
+        lat="latitude",
+        lon="longitude",
+        color="venue_type",
+        color_discrete_map=venue_colors,
+        hover_name="venue",
+        hover_data={"venue_type": True, "sports": True, "latitude": False, "longitude": False},
+        zoom=9,
+        center={"lat": 48.8566, "lon": 2.3522},  # Paris center
+        height=600,
+        title=f"{edition_label()} Olympic Venues",
+    )
+    
+    fig_venues.update_layout(
+        mapbox_style="carto-positron",
+        margin={"r": 0, "t": 40, "l": 0, "b": 0},
+        legend_title_text="Venue Type",
+    )
+    
+    fig_venues.update_traces(marker=dict(size=14))
+    return fig_venues
+
 
-    # Add coordinates dynamically using geocoding
-    df_venues_with_coords = add_coordinates_to_venues(df_venues)
+@profiled()
+def prepare_venues_map(df_venues: pd.DataFrame) -> tuple:
+    """
+    Geocode the venues and build the map (no Streamlit elements).
+
+    Returns:
+        (figure, venues with coordinates); (None, empty frame) when no
+        venue could be located
+    """
+    # Add coordinates dynamically using geocoding; the section's placeholder stands in for the spinner
+    df_venues_with_coords = add_coordinates_to_venues(df_venues, show_spinner=False)
     map_data = df_venues_with_coords.dropna(subset=["latitude", "longitude"])
+    if map_data.empty:
+        return None, map_data
+
+    # Get venue type colors
+    venue_colors = get_venue_type_colors()
 
-    if not map_data.empty:
-        # Get venue type colors
+    # Create hover text
+    map_data = map_data.copy()
+    map_data["hover_text"] = map_data.apply(
+        lambda row: f"<b>{row['venue']}</b><br>Type: {row['venue_type']}<br>Sports: {row.get('sports', 'N/A')}",
+        axis=1
+    )
+
+    fig_venues = cached_figure(
+        "venues_map",
+        lambda: create_venues_map(map_data, venue_colors),
+        data=(map_data.drop(columns=["color_rgb"], errors="ignore"),)
+    )
+    return fig_venues, map_data
+
+
+@profiled()
+def render_venues_map(prepared: tuple):
+    """Render the Olympic Venues Map section (see prepare_venues_map)."""
+    fig_venues, map_data = prepared
+    st.header("🗺️ Olympic Venues Map")
+    st.markdown("Explore the locations of Olympic venues across Paris and beyond.")
+
+    if fig_venues is not None:
         venue_colors = get_venue_type_colors()
-        
-        # Create hover text
-        map_data = map_data.copy()
-        map_data["hover_text"] = map_data.apply(
-            lambda row: f"<b>{row['venue']}</b><br>Type: {row['venue_type']}<br>Sports: {row.get('sports', 'N/A')}",
-            axis=1
-        )
-        
-        # Create 2D scatter map with Plotly
-        fig_venues = px.scatter_mapbox(
-            map_data,
-            lat="latitude",
-            lon="longitude",
-            color="venue_type",
-            color_discrete_map=venue_colors,
-            hover_name="venue",
-            hover_data={"venue_type": True, "sports": True, "latitude": False, "longitude": False},
-            zoom=9,
-            center={"lat": 48.8566, "lon": 2.3522},  # Paris center
-            height=600,
-            title="Paris 2024 Olympic Venues",
-        )
-        
-        fig_venues.update_layout(
-            mapbox_style="carto-positron",
-            margin={"r": 0, "t": 40, "l": 0, "b": 0},
-            legend_title_text="Venue Type",
-        )
-        
-        fig_venues.update_traces(marker=dict(size=14))
-        
+
         st.plotly_chart(fig_venues, width='stretch')
         
         # Legend
@@ -5,11 +5,19 @@ YouTube search integration for Olympic highlights.
 import streamlit as st
 import pandas as pd
 import urllib.parse
+import sys
+import os
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.editions import edition_label
+from modules.profiling import profiled
 
 
 def generate_youtube_search_url(sport: str, event: str = None, country: str = None) -> str:
     """Generate a YouTube search URL for Olympic highlights."""
-    query_parts = ["Paris 2024 Olympics", sport]
+    query_parts = [f"{edition_label()} Olympics", sport]
     if event:
         query_parts.append(event)
     if country:
@@ -21,10 +29,11 @@ def generate_youtube_search_url(sport: str, event: str = None, country: str = No
     return f"https://www.youtube.com/results?search_query={encoded_query}"
 
 
+@profiled()
 def render_watch_highlights(df_schedule: pd.DataFrame, df_medals: pd.DataFrame):
     """Render the Watch Highlights section with YouTube search integration."""
     st.header("📺 Watch Highlights")
-    st.markdown("Search for Paris 2024 Olympic highlights on YouTube!")
+    st.markdown(f"Search for {edition_label()} Olympic highlights on YouTube!")
 
     col_yt1, col_yt2, col_yt3 = st.columns(3)
 
@@ -66,7 +75,7 @@ def render_watch_highlights(df_schedule: pd.DataFrame, df_medals: pd.DataFrame):
     )
 
     # Display search preview
-    search_terms = f"Paris 2024 Olympics {selected_sport_yt}"
+    search_terms = f"{edition_label()} Olympics {selected_sport_yt}"
     if event_for_search:
         search_terms += f" {event_for_search}"
     if country_for_search:
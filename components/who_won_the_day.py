@@ -1,74 +1,170 @@
 """
 Who Won the Day Component
-Shows medals and events for a specific day of the Games.
+Shows medals and events for a specific day of the Games, plus the medal race.
 """
 import streamlit as st
-import plotly.express as px
 import pandas as pd
+import sys
+import os
 
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.figure_cache import cached_figure
+from modules.medal_timeline import MedalTimeline, MEDAL_COLORS, build_medal_race_frames
+from modules.profiling import profiled
+from modules.lazy_imports import px, go
+
+
+def create_medal_race_chart(frames: list, medal_types: list):
+    """Create an animated stacked bar chart of the cumulative medal standings."""
+
+    def frame_traces(countries, counts):
+        return [
+            go.Bar(
+                y=list(countries),
+                x=counts[:, m].tolist(),
+                orientation='h',
+                name=medal_type,
+                marker_color=MEDAL_COLORS[medal_type],
+            )
+            for m, medal_type in enumerate(medal_types)
+        ]
+
+    labels = [day.strftime("%b %d") for day, _, _ in frames]
+    max_total = max((int(counts.sum(axis=1).max()) for _, _, counts in frames if len(counts)), default=0)
+
+    fig = go.Figure(
+        data=frame_traces(*frames[-1][1:]),
+        frames=[
+            go.Frame(data=frame_traces(countries, counts), name=label)
+            for label, (_, countries, counts) in zip(labels, frames)
+        ],
+    )
+    fig.update_layout(
+        barmode='stack',
+        height=500,
+        title="Cumulative medal standings",
+        xaxis=dict(range=[0, max(max_total, 1) * 1.05], title="Medals"),
+        yaxis=dict(autorange="reversed"),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        updatemenus=[dict(
+            type="buttons",
+            showactive=False,
+            x=0, y=-0.15, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="▶ Play", method="animate",
+                     args=[None, {"frame": {"duration": 600, "redraw": True}, "fromcurrent": True}]),
+                dict(label="⏸ Pause", method="animate",
+                     args=[[None], {"frame": {"duration": 0, "redraw": False}, "mode": "immediate"}]),
+            ],
+        )],
+        sliders=[dict(
+            active=len(labels) - 1,
+            x=0.15, len=0.85, y=-0.1,
+            steps=[
+                dict(label=label, method="animate",
+                     args=[[label], {"frame": {"duration": 0, "redraw": True}, "mode": "immediate"}])
+                for label in labels
+            ],
+        )],
+    )
+    return fig
 
-def render_who_won_the_day(df_medals: pd.DataFrame, df_schedule: pd.DataFrame):
-    """Render the Who Won the Day section with daily medal and event breakdown."""
-    st.header("🏅 Who Won the Day?")
 
-    df_medals = df_medals.copy()
-    df_schedule = df_schedule.copy()
-    
-    df_medals["medal_day"] = pd.to_datetime(df_medals["medal_date"]).dt.date
-    df_schedule["day"] = pd.to_datetime(df_schedule["start_date"]).dt.date
-
-    all_days = sorted(df_medals["medal_day"].dropna().unique())
-    selected_day = st.slider(
-        "Select a day of the Games",
-        min_value=min(all_days),
-        max_value=max(all_days),
-        value=min(all_days),
-        format="YYYY-MM-DD",
+def create_day_medals_chart(medal_table: pd.DataFrame, selected_day):
+    """Create the bar chart of medals won per country on one day."""
+    fig_day = px.bar(
+        medal_table,
+        x="country",
+        y="count",
+        color="medal_type",
+        title=f"Medals by country on {selected_day}",
+        text_auto=True,
+        color_discrete_map=MEDAL_COLORS,
     )
+    fig_day.update_layout(xaxis={"categoryorder": "total descending"})
+    return fig_day
 
-    day_medals = df_medals[df_medals["medal_day"] == selected_day]
-
-    st.subheader(f"Medals awarded on {selected_day}")
-    if day_medals.empty:
-        st.info("No medals recorded for this day.")
-    else:
-        medal_table = (
-            day_medals
-            .groupby(["country", "medal_type"])
-            .size()
-            .reset_index(name="count")
-        )
-        fig_day = px.bar(
-            medal_table,
-            x="country",
-            y="count",
-            color="medal_type",
-            title=f"Medals by country on {selected_day}",
-            text_auto=True,
-            color_discrete_map={
-                "Gold Medal": "gold",
-                "Silver Medal": "silver",
-                "Bronze Medal": "#cd7f32",
-            },
+
+def create_day_events_timeline(day_events: pd.DataFrame, selected_day):
+    """Create the timeline of events scheduled on one day."""
+    fig_day_timeline = px.timeline(
+        day_events,
+        x_start="start_date",
+        x_end="end_date",
+        y="event",
+        color="discipline",
+        hover_data=["venue", "phase", "status", "gender"],
+        title=f"Event timeline on {selected_day}",
+        height=600,
+    )
+    fig_day_timeline.update_yaxes(autorange="reversed")
+    return fig_day_timeline
+
+
+@profiled()
+def render_who_won_the_day(timeline: MedalTimeline, df_schedule: pd.DataFrame, schedule_day_index: dict):
+    """
+    Render the Who Won the Day section with daily medal and event breakdown.
+
+    Args:
+        timeline: Precomputed medal timeline (see modules.medal_timeline)
+        df_schedule: Schedule data
+        schedule_day_index: Mapping of each day to its schedule row positions
+    """
+    st.header("🏅 Who Won the Day?")
+
+    if not timeline.days:
+        st.info("No medals have been awarded yet.")
+        return
+
+    tab_day, tab_race = st.tabs(["📅 Day by Day", "🏁 Medal Race"])
+
+    with tab_race:
+        # Frames are built once per timeline version
+        fig_race = cached_figure(
+            "medal_race",
+            lambda: create_medal_race_chart(build_medal_race_frames(timeline, 10), timeline.medal_types),
+            data=(timeline,),
+            top_n=10
         )
-        fig_day.update_layout(xaxis={"categoryorder": "total descending"})
-        st.plotly_chart(fig_day, width='stretch')
-
-    st.subheader(f"Key events on {selected_day}")
-    day_events = df_schedule[df_schedule["day"] == selected_day]
-
-    if day_events.empty:
-        st.info("No events scheduled for this day.")
-    else:
-        fig_day_timeline = px.timeline(
-            day_events,
-            x_start="start_date",
-            x_end="end_date",
-            y="event",
-            color="discipline",
-            hover_data=["venue", "phase", "status", "gender"],
-            title=f"Event timeline on {selected_day}",
-            height=600,
+        st.plotly_chart(fig_race, width='stretch')
+
+    with tab_day:
+        selected_day = st.slider(
+            "Select a day of the Games",
+            min_value=timeline.days[0],
+            max_value=timeline.days[-1],
+            value=timeline.days[0],
+            format="YYYY-MM-DD",
         )
-        fig_day_timeline.update_yaxes(autorange="reversed")
-        st.plotly_chart(fig_day_timeline, width='stretch')
+
+        medal_table = timeline.day_frame(selected_day)
+
+        st.subheader(f"Medals awarded on {selected_day}")
+        if medal_table.empty:
+            st.info("No medals recorded for this day.")
+        else:
+            fig_day = cached_figure(
+                "who_won_the_day",
+                lambda: create_day_medals_chart(medal_table, selected_day),
+                data=(medal_table,),
+                day=selected_day
+            )
+            st.plotly_chart(fig_day, width='stretch')
+
+        st.subheader(f"Key events on {selected_day}")
+        day_rows = schedule_day_index.get(selected_day)
+
+        if day_rows is None or len(day_rows) == 0:
+            st.info("No events scheduled for this day.")
+        else:
+            day_events = df_schedule.iloc[day_rows]
+            fig_day_timeline = cached_figure(
+                "who_won_the_day_events",
+                lambda: create_day_events_timeline(day_events, selected_day),
+                data=(day_events,),
+                day=selected_day
+            )
+            st.plotly_chart(fig_day_timeline, width='stretch')
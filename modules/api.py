@@ -0,0 +1,375 @@
+"""
+Local JSON API for the dashboard's computed datasets.
+Serves the medal standings, global medal distribution, day-by-day medals and
+country summaries that the dashboard charts are built from, for other
+consumers such as signage screens. It uses the same aggregation functions as
+the components and reads the same hot-reloaded data snapshot. Each response
+is computed once per snapshot version and parameter set, and shared by every
+client. Responses carry an ETag (answered with 304 Not Modified on a
+matching If-None-Match) and are gzip-compressed for clients that accept it;
+the gzipped variant has its own ETag.
+
+Usage:
+    python -m modules.api --port 8502                      # serve on 127.0.0.1:8502
+    curl localhost:8502/api/overview_top_standings?medal_types=Gold%20Medal&limit=5
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+if __name__ == "__main__":
+    from streamlit.logger import set_log_level
+
+    # The API serves the data outside a script run; silence the bare-mode warnings
+    set_log_level("error")
+
+import pandas as pd
+
+from components.global_medal_distribution import build_continent_medal_counts, build_world_map_pivot, filter_medal_types
+from components.overview_top_standings import build_top_standings
+from modules import data_loader
+from modules.helpers import get_continent
+from modules.medal_timeline import MEDAL_TYPES
+from modules.profiling import PROFILER
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.environ.get("LA28_API_PORT", "8502"))
+
+# Responses kept in memory (a few per dataset and snapshot version)
+MAX_CACHED_RESPONSES = 256
+
+# Smaller bodies are sent uncompressed
+GZIP_MIN_BYTES = 512
+
+SCHEDULE_COLUMNS = ["start_date", "end_date", "discipline", "event", "venue", "phase", "status", "gender"]
+
+
+class BadRequest(ValueError):
+    """Invalid query parameters; answered with 400."""
+
+
+# -------------------------------------------------------
+# Datasets
+# -------------------------------------------------------
+
+def _records(df: pd.DataFrame) -> list:
+    """JSON-ready list of row dicts (NaN as null, dates in ISO format)."""
+    return json.loads(df.to_json(orient="records", date_format="iso"))
+
+
+def _list_param(params: dict, name: str, default: list = None) -> list:
+    """Comma-separated (or repeated) parameter as a list."""
+    values = [v for raw in params.get(name, []) for v in raw.split(",") if v]
+    return values or list(default or [])
+
+
+def _int_param(params: dict, name: str, default: int) -> int:
+    raw = params.get(name)
+    if not raw:
+        return default
+    try:
+        value = int(raw[-1])
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+    if value < 1:
+        raise BadRequest(f"{name} must be positive")
+    return value
+
+
+def _medal_types(params: dict) -> list:
+    medal_types = _list_param(params, "medal_types", MEDAL_TYPES)
+    unknown = sorted(set(medal_types) - set(MEDAL_TYPES))
+    if unknown:
+        raise BadRequest(f"unknown medal types: {', '.join(unknown)}")
+    return medal_types
+
+
+def overview_top_standings(tables, params: dict) -> dict:
+    """Countries ranked by their total of the selected medal types (Overview page)."""
+    medal_types = _medal_types(params)
+    countries = _list_param(params, "countries")
+    df = tables["medals_total"]
+    if countries:
+        df = df[df["country"].isin(countries)]
+    standings = build_top_standings(df, medal_types, top_n=_int_param(params, "limit", 10))
+    return {"medal_types": medal_types, "standings": _records(standings)}
+
+
+def global_medal_distribution(tables, params: dict) -> dict:
+    """Medal counts per country for the world map, and per country of one continent."""
+    medal_types = _medal_types(params)
+    continent = (params.get("continent") or [None])[-1]
+    df_medals = tables["medals"].assign(continent=lambda df: df["country"].map(get_continent))
+    medal_analysis_df = filter_medal_types(df_medals, medal_types)
+    result = {
+        "medal_types": medal_types,
+        "countries": _records(build_world_map_pivot(medal_analysis_df, medal_types)) if not medal_analysis_df.empty else [],
+    }
+    if continent:
+        result["continent"] = continent
+        result["continent_countries"] = _records(build_continent_medal_counts(medal_analysis_df, continent))
+    return result
+
+
+def who_won_the_day(tables, params: dict) -> dict:
+    """Medals won per country and events scheduled on one day (default: the latest medal day)."""
+    timeline = tables["medal_timeline"]
+    if not timeline.days:
+        raise BadRequest("no medals have been awarded yet")
+    raw_day = (params.get("day") or [None])[-1]
+    try:
+        day = date.fromisoformat(raw_day) if raw_day else timeline.days[-1]
+    except ValueError:
+        raise BadRequest("day must be a date (YYYY-MM-DD)")
+    if not timeline.days[0] <= day <= timeline.days[-1]:
+        raise BadRequest(f"day must be between {timeline.days[0]} and {timeline.days[-1]}")
+
+    day_rows = tables["schedule_day_index"].get(day)
+    schedule = tables["schedule"]
+    events = schedule.iloc[day_rows] if day_rows is not None else schedule.iloc[:0]
+    return {
+        "day": day.isoformat(),
+        "days": [timeline.days[0].isoformat(), timeline.days[-1].isoformat()],
+        "medals": _records(timeline.day_frame(day)),
+        "cumulative": _records(timeline.day_frame(day, cumulative=True)),
+        "events": _records(events[[c for c in SCHEDULE_COLUMNS if c in events.columns]]),
+    }
+
+
+def country_summary(tables, params: dict) -> dict:
+    """Per-country medal summary (Head-to-Head table), optionally for some countries only."""
+    table = tables["country_summary"]
+    countries = _list_param(params, "countries")
+    if countries:
+        unknown = sorted(set(countries) - set(table.index))
+        if unknown:
+            raise BadRequest(f"unknown countries: {', '.join(unknown)}")
+        table = table.loc[countries]
+    return {"countries": _records(table.reset_index())}
+
+
+DATASETS = {
+    "overview_top_standings": overview_top_standings,
+    "global_medal_distribution": global_medal_distribution,
+    "who_won_the_day": who_won_the_day,
+    "country_summary": country_summary,
+}
+
+
+# -------------------------------------------------------
+# Response cache
+# -------------------------------------------------------
+
+@dataclass(frozen=True)
+class Response:
+    """An encoded JSON response, shared by every client asking for it."""
+    body: bytes
+    gzipped: bytes
+    etag: str
+
+    @property
+    def gzip_etag(self) -> str:
+        """Strong ETag of the gzipped body; it differs from the identity body's."""
+        return self.etag[:-1] + '-gz"'
+
+
+def encode_response(payload: dict) -> Response:
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    gzipped = gzip.compress(body, compresslevel=6) if len(body) >= GZIP_MIN_BYTES else None
+    return Response(body, gzipped, '"' + hashlib.md5(body).hexdigest() + '"')
+
+
+class ResponseCache:
+    """
+    LRU cache of encoded responses keyed by dataset, parameters and snapshot version.
+
+    Concurrent requests for the same key wait for the first one to compute
+    it instead of computing it again.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_RESPONSES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: tuple, compute) -> Response:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self.hits += 1
+                    return self._entries[key]
+            try:
+                response = compute()
+                with self._lock:
+                    self.misses += 1
+                    self._entries[key] = response
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            finally:
+                # Also when compute raises (e.g. BadRequest), so failed keys do not pile up
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        return response
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+RESPONSES = ResponseCache()
+
+
+def get_dataset(name: str, params: dict) -> Response:
+    """
+    Return the encoded response of a dataset for the current data snapshot.
+
+    Args:
+        name: Dataset name (a key of DATASETS)
+        params: Query parameters as parsed by urllib.parse.parse_qs
+
+    Returns:
+        Response
+
+    Raises:
+        KeyError: Unknown dataset
+        BadRequest: Invalid parameters
+    """
+    build = DATASETS[name]
+    snapshot = data_loader.SNAPSHOTS.current()
+    key = (name, tuple(sorted((k, tuple(v)) for k, v in params.items())), snapshot.version)
+
+    def compute():
+        payload = build(snapshot.tables, params)
+        return encode_response({"dataset": name, "version": snapshot.version, **payload})
+
+    return RESPONSES.get_or_compute(key, compute)
+
+
+# -------------------------------------------------------
+# HTTP server
+# -------------------------------------------------------
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    """Routes GET requests to the datasets, /health and /metrics."""
+
+    server_version = "LA28API/1.0"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = parse_qs(url.query)
+        path = url.path.rstrip("/")
+
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "snapshot": data_loader.SNAPSHOTS.status(), "responses": RESPONSES.status()})
+        elif path == "/metrics":
+            self._send(200, PROFILER.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+        elif path in ("", "/api"):
+            self._send_json(200, {"datasets": {name: fn.__doc__ for name, fn in DATASETS.items()}})
+        elif path.startswith("/api/"):
+            self._serve_dataset(path[len("/api/"):], params)
+        else:
+            self._send_json(404, {"error": f"not found: {url.path}"})
+
+    def _serve_dataset(self, name: str, params: dict):
+        try:
+            response = get_dataset(name, params)
+        except KeyError:
+            self._send_json(404, {"error": f"unknown dataset: {name}"})
+            return
+        except BadRequest as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except FileNotFoundError as e:
+            # A data file the dataset needs is missing; the other datasets are still served
+            self._send_json(503, {"error": str(e)})
+            return
+
+        gzipped = response.gzipped is not None and "gzip" in self.headers.get("Accept-Encoding", "")
+        etag = response.gzip_etag if gzipped else response.etag
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self._send(304, b"", None, headers)
+            return
+        if gzipped:
+            headers["Content-Encoding"] = "gzip"
+            self._send(200, response.gzipped, "application/json", headers)
+        else:
+            self._send(200, response.body, "application/json", headers)
+
+    def _send_json(self, status: int, payload: dict):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Request logging is left to the proxy in front of the API
+        pass
+
+
+def make_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """Create the API server (port 0 picks a free port); call serve_forever() to run it."""
+    server = ThreadingHTTPServer((host, port), APIRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Serve the dashboard datasets as a local JSON API.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"Serving {', '.join(DATASETS)} on http://{args.host}:{server.server_address[1]}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+Offline benchmark suite for the dashboard's data-preparation paths.
+Runs each component's data prep headless (no Streamlit UI) at several scale
+factors of the shipped CSVs (scaled by modules.synthetic), reports latency percentiles and peak memory,
+and compares the results against a stored baseline.
+
+Usage:
+    python -m modules.benchmark                      # 1x, 10x, 100x
+    python -m modules.benchmark --scales 1 10 --repeat 5
+    python -m modules.benchmark --save-baseline      # record a new baseline
+    python -m modules.benchmark --require-baseline   # also fail without a baseline (default when CI is set)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from streamlit.logger import set_log_level
+
+# Headless run: silence the "No runtime found" warnings of st.cache_data
+set_log_level("error")
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import utils
+from modules.data_loader import read_data_file
+from modules.helpers import (
+    get_continent,
+    build_country_summary_table,
+    country_summary,
+    build_medal_hierarchy,
+    build_hierarchy_from_medals,
+)
+from modules.leaderboard import build_leaderboard
+from modules.medal_timeline import build_medal_timeline, build_schedule_day_index
+from modules.synthetic import SCALED_FILES, generate_datasets
+from modules.venue_geocoder import match_fallback_coords, get_venue_type
+
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEAT = 7
+DEFAULT_TOLERANCE = 0.25  # allowed slowdown / memory growth before a case fails
+DEFAULT_BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "baseline.json"
+)
+
+# CSV files the benchmark cases read, by dataset name
+DATASET_FILES = {
+    "athletes": "athletes.csv",
+    "medallists": "medallists.csv",
+    "medals": "medals.csv",
+    "medals_total": "medals_total.csv",
+    "schedules": "schedules.csv",
+    "events": "events.csv",
+    "nocs": "nocs.csv",
+    "venues": "venues.csv",
+}
+
+
+# -------------------------------------------------------
+# Data
+# -------------------------------------------------------
+
+def load_datasets() -> dict:
+    """Read every available benchmark dataset from the data folder (missing files are skipped)."""
+    datasets = {}
+    for name, filename in DATASET_FILES.items():
+        try:
+            datasets[name] = read_data_file(filename)
+        except FileNotFoundError:
+            continue
+    if "schedules" in datasets:
+        for col in ["start_date", "end_date"]:
+            datasets["schedules"][col] = pd.to_datetime(datasets["schedules"][col])
+    return datasets
+
+
+def scale_datasets(datasets: dict, factor: int) -> dict:
+    """Scale the fact tables with the synthetic generator; other tables are kept as-is."""
+    if factor <= 1:
+        return datasets
+    sources = {name: df for name, df in datasets.items() if name in SCALED_FILES}
+    return {**datasets, **generate_datasets(sources, factor)}
+
+
+# -------------------------------------------------------
+# Cases
+# -------------------------------------------------------
+
+def _top_values(series: pd.Series, n: int) -> list:
+    return series.value_counts().index[:n].tolist()
+
+
+def bench_filter_data(data: dict):
+    """Overview filtering of athletes, NOCs, events and medal totals."""
+    countries = _top_values(data["athletes"]["country"], 5)
+    sports = data["events"]["sport"].drop_duplicates().tolist()[:3]
+    utils.filter_data(data["athletes"], data["nocs"], data["events"], data["medals_total"], countries, sports)
+
+
+def bench_country_summary(data: dict):
+    """Per-country summary table plus one head-to-head lookup."""
+    build_country_summary_table(data["medals"])
+    country_summary(data["medals"], _top_values(data["medals"]["country"], 1)[0])
+
+
+def bench_medal_hierarchy(data: dict):
+    """Totals hierarchy and the deepest fact-table drill-down path."""
+    df_totals = data["medals_total"].assign(Continent=data["medals_total"]["country"].map(get_continent))
+    build_medal_hierarchy(df_totals, ["Gold Medal", "Silver Medal", "Bronze Medal"])
+    df_medals = data["medals"].assign(continent=data["medals"]["country"].map(get_continent))
+    build_hierarchy_from_medals(
+        df_medals,
+        ["continent", "country", "discipline", "event", "medal_type"],
+        ["Gold Medal", "Silver Medal", "Bronze Medal"]
+    )
+
+
+def bench_top_athletes(data: dict):
+    """Leaderboard build plus a filtered and a grouped top-k query."""
+    leaderboard = build_leaderboard(data["medallists"])
+    leaderboard.top_k(10, countries=_top_values(data["medallists"]["country"], 3))
+    leaderboard.top_k_by("discipline", 3)
+
+
+def bench_schedule_slicing(data: dict):
+    """Day index build, sport/venue filtering and a per-day slice."""
+    df_schedule = data["schedules"]
+    day_index = build_schedule_day_index(df_schedule)
+    sports = _top_values(df_schedule["discipline"], 3)
+    filtered = df_schedule[df_schedule["discipline"].isin(sports)]
+    filtered = filtered[filtered["venue"].isin(filtered["venue"].drop_duplicates().tolist()[:5])]
+    first_day = next(iter(day_index))
+    df_schedule.iloc[day_index[first_day]].sort_values("start_date")
+
+
+def bench_medal_timeline(data: dict):
+    """Day × country × medal type timeline build."""
+    build_medal_timeline(data["medals"])
+
+
+def bench_continent_mapping(data: dict):
+    """Continent lookup over every medal and athlete row, as the pages apply it."""
+    data["medals"]["country"].apply(get_continent)
+    if "athletes" in data:
+        data["athletes"]["country"].apply(get_continent)
+
+
+def bench_geocoder_matching(data: dict):
+    """Fallback coordinate and venue type matching for every scheduled venue."""
+    venues = data["schedules"]["venue"].dropna()
+    venues.map(match_fallback_coords)
+    venues.map(get_venue_type)
+
+
+# Case name -> (function, datasets it needs)
+BENCHMARK_CASES = {
+    "filter_data": (bench_filter_data, ["athletes", "nocs", "events", "medals_total"]),
+    "country_summary": (bench_country_summary, ["medals"]),
+    "medal_hierarchy": (bench_medal_hierarchy, ["medals_total", "medals"]),
+    "top_athletes": (bench_top_athletes, ["medallists"]),
+    "schedule_slicing": (bench_schedule_slicing, ["schedules"]),
+    "medal_timeline": (bench_medal_timeline, ["medals"]),
+    "continent_mapping": (bench_continent_mapping, ["medals"]),
+    "geocoder_matching": (bench_geocoder_matching, ["schedules"]),
+}
+
+
+# -------------------------------------------------------
+# Runner
+# -------------------------------------------------------
+
+def measure(fn: Callable, data: dict, repeat: int) -> dict:
+    """
+    Time fn(data) `repeat` times after one warm-up call, then measure its peak memory.
+
+    Returns:
+        Dictionary with p50/p95/p99/mean latency (ms) and peak traced memory (MB)
+    """
+    fn(data)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(data)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    # Separate traced run: tracemalloc slows allocations down, so it is not timed
+    tracemalloc.start()
+    try:
+        fn(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    return {
+        "p50_ms": round(float(p50), 3),
+        "p95_ms": round(float(p95), 3),
+        "p99_ms": round(float(p99), 3),
+        "mean_ms": round(float(np.mean(timings)), 3),
+        "peak_mb": round(peak / 1024 ** 2, 3),
+    }
+
+
+def run_benchmarks(scales: list = DEFAULT_SCALES, repeat: int = DEFAULT_REPEAT, cases: list = None) -> pd.DataFrame:
+    """
+    Run every benchmark case at every scale factor.
+
+    Args:
+        scales: Scale factors of the shipped CSVs
+        repeat: Timed repetitions per case and scale
+        cases: Optional subset of BENCHMARK_CASES names
+
+    Returns:
+        DataFrame with one row per (case, scale); cases whose inputs are missing are skipped
+    """
+    base = load_datasets()
+    selected = {name: case for name, case in BENCHMARK_CASES.items() if not cases or name in cases}
+
+    rows = []
+    for scale in scales:
+        data = scale_datasets(base, scale)
+        for name, (fn, needs) in selected.items():
+            missing = [dataset for dataset in needs if dataset not in data]
+            if missing:
+                print(f"skip {name}@{scale}x: missing {', '.join(missing)}", file=sys.stderr)
+                continue
+            rows.append({"case": name, "scale": scale, **measure(fn, data, repeat)})
+    return pd.DataFrame(rows)
+
+
+def compare_to_baseline(results: pd.DataFrame, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> pd.DataFrame:
+    """
+    Compare p50 latency and peak memory against a baseline.
+
+    Args:
+        results: Output of run_benchmarks
+        baseline: Mapping of "case@scale" to a stored result row
+        tolerance: Allowed relative increase (0.25 = 25% slower/larger)
+
+    Returns:
+        Results with baseline columns, ratios and a `regression` flag
+    """
+    df = results.copy()
+    keys = df["case"] + "@" + df["scale"].astype(str) + "x"
+    df["baseline_p50_ms"] = keys.map(lambda key: baseline.get(key, {}).get("p50_ms", np.nan))
+    df["baseline_peak_mb"] = keys.map(lambda key: baseline.get(key, {}).get("peak_mb", np.nan))
+    df["p50_ratio"] = (df["p50_ms"] / df["baseline_p50_ms"]).round(2)
+    df["peak_ratio"] = (df["peak_mb"] / df["baseline_peak_mb"]).round(2)
+    df["regression"] = (df["p50_ratio"] > 1 + tolerance) | (df["peak_ratio"] > 1 + tolerance)
+    return df
+
+
+def results_to_baseline(results: pd.DataFrame) -> dict:
+    """Convert benchmark results into the baseline mapping stored on disk."""
+    return {
+        f"{row.case}@{row.scale}x": {"p50_ms": row.p50_ms, "p95_ms": row.p95_ms, "peak_mb": row.peak_mb}
+        for row in results.itertuples()
+    }
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point; returns 1 on a regression, or without a baseline when one is required."""
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's data-preparation paths.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Scale factors of the shipped CSVs")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed repetitions per case")
+    parser.add_argument("--cases", nargs="+", choices=list(BENCHMARK_CASES), help="Subset of cases to run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument(
+        "--require-baseline",
+        action="store_true",
+        default=bool(os.environ.get("CI")),
+        help="Fail when there is no baseline to compare against (default when CI is set)",
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scales, args.repeat, args.cases)
+    if results.empty:
+        print("No benchmark case could run (missing data files?)", file=sys.stderr)
+        return 1
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results_to_baseline(results), f, indent=2, sort_keys=True)
+        print(results.to_string(index=False))
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(results.to_string(index=False))
+        if args.require_baseline:
+            print(f"\nNo baseline at {args.baseline}; nothing to compare against.", file=sys.stderr)
+            return 1
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    compared = compare_to_baseline(results, baseline, args.tolerance)
+    print(compared.to_string(index=False))
+
+    regressions = compared[compared["regression"]]
+    if not regressions.empty:
+        print(f"\nREGRESSION in {len(regressions)} case(s) (tolerance {args.tolerance:.0%}):", file=sys.stderr)
+        for row in regressions.itertuples():
+            print(
+                f"  {row.case}@{row.scale}x: p50 {row.p50_ms} ms (x{row.p50_ratio}), "
+                f"peak {row.peak_mb} MB (x{row.peak_ratio})",
+                file=sys.stderr
+            )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
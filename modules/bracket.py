@@ -0,0 +1,238 @@
+"""
+Knockout bracket builder.
+Reconstructs the knockout brackets of head-to-head events (tennis, football,
+basketball, handball, judo, boxing, fencing, wrestling, ...) from the result
+rows: the two rows sharing a stage_code are one match. Matches of every event
+are paired in one vectorized pass (group by stage_code, then pivot to one row
+per match) and linked to the next match of their winner and of their loser.
+The main draw is the gold medal match and every match whose winner went on
+towards it; repechages, bronze medal and placement matches are consolation
+matches.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from modules.progression import GROUP_ROUND, STANDINGS_PHASE, ProgressionIndex, contiguous_ranges
+
+
+# Per side columns of a match, from its result row
+SIDE_COLUMNS = ["participant_code", "participant_name", "participant_country", "result", "result_WLT"]
+
+# Per match columns, from the row of side "a"
+UNIT_COLUMNS = ["event_code", "event_name", "discipline_name", "stage_code", "stage",
+                 "start", "round_code", "round_name", "round_order"]
+
+# Sides are ordered so that side "a" is the winner of a decided match
+OUTCOME_ORDER = {"W": 0, "T": 1, "L": 2}
+
+
+@dataclass(frozen=True)
+class Bracket:
+    """
+    The knockout matches of one event.
+
+    Attributes:
+        event_code: Event code (e.g. "TENMSINGLES")
+        event_name: Event name
+        matches: One row per match in round order: stage_code, stage, start,
+            round_code, round_name, round_order, slot (match number in the round),
+            a_* and b_* columns per side (participant_code, participant_name,
+            participant_country, result, result_WLT, next_match), winner
+            (participant code, missing while undecided), winner_next,
+            loser_next and consolation
+    """
+    event_code: str
+    event_name: str
+    matches: pd.DataFrame
+
+    @property
+    def main_draw(self) -> pd.DataFrame:
+        """Matches of the main draw, up to the final."""
+        return self.matches[~self.matches["consolation"]]
+
+    @property
+    def consolation(self) -> pd.DataFrame:
+        """Repechage, bronze medal and placement matches."""
+        return self.matches[self.matches["consolation"]]
+
+    def layout(self) -> pd.DataFrame:
+        """
+        Positions of the main draw matches for drawing the bracket.
+
+        Each match is placed midway between the matches its participants won
+        to get there; matches nobody won their way into (first round, byes)
+        are stacked in order.
+
+        Returns:
+            Main draw matches with x (round index) and y (position) columns
+        """
+        main = self.main_draw
+        rounds = {order: i for i, order in enumerate(sorted(main["round_order"].unique()))}
+        feeders = {}
+        for stage, next_match in zip(main["stage_code"], main["winner_next"]):
+            if isinstance(next_match, str):
+                feeders.setdefault(next_match, []).append(stage)
+
+        # Leaves in bracket order: depth-first from the last round's matches
+        y = {}
+        leaf = 0
+        stack = list(reversed(main[main["winner_next"].isna()]["stage_code"].tolist()))
+        post_order = []
+        while stack:
+            stage = stack.pop()
+            if isinstance(stage, tuple):
+                post_order.append(stage[0])
+                continue
+            children = feeders.get(stage, [])
+            stack.append((stage,))
+            if not children:
+                y[stage] = float(leaf)
+                leaf += 1
+            stack.extend(reversed(children))
+        for stage in post_order:
+            if stage not in y:
+                y[stage] = float(np.mean([y[child] for child in feeders[stage]]))
+        return main.assign(
+            x=main["round_order"].map(rounds),
+            y=main["stage_code"].map(y),
+        )
+
+
+@dataclass(frozen=True)
+class BracketIndex:
+    """
+    Knockout matches of every event, sorted by event.
+
+    Attributes:
+        matches: One row per match (see Bracket.matches), with event_code
+        ranges: Dictionary mapping each event code to its (start, stop) positions in matches
+        events: One row per event with a bracket: event_code, event_name, discipline_name
+    """
+    matches: pd.DataFrame
+    ranges: dict
+    events: pd.DataFrame
+
+    def event(self, event_code: str) -> Bracket:
+        """
+        Bracket of one event.
+
+        Raises:
+            KeyError: Event without knockout matches
+        """
+        start, stop = self.ranges[event_code]
+        matches = self.matches.iloc[start:stop]
+        return Bracket(event_code, matches["event_name"].iloc[0], matches.drop(columns="event_code").reset_index(drop=True))
+
+    def events_for(self, discipline: str) -> pd.DataFrame:
+        """Events of one discipline with a bracket, by name."""
+        return self.events[self.events["discipline_name"] == discipline].sort_values("event_name")
+
+
+def _mark_consolation(matches: pd.DataFrame) -> pd.Series:
+    """
+    Consolation flag per match: every match off the road to the gold medal match.
+
+    The gold medal match of an event is the match of its last round that
+    the most matches were won into (bronze and placement finals are entered
+    by losers, or from fewer matches); the main draw is that match and every
+    match whose winner went on towards it. Both take as many passes as the
+    deepest chain of matches.
+    """
+    stages = matches["stage_code"]
+
+    # Matches won into each match, directly or not (the match included)
+    tree = pd.Series(1, index=stages.to_numpy())
+    while True:
+        fed = tree.groupby(matches["winner_next"].to_numpy()).sum()
+        grown = 1 + fed.reindex(tree.index, fill_value=0)
+        if grown.equals(tree):
+            break
+        tree = grown
+
+    ordered = matches.assign(tree=tree.to_numpy()).sort_values(
+        ["event_code", "round_order", "tree"], ascending=[True, False, False], kind="stable")
+    main = stages.isin(ordered.drop_duplicates("event_code")["stage_code"])
+    while True:
+        spread = main | matches["winner_next"].isin(stages[main])
+        if spread.equals(main):
+            return ~main
+        main = spread
+
+
+def pair_matches(rows: pd.DataFrame, extra_columns: list = None) -> pd.DataFrame:
+    """
+    Pair head-to-head result rows into one row per match.
+
+    Only units with exactly two result rows and a win/loss/tie outcome are
+    matches; other rows are dropped.
+
+    Args:
+        rows: Result rows of the progression index (see ProgressionIndex.rows)
+        extra_columns: Further per-row columns to keep for each side
+
+    Returns:
+        One row per match: event_code, event_name, discipline_name, stage_code,
+        stage, start, round_code, round_name, round_order and a_*/b_* side
+        columns (SIDE_COLUMNS and extra_columns), side "a" being the winner
+        of a decided match
+    """
+    rows = rows[rows["round_code"] != STANDINGS_PHASE]
+    sizes = rows.groupby("stage_code")["stage_code"].transform("size")
+    decided = rows.groupby("stage_code")["result_WLT"].transform("count")
+    rows = rows[(sizes == 2) & (decided > 0)]
+
+    # Winner first, then one row per match
+    rows = rows.assign(outcome=rows["result_WLT"].map(OUTCOME_ORDER).fillna(len(OUTCOME_ORDER)))
+    rows = rows.sort_values(["stage_code", "outcome"], kind="stable")
+    rows = rows.assign(side=np.where(rows.groupby("stage_code").cumcount() == 0, "a", "b"))
+    side_columns = SIDE_COLUMNS + list(extra_columns or [])
+    sides = rows.pivot(index="stage_code", columns="side", values=side_columns)
+    sides.columns = [f"{side}_{column}" for column, side in sides.columns]
+
+    # Without matches the pivot has no side columns: keep them all the same
+    columns = UNIT_COLUMNS + [f"{side}_{column}" for side in "ab" for column in side_columns]
+    return (
+        rows[rows["side"] == "a"][UNIT_COLUMNS]
+        .join(sides, on="stage_code")
+        .reindex(columns=columns)
+        .sort_values(["event_code", "round_order", "stage_code"], ignore_index=True)
+    )
+
+
+def head_to_head_matches(rows: pd.DataFrame) -> pd.DataFrame:
+    """All head-to-head matches, group play included, in chronological order (see pair_matches)."""
+    return pair_matches(rows).sort_values(["start", "stage_code"], ignore_index=True)
+
+
+def build_bracket_index(progression: ProgressionIndex) -> BracketIndex:
+    """
+    Pair the knockout matches of every event and link them into brackets.
+
+    Group play matches are left out.
+
+    Args:
+        progression: Event progression index (see modules.progression)
+
+    Returns:
+        BracketIndex
+    """
+    rows = progression.rows
+    rows = rows[rows["round_code"] != GROUP_ROUND]
+
+    # Rows are in round order, so a participant's next row is their next unit
+    rows = rows.assign(next_unit=rows.groupby(["event_code", "participant_code"], sort=False)["stage_code"].shift(-1))
+    matches = pair_matches(rows, extra_columns=["next_unit"])
+    matches = matches.rename(columns={"a_next_unit": "a_next_match", "b_next_unit": "b_next_match"})
+
+    matches["slot"] = matches.groupby(["event_code", "round_code"]).cumcount() + 1
+    won = matches["a_result_WLT"] == "W"
+    matches["winner"] = matches["a_participant_code"].where(won)
+    matches["winner_next"] = matches["a_next_match"].where(won)
+    matches["loser_next"] = matches["b_next_match"].where(won)
+    matches["consolation"] = _mark_consolation(matches)
+
+    ranges = contiguous_ranges(matches["event_code"].to_numpy())
+    events = matches.drop_duplicates("event_code")[["event_code", "event_name", "discipline_name"]].reset_index(drop=True)
+    return BracketIndex(matches, ranges, events)
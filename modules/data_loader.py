@@ -1,20 +1,62 @@
 """
 Data loading functions for the LA28 Dashboard.
 """
+import copy
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 import pandas as pd
 import streamlit as st
 import os
 
+from modules.bracket import BracketIndex, build_bracket_index, head_to_head_matches
+from modules.editions import CURRENT_EDITION, edition_dir, edition_file, projection_edition, results_files
+from modules.helpers import (
+    append_country_coverage,
+    append_country_summary_table,
+    build_country_coverage,
+    build_country_summary_table,
+)
+from modules.hot_reload import SnapshotStore, TableSpec
+from modules.incremental import append_rows, file_size, prefix_digest
+from modules.leaderboard import Leaderboard, append_leaderboard, build_leaderboard
+from modules.medal_timeline import MedalTimeline, append_medal_timeline, build_medal_timeline, build_schedule_day_index
+from modules.progression import ProgressionIndex, build_progression_index, read_results
+from modules.profiling import profiled, cache_probe
+from modules.projection import MEDAL_TYPES, PROJECTION_SEED, MedalProjection, build_projection_model, project_medals
+from modules.ratings import RatingEngine
+from modules.shared_data import SHARED_DATA_DIR, SharedDataPlane, private_view
+
+
+# Parsed results partition files kept in memory (every discipline, plus the
+# previous version of the ones that changed)
+RESULTS_PARTITIONS_CACHED = 128
+
+# Set LA28_DATA_DIR to load another data folder (e.g. a synthetic dataset from modules.synthetic)
+DATA_DIR = os.environ.get("LA28_DATA_DIR")
+
+
+def get_data_dir() -> str:
+    """Return the data folder: LA28_DATA_DIR if set, else the current edition's partition (see modules.editions)."""
+    if DATA_DIR:
+        return DATA_DIR
+    return edition_dir()
+
 
 def get_data_path(filename: str) -> str:
     """
     Get the absolute path to a data file.
     Works whether called from main app or pages folder.
     """
+    # An explicit data folder never falls back to the shipped data
+    if DATA_DIR:
+        data_path = os.path.join(DATA_DIR, filename)
+        if os.path.exists(data_path):
+            return data_path
+        raise FileNotFoundError(f"Could not find {filename} in {DATA_DIR}")
+
     # Try relative to current file first
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    data_path = os.path.join(parent_dir, "data", filename)
+    data_path = os.path.join(get_data_dir(), filename)
     
     if os.path.exists(data_path):
         return data_path
@@ -29,64 +71,353 @@ def get_data_path(filename: str) -> str:
     raise FileNotFoundError(f"Could not find {filename} in data folder")
 
 
-@st.cache_data
-def load_schedule_data() -> pd.DataFrame:
-    """Load and preprocess schedule data."""
-    df = pd.read_csv(get_data_path("schedules.csv"))
+def resolve_data_file(filename: str) -> str:
+    """Return the path a data file is read from: its Parquet copy when one exists, else the file itself."""
+    parquet_path = os.path.join(get_data_dir(), os.path.splitext(filename)[0] + ".parquet")
+    if os.path.exists(parquet_path):
+        return parquet_path
+    return get_data_path(filename)
+
+
+def read_data_file(filename: str) -> pd.DataFrame:
+    """Read a data file, preferring a Parquet copy with the same name when one exists."""
+    path = resolve_data_file(filename)
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def read_schedule_file() -> pd.DataFrame:
+    """Read and preprocess the schedule."""
+    df = read_data_file("schedules.csv")
     df["start_date"] = pd.to_datetime(df["start_date"])
     df["end_date"] = pd.to_datetime(df["end_date"])
     return df
 
 
-@st.cache_data
+def _file_table(filename: str, append_only: bool = False) -> TableSpec:
+    return TableSpec(
+        build=lambda tables: read_data_file(filename),
+        files=(filename,),
+        append=(lambda table, rows, tables: append_rows(table, rows)) if append_only else None,
+    )
+
+
+# Every table the loaders serve, in dependency order. Derived tables are
+# rebuilt whenever a table they depend on is reloaded, or updated with the
+# appended rows when the medal feeds only grew.
+TABLES = {
+    "schedule": TableSpec(build=lambda tables: read_schedule_file(), files=("schedules.csv",)),
+    "medals": _file_table("medals.csv", append_only=True),
+    "venues": _file_table("venues.csv"),
+    "athletes": _file_table("athletes.csv"),
+    "medals_total": _file_table("medals_total.csv"),
+    "events": _file_table("events.csv"),
+    "nocs": _file_table("nocs.csv"),
+    "coaches": _file_table("coaches.csv"),
+    "teams": _file_table("teams.csv"),
+    "medallists": _file_table("medallists.csv", append_only=True),
+    "country_coverage": TableSpec(
+        build=lambda tables: build_country_coverage(tables["medals"]),
+        depends=("medals",),
+        append=lambda coverage, rows, tables: append_country_coverage(coverage, rows),
+    ),
+    # Updated after country_coverage, from the same appended medal rows
+    "country_summary": TableSpec(
+        build=lambda tables: build_country_summary_table(tables["medals"]),
+        depends=("medals",),
+        append=lambda table, rows, tables: append_country_summary_table(table, tables["country_coverage"], rows),
+    ),
+    "medal_timeline": TableSpec(
+        build=lambda tables: build_medal_timeline(tables["medals"]),
+        depends=("medals",),
+        append=lambda timeline, rows, tables: append_medal_timeline(timeline, rows),
+    ),
+    "schedule_day_index": TableSpec(build=lambda tables: build_schedule_day_index(tables["schedule"]), depends=("schedule",)),
+    "leaderboard": TableSpec(
+        build=lambda tables: build_leaderboard(tables["medallists"]),
+        depends=("medallists",),
+        append=lambda board, rows, tables: append_leaderboard(board, rows),
+    ),
+}
+
+# Current data snapshot; a background watcher swaps in a new one when data files change.
+# With LA28_SHARED_DATA set, server processes on the host share one copy of the tables.
+SNAPSHOTS = SnapshotStore(
+    TABLES,
+    resolve_data_file,
+    shared=SharedDataPlane(SHARED_DATA_DIR) if SHARED_DATA_DIR else None,
+)
+
+
+@profiled("loader")
+def pin_snapshot():
+    """
+    Pin the current data snapshot for this script run; every page calls it first (see SnapshotStore.pin).
+
+    The run that builds the first snapshot is recorded as a cache miss.
+    """
+    SNAPSHOTS.pin()
+
+
+def table_version(name: str) -> int:
+    """
+    Version of a table in the snapshot pinned by this script run.
+
+    It only changes when the table is rebuilt or appended to, so caches can
+    key on it instead of hashing the table.
+    """
+    return SNAPSHOTS.pinned().table_versions[name]
+
+
+def snapshot_table(name: str):
+    """
+    Return a private copy of a table from the snapshot pinned by this script run.
+
+    Args:
+        name: Table name (a key of TABLES)
+
+    Returns:
+        The table; callers may modify it freely
+    """
+    table = SNAPSHOTS.pinned().tables[name]
+    if SNAPSHOTS.shared is not None or isinstance(table, pd.DataFrame):
+        # Copy-on-write views are enough (and a private copy would defeat the sharing)
+        return private_view(table)
+    # Other tables (timelines, leaderboards) are copied once per call
+    return copy.deepcopy(table)
+
+
+@profiled("loader")
+def load_schedule_data() -> pd.DataFrame:
+    """Load and preprocess schedule data."""
+    return snapshot_table("schedule")
+
+
+@profiled("loader")
 def load_medals_data() -> pd.DataFrame:
     """Load medals data."""
-    return pd.read_csv(get_data_path("medals.csv"))
+    return snapshot_table("medals")
 
 
-@st.cache_data
+@profiled("loader")
 def load_venues_data() -> pd.DataFrame:
     """Load venues data."""
-    return pd.read_csv(get_data_path("venues.csv"))
+    return snapshot_table("venues")
 
 
-@st.cache_data
+@profiled("loader")
 def load_athletes_data() -> pd.DataFrame:
     """Load athletes data."""
-    return pd.read_csv(get_data_path("athletes.csv"))
+    return snapshot_table("athletes")
 
 
-@st.cache_data
+@profiled("loader")
 def load_medals_total_data() -> pd.DataFrame:
     """Load medals total data."""
-    return pd.read_csv(get_data_path("medals_total.csv"))
+    return snapshot_table("medals_total")
 
 
-@st.cache_data
+@profiled("loader")
 def load_events_data() -> pd.DataFrame:
     """Load events data."""
-    return pd.read_csv(get_data_path("events.csv"))
+    return snapshot_table("events")
 
 
-@st.cache_data
+@profiled("loader")
 def load_nocs_data() -> pd.DataFrame:
     """Load NOCs data."""
-    return pd.read_csv(get_data_path("nocs.csv"))
+    return snapshot_table("nocs")
 
 
-@st.cache_data
+@profiled("loader")
 def load_coaches_data() -> pd.DataFrame:
     """Load coaches data."""
-    return pd.read_csv(get_data_path("coaches.csv"))
+    return snapshot_table("coaches")
 
 
-@st.cache_data
+@profiled("loader")
 def load_teams_data() -> pd.DataFrame:
     """Load teams data."""
-    return pd.read_csv(get_data_path("teams.csv"))
+    return snapshot_table("teams")
 
 
-@st.cache_data
+@profiled("loader")
 def load_medallists_data() -> pd.DataFrame:
     """Load medallists data."""
-    return pd.read_csv(get_data_path("medallists.csv"))
+    return snapshot_table("medallists")
+
+
+@profiled("loader")
+def load_country_summary_data() -> pd.DataFrame:
+    """Load the per-country medal summary table (rebuilt when medals data changes)."""
+    return snapshot_table("country_summary")
+
+
+@profiled("loader")
+def load_medal_timeline() -> MedalTimeline:
+    """Load the day × country × medal type timeline (rebuilt when medals data changes)."""
+    return snapshot_table("medal_timeline")
+
+
+@profiled("loader")
+def load_schedule_day_index() -> dict:
+    """Load the mapping of each day to the schedule rows starting that day."""
+    return snapshot_table("schedule_day_index")
+
+
+@profiled("loader")
+def load_leaderboard() -> Leaderboard:
+    """Load the athlete leaderboard engine (rebuilt when medallists data changes)."""
+    return snapshot_table("leaderboard")
+
+
+# Results partitions, parsed once per file version: a results refresh
+# re-reads only the disciplines whose file changed
+@lru_cache(maxsize=RESULTS_PARTITIONS_CACHED)
+def _results_partition(path: str, mtime: float) -> pd.DataFrame:
+    return read_results([path])
+
+
+# The results partitions are read for the progression index only; it is
+# rebuilt when any partition file changes (current and previous kept)
+@st.cache_data(max_entries=2, show_spinner=False)
+@cache_probe
+def _progression_index(files: tuple) -> ProgressionIndex:
+    partitions = [_results_partition(path, mtime) for path, mtime in files]
+    results = pd.concat(partitions, ignore_index=True) if partitions else read_results([])
+    return build_progression_index(results)
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+@cache_probe
+def _bracket_index(files: tuple) -> BracketIndex:
+    return build_bracket_index(_progression_index(files))
+
+
+# Ratings of this process, and the (mtime, size, digest) of each results
+# partition they were rated from
+_RATINGS = RatingEngine()
+_RATINGS_SOURCES = {}
+_RATINGS_LOCK = threading.Lock()
+
+
+def _only_appended(sources: dict, files: tuple) -> bool:
+    """Whether every partition rated before is still listed, unchanged or only appended to."""
+    if not sources:
+        return False
+    mtimes = dict(files)
+    for path, (mtime, size, digest) in sources.items():
+        if path not in mtimes:
+            return False
+        if mtimes[path] != mtime and (digest is None or prefix_digest(path, size) != digest):
+            return False
+    return True
+
+
+def _rated_sources(files: tuple) -> dict:
+    """(mtime, size, digest) of each partition; no digest when a file changed since it was listed."""
+    sources = {}
+    for path, mtime in files:
+        size = file_size(path)
+        digest = prefix_digest(path, size) if size >= 0 and os.path.getmtime(path) == mtime else None
+        sources[path] = (mtime, size, digest)
+    return sources
+
+
+@st.cache_data(max_entries=2, show_spinner=False)
+@cache_probe
+def _ratings(files: tuple) -> RatingEngine:
+    matches = head_to_head_matches(_progression_index(files).rows)
+    with _RATINGS_LOCK:
+        global _RATINGS, _RATINGS_SOURCES
+        if _only_appended(_RATINGS_SOURCES, files):
+            # Only the matches this process has not rated yet
+            _RATINGS.update(matches)
+        else:
+            # A partition was corrected or removed, or the data folder changed: ratings are replayed
+            _RATINGS = RatingEngine.rebuild(matches)
+        _RATINGS_SOURCES = _rated_sources(files)
+        return copy.deepcopy(_RATINGS)
+
+
+# Medal projections of this process (the two latest data versions); every
+# medal type selection is tabulated from the same simulated trials
+_PROJECTIONS = OrderedDict()
+_PROJECTIONS_LOCK = threading.Lock()
+
+
+def _medal_projection(files: tuple, medallists_version: int, medallists: pd.DataFrame) -> MedalProjection:
+    key = (files, medallists_version)
+    with _PROJECTIONS_LOCK:
+        if key not in _PROJECTIONS:
+            model = build_projection_model(_progression_index(files), medallists)
+            _PROJECTIONS[key] = project_medals(model, seed=PROJECTION_SEED)
+            while len(_PROJECTIONS) > 2:
+                _PROJECTIONS.popitem(last=False)
+        return _PROJECTIONS[key]
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+@cache_probe
+def _medal_projection_table(files: tuple, medallists_version, medal_types: tuple, _medallists: pd.DataFrame) -> pd.DataFrame:
+    projection = _medal_projection(files, medallists_version, _medallists)
+    return projection.table(list(medal_types))
+
+
+# Medallists of an earlier edition, for projections from its results
+@st.cache_data(max_entries=2, show_spinner=False)
+@cache_probe
+def _edition_medallists(path: str, mtime: float) -> pd.DataFrame:
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+
+def _results_versions(data_dir: str = None) -> tuple:
+    """(path, mtime) of every results partition file; the cache key of the results indexes."""
+    return tuple((path, os.path.getmtime(path)) for path in results_files(data_dir or get_data_dir()))
+
+
+@profiled("loader")
+def load_event_progression() -> ProgressionIndex:
+    """Load the event progression index built from the results partitions (see modules.progression)."""
+    return _progression_index(_results_versions())
+
+
+@profiled("loader")
+def load_brackets() -> BracketIndex:
+    """Load the knockout brackets of every head-to-head event (see modules.bracket)."""
+    return _bracket_index(_results_versions())
+
+
+@profiled("loader")
+def load_ratings() -> RatingEngine:
+    """Load the Elo ratings per discipline of every athlete, team and country (see modules.ratings)."""
+    return _ratings(_results_versions())
+
+
+@profiled("loader")
+def load_medal_projection(medal_types: list = None) -> pd.DataFrame:
+    """
+    Load the projected medal table of the next Games (see modules.projection).
+
+    The projection comes from the current edition's results, or from the
+    latest earlier edition with results when the current one has none yet
+    (see modules.editions.projection_edition).
+
+    Args:
+        medal_types: Medal types counted in Total (default: all)
+
+    Returns:
+        One row per country with projected medals and their intervals (no
+        rows when no edition has results)
+    """
+    edition = CURRENT_EDITION if DATA_DIR else projection_edition()
+    if edition in (None, CURRENT_EDITION):
+        snapshot = SNAPSHOTS.pinned()
+        files, medallists_version = _results_versions(), snapshot.table_versions["medallists"]
+        medallists = snapshot.tables["medallists"]
+    else:
+        path = edition_file(edition, "medallists.csv")
+        files, medallists_version = _results_versions(edition_dir(edition)), (path, os.path.getmtime(path))
+        medallists = _edition_medallists(*medallists_version)
+    return _medal_projection_table(files, medallists_version, tuple(medal_types or MEDAL_TYPES), medallists)
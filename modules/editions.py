@@ -0,0 +1,257 @@
+"""
+Games editions and the partitioned data layout.
+Each edition (Paris 2024, LA28, past Games) is a partition of the data
+folder, data/editions/<edition>/, holding the same files as the flat layout,
+with results partitioned by discipline under results/<discipline>.csv. The
+flat data/ folder is the Paris 2024 partition for as long as it has not
+been moved under editions/.
+
+The loaders only read the partition of the current edition, and results only
+for the disciplines a view asks for. Cross-edition comparisons read just the
+small per-country medal totals of the editions being compared, so adding
+editions does not make any page load more data.
+"""
+import json
+import os
+import re
+from functools import lru_cache
+
+import pandas as pd
+
+
+DATA_ROOT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+# Set LA28_EDITIONS_DIR to keep the edition partitions somewhere else
+EDITIONS_DIR = os.environ.get("LA28_EDITIONS_DIR", os.path.join(DATA_ROOT, "editions"))
+
+# Edition stored in the flat data/ folder
+LEGACY_EDITION = "paris2024"
+
+# Set LA28_EDITION to serve another edition (a directory name under EDITIONS_DIR)
+CURRENT_EDITION = os.environ.get("LA28_EDITION", LEGACY_EDITION)
+
+# Optional per-edition metadata file, e.g. {"name": "LA 2028", "year": 2028, "host": "Los Angeles"}
+EDITION_METADATA = "edition.json"
+
+MEDAL_COLUMNS = ["Gold Medal", "Silver Medal", "Bronze Medal"]
+
+# (short name, host city) by the host part of an edition's directory name
+HOSTS = {
+    "la": ("LA", "Los Angeles"),
+    "paris": ("Paris", "Paris"),
+    "tokyo": ("Tokyo", "Tokyo"),
+    "rio": ("Rio", "Rio de Janeiro"),
+    "london": ("London", "London"),
+    "beijing": ("Beijing", "Beijing"),
+    "brisbane": ("Brisbane", "Brisbane"),
+}
+
+
+def _has_data(directory: str) -> bool:
+    return any(
+        entry.name.endswith((".csv", ".parquet"))
+        for entry in os.scandir(directory)
+        if entry.is_file()
+    ) if os.path.isdir(directory) else False
+
+
+def list_editions() -> list:
+    """Editions with data, oldest first (by year, then name)."""
+    editions = set()
+    if os.path.isdir(EDITIONS_DIR):
+        editions.update(entry.name for entry in os.scandir(EDITIONS_DIR) if entry.is_dir() and _has_data(entry.path))
+    if _has_data(DATA_ROOT):
+        editions.add(LEGACY_EDITION)
+    return sorted(editions, key=lambda edition: (edition_info(edition)["year"] or 0, edition))
+
+
+def edition_dir(edition: str = None) -> str:
+    """
+    Data folder of an edition partition.
+
+    Args:
+        edition: Edition name (default: the current edition)
+
+    Returns:
+        data/editions/<edition>, or the flat data/ folder for the legacy edition
+
+    Raises:
+        FileNotFoundError: The edition has no partition
+    """
+    edition = edition or CURRENT_EDITION
+    directory = os.path.join(EDITIONS_DIR, edition)
+    if os.path.isdir(directory):
+        return directory
+    if edition == LEGACY_EDITION:
+        return DATA_ROOT
+    raise FileNotFoundError(f"No data partition for edition {edition!r} in {EDITIONS_DIR}")
+
+
+@lru_cache(maxsize=None)
+def edition_info(edition: str) -> dict:
+    """
+    Display metadata of an edition.
+
+    Read from the partition's edition.json when present, else derived from
+    the directory name ("paris2024" -> "Paris 2024", "la2028" -> "LA 2028",
+    year 2028, host "Los Angeles"; see HOSTS).
+    """
+    match = re.match(r"^([a-z_]+?)_?(\d{4})$", edition)
+    code = match.group(1) if match else edition
+    # Short codes are acronyms ("sf" -> "SF"), not words to title-case
+    default = code.upper() if len(code) <= 3 else code.replace("_", " ").title()
+    short, host = HOSTS.get(code, (default, default))
+    year = int(match.group(2)) if match else None
+    info = {"name": f"{short} {year}" if year else short, "year": year, "host": host}
+    try:
+        with open(os.path.join(edition_dir(edition), EDITION_METADATA), encoding="utf-8") as f:
+            info.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return info
+
+
+def edition_label(edition: str = None) -> str:
+    """Display name of an edition (default: the current edition), e.g. "Paris 2024"."""
+    return edition_info(edition or CURRENT_EDITION)["name"]
+
+
+# -------------------------------------------------------
+# Results partitions
+# -------------------------------------------------------
+
+def results_files(data_dir: str = None, disciplines: list = None) -> list:
+    """
+    Results partition files of a data folder, pruned to some disciplines.
+
+    A discipline's results are in results/<discipline>.parquet or .csv; the
+    Parquet file is preferred when both exist.
+
+    Args:
+        data_dir: Data folder (default: the current edition's partition)
+        disciplines: Discipline names to keep (default: all)
+
+    Returns:
+        Sorted list of paths
+    """
+    results_dir = os.path.join(data_dir or edition_dir(), "results")
+    if not os.path.isdir(results_dir):
+        return []
+    partitions = {}
+    for entry in os.scandir(results_dir):
+        stem, ext = os.path.splitext(entry.name)
+        if ext == ".parquet" or (ext == ".csv" and stem not in partitions):
+            partitions[stem] = entry.path
+    if disciplines:
+        partitions = {stem: path for stem, path in partitions.items() if stem in set(disciplines)}
+    return sorted(partitions.values())
+
+
+def edition_file(edition: str, filename: str) -> str:
+    """
+    Path of a data file in an edition partition, preferring a Parquet copy.
+
+    Raises:
+        FileNotFoundError: The edition has no such file
+    """
+    directory = edition_dir(edition)
+    stem = os.path.splitext(filename)[0]
+    for name in (f"{stem}.parquet", filename):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No {filename} for edition {edition!r}")
+
+
+def projection_edition(edition: str = None) -> str:
+    """
+    Edition whose results project the medals of the next Games.
+
+    An edition yet to be played (LA28) has no results: its projection comes
+    from the latest earlier edition that has them.
+
+    Args:
+        edition: Edition projected from (default: the current edition)
+
+    Returns:
+        Edition name, or None when no edition up to this one has results
+    """
+    edition = edition or CURRENT_EDITION
+    year = edition_info(edition)["year"] or 0
+    earlier = [other for other in list_editions() if other != edition and (edition_info(other)["year"] or 0) <= year]
+    for candidate in [edition] + earlier[::-1]:
+        try:
+            if results_files(edition_dir(candidate)):
+                return candidate
+        except FileNotFoundError:
+            continue
+    return None
+
+
+# -------------------------------------------------------
+# Cross-edition aggregates
+# -------------------------------------------------------
+
+def _medal_totals_file(edition: str) -> str:
+    directory = edition_dir(edition)
+    for filename in ("medals_total.parquet", "medals_total.csv"):
+        path = os.path.join(directory, filename)
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No medal totals for edition {edition!r}")
+
+
+@lru_cache(maxsize=16)
+def _read_medal_totals(path: str, mtime_ns: int) -> pd.DataFrame:
+    columns = ["country_code", "country"] + MEDAL_COLUMNS
+    if path.endswith(".parquet"):
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        df = pd.read_csv(path, usecols=columns)
+    return df.groupby(["country_code", "country"], as_index=False)[MEDAL_COLUMNS].sum()
+
+
+def load_edition_medal_totals(edition: str) -> pd.DataFrame:
+    """
+    Per-country medal totals of one edition (read from its medals_total partition only).
+
+    Cached per file version, so every page and session shares one copy per edition.
+
+    Returns:
+        DataFrame with country_code, country and one column per medal type
+    """
+    path = _medal_totals_file(edition)
+    return _read_medal_totals(path, os.stat(path).st_mtime_ns)
+
+
+def medal_deltas(base: str, other: str, medal_types: list = None) -> pd.DataFrame:
+    """
+    Compare the medal counts of the countries between two editions.
+
+    Countries are matched by NOC code; a country missing from one edition
+    counts zero medals there.
+
+    Args:
+        base: Edition compared against (e.g. "paris2024")
+        other: Edition compared (e.g. "la2028")
+        medal_types: Medal types to count (default: all)
+
+    Returns:
+        DataFrame with country_code, country, base, other and delta columns,
+        sorted by delta (largest gain first)
+    """
+    medal_types = medal_types or MEDAL_COLUMNS
+
+    def totals(edition):
+        df = load_edition_medal_totals(edition)
+        return df.assign(medals=df[medal_types].sum(axis=1)).set_index("country_code")[["country", "medals"]]
+
+    base_totals, other_totals = totals(base), totals(other)
+    merged = base_totals.join(other_totals, how="outer", lsuffix="_base", rsuffix="_other")
+    result = pd.DataFrame({
+        "country": merged["country_other"].fillna(merged["country_base"]),
+        "base": merged["medals_base"].fillna(0).astype(int),
+        "other": merged["medals_other"].fillna(0).astype(int),
+    })
+    result["delta"] = result["other"] - result["base"]
+    return result.reset_index().sort_values(["delta", "country"], ascending=[False, True], ignore_index=True)
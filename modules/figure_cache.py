@@ -0,0 +1,147 @@
+"""
+Figure cache for Plotly charts.
+Stores serialized figures keyed by (component, data fingerprint, parameters)
+with LRU eviction and a size cap, so reruns triggered by unrelated widgets
+re-emit a cached figure instead of rebuilding its traces.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from modules.profiling import record_figure_bytes
+
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of figure JSON
+
+
+def data_fingerprint(*items) -> str:
+    """
+    Compute a stable fingerprint of the data a figure is built from.
+
+    DataFrames and Series are hashed by content (values, index and columns),
+    objects exposing a ``fingerprint`` attribute use it directly, and anything
+    else is hashed through its JSON representation.
+    """
+    digest = hashlib.md5()
+    for item in items:
+        if isinstance(item, (pd.DataFrame, pd.Series)):
+            try:
+                digest.update(pd.util.hash_pandas_object(item, index=True).to_numpy().tobytes())
+            except TypeError:
+                # Unhashable cells (e.g. lists): fall back to the JSON representation
+                digest.update(item.to_json(date_format="iso").encode())
+            if isinstance(item, pd.DataFrame):
+                digest.update("|".join(map(str, item.columns)).encode())
+        elif isinstance(item, np.ndarray):
+            digest.update(item.tobytes())
+        elif hasattr(item, "fingerprint"):
+            digest.update(str(item.fingerprint).encode())
+        else:
+            digest.update(normalize_params(item).encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def normalize_params(params) -> str:
+    """Serialize parameters canonically (sorted keys, tuples as lists)."""
+    return json.dumps(params, sort_keys=True, default=str, separators=(",", ":"))
+
+
+class FigureCache:
+    """Thread-safe LRU cache of Plotly figures with an entry and byte cap."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple):
+        """Return the cached (json, figure) entry for a key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def get_json(self, key: tuple):
+        """Return the cached figure JSON for a key, or None."""
+        entry = self.get(key)
+        return entry[0] if entry else None
+
+    def put(self, key: tuple, figure) -> str:
+        """Serialize and store a figure, evicting least recently used entries as needed."""
+        figure_json = figure.to_json()
+        size = len(figure_json)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= len(self._entries.pop(key)[0])
+            if size > self.max_bytes:
+                return figure_json
+            self._entries[key] = (figure_json, figure)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (evicted_json, _) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted_json)
+        return figure_json
+
+    def clear(self):
+        """Drop every cached figure."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """Return entry count, total JSON bytes and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Process-wide cache shared by every session
+FIGURE_CACHE = FigureCache()
+
+
+def figure_cache_key(component: str, data: tuple = (), **params) -> tuple:
+    """Build the cache key for a component's figure."""
+    return (component, data_fingerprint(*data), normalize_params(params))
+
+
+def cached_figure(component: str, builder: Callable, data: tuple = (), **params):
+    """
+    Return a component's figure from the cache, building it on a miss.
+
+    Args:
+        component: Name of the component/chart (first part of the key)
+        builder: Zero-argument callable returning the Plotly figure
+        data: Data the figure is built from (fingerprinted by content)
+        **params: Parameters that affect the figure (normalized into the key)
+
+    Returns:
+        Plotly figure; treat it as read-only since it is shared across sessions
+    """
+    key = figure_cache_key(component, data, **params)
+    entry = FIGURE_CACHE.get(key)
+    if entry is not None:
+        record_figure_bytes(len(entry[0]))
+        return entry[1]
+
+    figure = builder()
+    record_figure_bytes(len(FIGURE_CACHE.put(key, figure)))
+    return figure
@@ -0,0 +1,47 @@
+"""
+Fragment-scoped rendering for components.
+Wraps a component's render function in st.fragment so that interacting with
+its own widgets reruns only that component, not the whole page script.
+"""
+import functools
+from typing import Callable
+
+import streamlit as st
+
+
+# One fragment wrapper per render function, so its identity is stable across reruns
+_FRAGMENTS = {}
+
+
+def as_fragment(render_fn: Callable) -> Callable:
+    """
+    Return a fragment-scoped version of a component's render function.
+
+    Widget changes inside the component rerun only the fragment, reusing the
+    arguments from the last full page run. Data and figures still come from
+    the shared caches (data loaders and the figure cache), so a fragment rerun
+    costs only its own section. Falls back to the plain function on Streamlit
+    versions without st.fragment.
+
+    Args:
+        render_fn: A render_* function from the components package
+
+    Returns:
+        Callable with the same signature as render_fn
+    """
+    fragment = getattr(st, "fragment", None)
+    if fragment is None:
+        return render_fn
+
+    if render_fn not in _FRAGMENTS:
+        @functools.wraps(render_fn)
+        def _run(*args, **kwargs):
+            return render_fn(*args, **kwargs)
+
+        _FRAGMENTS[render_fn] = fragment(_run)
+    return _FRAGMENTS[render_fn]
+
+
+def render_fragment(render_fn: Callable, *args, **kwargs):
+    """Render a component as an isolated fragment (see as_fragment)."""
+    return as_fragment(render_fn)(*args, **kwargs)
@@ -120,6 +120,22 @@ COUNTRY_TO_CONTINENT = {
 }
 
 
+@lru_cache(maxsize=1)
+def _load_pycountry():
+    """
+    Import pycountry and pycountry_convert once, on the first fallback lookup.
+
+    Returns:
+        (pycountry, pycountry_convert) modules, or None if they are not installed
+    """
+    try:
+        import pycountry
+        import pycountry_convert
+    except ImportError:
+        return None
+    return pycountry, pycountry_convert
+
+
 @lru_cache(maxsize=None)
 def get_continent(country: str) -> str:
     """
@@ -137,16 +153,15 @@ def get_continent(country: str) -> str:
         return COUNTRY_TO_CONTINENT[country_str]
     
     # Try pycountry as fallback
+    pycountry_api = _load_pycountry()
+    if pycountry_api is None:
+        return "Unknown"
+    pycountry, pycountry_convert = pycountry_api
     try:
-        import pycountry
-        from pycountry_convert import (
-            country_alpha2_to_continent_code,
-            convert_continent_code_to_continent_name
-        )
         country_obj = pycountry.countries.lookup(country_str)
         country_alpha2 = country_obj.alpha_2
-        continent_code = country_alpha2_to_continent_code(country_alpha2)
-        continent_name = convert_continent_code_to_continent_name(continent_code)
+        continent_code = pycountry_convert.country_alpha2_to_continent_code(country_alpha2)
+        continent_name = pycountry_convert.convert_continent_code_to_continent_name(continent_code)
         return continent_name
     except Exception:
         # If still not found, return Unknown (not "Other/Special")
@@ -154,9 +169,106 @@ def get_continent(country: str) -> str:
         return "Unknown"
 
 
+# Columns of the per-country summary table, in display order
+COUNTRY_SUMMARY_COLUMNS = ["Total medals", "Gold", "Silver", "Bronze", "Sports", "Events"]
+
+
+def build_country_summary_table(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the per-country medal summary table in a single grouped pass.
+
+    Args:
+        df: Medal fact table (one row per medal, as in medals.csv)
+
+    Returns:
+        DataFrame indexed by country with the COUNTRY_SUMMARY_COLUMNS,
+        so a single country is a constant-time .loc lookup.
+    """
+    grouped = df.groupby("country", sort=True)
+    medal_counts = pd.crosstab(df["country"], df["medal_type"])
+    table = pd.DataFrame({
+        "Total medals": grouped.size(),
+        "Gold": medal_counts.get("Gold Medal", 0),
+        "Silver": medal_counts.get("Silver Medal", 0),
+        "Bronze": medal_counts.get("Bronze Medal", 0),
+        "Sports": grouped["discipline"].nunique(),
+        "Events": grouped["event"].nunique(),
+    })
+    return table[COUNTRY_SUMMARY_COLUMNS].fillna(0).astype(int)
+
+
+def build_country_coverage(df: pd.DataFrame) -> dict:
+    """
+    Distinct sports and events each country won medals in.
+
+    Args:
+        df: Medal fact table (one row per medal, as in medals.csv)
+
+    Returns:
+        Dictionary mapping each country to a (disciplines, events) pair of frozensets
+    """
+    disciplines = df.groupby("country")["discipline"].unique()
+    events = df.groupby("country")["event"].unique()
+    return {
+        country: (frozenset(disciplines[country]), frozenset(events[country]))
+        for country in disciplines.index
+    }
+
+
+def append_country_coverage(coverage: dict, new_rows: pd.DataFrame) -> dict:
+    """
+    Update the country coverage with appended medal rows.
+
+    Only the countries in the new rows get new sets; the others share them
+    with the previous coverage.
+
+    Returns:
+        New coverage dictionary; the input is not modified
+    """
+    if new_rows.empty:
+        return coverage
+    updated = dict(coverage)
+    for country, delta in build_country_coverage(new_rows).items():
+        disciplines, events = updated.get(country, (frozenset(), frozenset()))
+        updated[country] = (disciplines | delta[0], events | delta[1])
+    return updated
+
+
+def append_country_summary_table(table: pd.DataFrame, coverage: dict, new_rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Update the per-country summary table with appended medal rows.
+
+    Medal counts are added as deltas, and the distinct sports and events of
+    the countries in the new rows are read from the country coverage; every
+    other country keeps its row. The cost depends on the new rows, not on
+    the medal table.
+
+    Args:
+        table: Summary table built from the medal rows before the append
+        coverage: Country coverage including the appended rows (see append_country_coverage)
+        new_rows: The appended medal rows
+
+    Returns:
+        New summary table, equal to build_country_summary_table on all the medal rows
+    """
+    if new_rows.empty:
+        return table
+    delta = build_country_summary_table(new_rows)
+    affected = delta.index
+    updated = table.reindex(table.index.union(affected), fill_value=0)
+    counts = ["Total medals", "Gold", "Silver", "Bronze"]
+    updated.loc[affected, counts] += delta[counts]
+
+    updated.loc[affected, "Sports"] = [len(coverage[country][0]) for country in affected]
+    updated.loc[affected, "Events"] = [len(coverage[country][1]) for country in affected]
+    updated.index.name = table.index.name
+    return updated[COUNTRY_SUMMARY_COLUMNS].astype(int)
+
+
 def country_summary(df: pd.DataFrame, country: str) -> dict:
     """
     Generate a summary of medal statistics for a given country.
+    For repeated lookups prefer build_country_summary_table.
     """
     sub = df[df["country"] == country]
     return {
@@ -167,3 +279,49 @@ def country_summary(df: pd.DataFrame, country: str) -> dict:
         "Sports": sub["discipline"].nunique(),
         "Events": sub["event"].nunique(),
     }
+
+
+# Short labels used for medal types in hierarchy charts
+MEDAL_LABELS = {"Gold Medal": "Gold", "Silver Medal": "Silver", "Bronze Medal": "Bronze"}
+
+
+def build_medal_hierarchy(df_totals: pd.DataFrame, medal_columns: list) -> pd.DataFrame:
+    """
+    Reshape per-country medal totals into Continent → Country → Medal_Type rows.
+
+    Args:
+        df_totals: Medal totals with Continent, country and one column per medal type
+        medal_columns: Medal type columns to include (e.g. ["Gold Medal", "Silver Medal"])
+
+    Returns:
+        DataFrame with Continent, Country, Medal_Type and Count columns (zero counts dropped)
+    """
+    melted = df_totals.melt(
+        id_vars=["Continent", "country"],
+        value_vars=medal_columns,
+        var_name="Medal_Type",
+        value_name="Count",
+        ignore_index=False,
+    )
+    melted = melted[melted["Count"] > 0].sort_index(kind="stable")
+    melted["Medal_Type"] = melted["Medal_Type"].map(MEDAL_LABELS)
+    return melted.rename(columns={"country": "Country"}).reset_index(drop=True)
+
+
+def build_hierarchy_from_medals(df_medals: pd.DataFrame, path: list, medal_types: list) -> pd.DataFrame:
+    """
+    Count medals along an arbitrary hierarchy path of the medal fact table.
+
+    Args:
+        df_medals: Medal fact table (one row per medal) with a continent column
+        path: Columns to group by, outermost first (e.g. ["continent", "country", "medal_type"])
+        medal_types: Medal types to include (e.g. ["Gold Medal", "Silver Medal"])
+
+    Returns:
+        DataFrame with the path columns and a Count column, medal types shortened to Gold/Silver/Bronze
+    """
+    sub = df_medals.loc[df_medals["medal_type"].isin(medal_types), path]
+    counts = sub.groupby(path, sort=False).size().reset_index(name="Count")
+    if "medal_type" in path:
+        counts["medal_type"] = counts["medal_type"].map(MEDAL_LABELS)
+    return counts
@@ -0,0 +1,444 @@
+"""
+Hot reload of the data files with double-buffered snapshots.
+All tables (raw files and derived aggregates) live in an immutable Snapshot.
+A background watcher polls the data files; when some change, it rebuilds only
+the affected tables (and the aggregates depending on them) off the request
+path and atomically swaps the new snapshot in. Append-only files are read
+incrementally: only their new rows are parsed and applied as deltas to the
+tables built from them. A table whose data file is missing only fails the
+callers reading it. Script runs pin the snapshot they started on, so an
+in-flight run finishes on the old data while the next rerun sees the new one.
+"""
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping
+
+from modules.incremental import file_size, make_cursor, read_appended_rows
+from modules.profiling import cache_probe, profiled
+from modules.shared_data import snapshot_key
+
+
+# Seconds between two polls of the data files; LA28_RELOAD_INTERVAL=0 disables hot reload
+RELOAD_INTERVAL = float(os.environ.get("LA28_RELOAD_INTERVAL", "5"))
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    How to build one snapshot table.
+
+    Attributes:
+        build: Callable receiving the tables built so far (in declaration order)
+            and returning this table
+        files: Data files the table is read from
+        depends: Other tables it is derived from
+        append: Optional callable applying appended rows as a delta, called
+            with (previous table, appended rows, tables built so far). For a
+            table read from one append-only CSV file the rows are those
+            appended to the file; for a derived table, those appended to the
+            one table it depends on that changed. Without it (or when a file
+            was rewritten) the table is rebuilt.
+    """
+    build: Callable[[Mapping], object]
+    files: tuple = ()
+    depends: tuple = ()
+    append: Callable[[object, object, Mapping], object] = None
+
+
+@dataclass(frozen=True)
+class MissingTable:
+    """Placeholder of a table that could not be built because a data file is missing."""
+    error: str
+
+
+class SnapshotTables(Mapping):
+    """
+    Read-only tables of a snapshot.
+
+    Reading a table whose data file is missing raises FileNotFoundError, so
+    only the pages and datasets that need it fail.
+    """
+
+    def __init__(self, tables: Mapping):
+        self._tables = tables
+
+    def __getitem__(self, name: str):
+        table = self._tables[name]
+        if isinstance(table, MissingTable):
+            raise FileNotFoundError(table.error)
+        return table
+
+    def __iter__(self) -> Iterator:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def raw(self) -> Mapping:
+        """Every table, with MissingTable placeholders for the missing ones."""
+        return MappingProxyType(self._tables)
+
+
+@dataclass(frozen=True, eq=False)
+class Snapshot:
+    """
+    Immutable, versioned set of tables with the fingerprints of the files they came from.
+
+    tables raises FileNotFoundError for a table whose data file is missing
+    (see SnapshotTables). table_versions maps each table to the snapshot
+    version that built it, so a table carried over unchanged by a reload
+    keeps its version. append_cursors records how far each append-only file
+    has been read.
+    """
+    version: int
+    tables: Mapping
+    table_versions: Mapping
+    fingerprints: Mapping
+    append_cursors: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    created_at: float = field(default_factory=time.time)
+
+
+def fingerprint_files(filenames: list, resolve: Callable[[str], str]) -> dict:
+    """
+    Fingerprint data files by resolved path, modification time and size.
+
+    Returns:
+        Dictionary mapping each file name to (path, mtime_ns, size), or None
+        when the file cannot be found
+    """
+    fingerprints = {}
+    for filename in filenames:
+        try:
+            path = resolve(filename)
+            stat = os.stat(path)
+            fingerprints[filename] = (path, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprints[filename] = None
+    return fingerprints
+
+
+def affected_tables(specs: Mapping, changed_files: set) -> set:
+    """Tables reading a changed file, plus every table derived from them."""
+    affected = set()
+    for name, spec in specs.items():
+        if changed_files.intersection(spec.files) or affected.intersection(spec.depends):
+            affected.add(name)
+    return affected
+
+
+def build_tables(specs: Mapping, previous: Mapping = None, rebuild: set = None, appended: Mapping = None) -> tuple:
+    """
+    Build snapshot tables, reusing unaffected tables of a previous snapshot.
+
+    A table whose build raises FileNotFoundError (directly, or because a
+    table it reads is missing) becomes a MissingTable.
+
+    Args:
+        specs: Table specs in dependency order
+        previous: Tables of the previous snapshot, MissingTable placeholders
+            included (None builds everything)
+        rebuild: Names of the tables to update (ignored without previous)
+        appended: Rows appended to append-only files, by file name
+
+    Returns:
+        (tables, modes) where modes maps each table to "kept", "appended",
+        "rebuilt" or "missing"
+    """
+    appended = appended or {}
+    tables, modes, deltas = {}, {}, {}
+    view = SnapshotTables(tables)
+    for name, spec in specs.items():
+        if previous is not None and name not in rebuild:
+            tables[name] = previous[name]
+            modes[name] = "kept"
+            continue
+
+        delta = None
+        if previous is not None and spec.append is not None:
+            if spec.files:
+                sources = [appended.get(f) for f in spec.files]
+            else:
+                sources = [deltas.get(d) for d in spec.depends if d in rebuild]
+            if len(sources) == 1:
+                delta = sources[0]
+
+        try:
+            if delta is not None and not isinstance(previous[name], MissingTable):
+                tables[name] = spec.append(previous[name], delta, view)
+                modes[name] = "appended"
+                if spec.files:
+                    # Derived tables receive the rows appended to the file table
+                    deltas[name] = delta
+            else:
+                tables[name] = spec.build(view)
+                modes[name] = "rebuilt"
+        except FileNotFoundError as e:
+            tables[name] = MissingTable(str(e))
+            modes[name] = "missing"
+    return tables, modes
+
+
+def file_cursors(specs: Mapping, tables: Mapping, modes: Mapping, fingerprints: Mapping) -> dict:
+    """
+    Append cursors for the append-only files that were just read in full.
+
+    A file that changed size while it was read gets no cursor, so its next
+    change is read in full again.
+    """
+    cursors = {}
+    for name, spec in specs.items():
+        if spec.append is None or len(spec.files) != 1 or modes[name] != "rebuilt":
+            continue
+        fingerprint = fingerprints.get(spec.files[0])
+        if fingerprint is None or file_size(fingerprint[0]) != fingerprint[2]:
+            continue
+        cursor = make_cursor(fingerprint[0], fingerprint[2], len(tables[name]))
+        if cursor is not None:
+            cursors[spec.files[0]] = cursor
+    return cursors
+
+
+# Session state key of the snapshot pinned by the running script
+PIN_KEY = "_la28_snapshot_pin"
+
+
+def _session_state():
+    """Session state of the running script, or None outside a script run."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    import streamlit as st
+
+    return st.session_state
+
+
+class SnapshotStore:
+    """
+    Holds the current and previous snapshot and swaps in rebuilt ones.
+
+    Readers never block on a reload: the swap is a single reference
+    assignment, and the previous snapshot stays alive for runs still using it.
+    With a shared data plane, the first process to see new data builds and
+    publishes it and the other processes attach to the published tables.
+    """
+
+    def __init__(self, specs: Mapping, resolve: Callable[[str], str], interval: float = RELOAD_INTERVAL, shared=None):
+        self.specs = specs
+        self.resolve = resolve
+        self.interval = interval
+        self.shared = shared
+        self.files = sorted({f for spec in specs.values() for f in spec.files})
+        self._current = None
+        self._previous = None
+        self._build_lock = threading.Lock()
+        self._pending = None
+        self._failed = None
+        self._watcher = None
+        self._stop = threading.Event()
+        self.reloads = 0
+        self.last_reload_s = None
+        self.last_reload_modes = {}
+        self.last_error = None
+
+    def current(self) -> Snapshot:
+        """Return the current snapshot, building the first one on demand."""
+        snapshot = self._current
+        if snapshot is None:
+            with self._build_lock:
+                if self._current is None:
+                    fingerprints = fingerprint_files(self.files, self.resolve)
+
+                    def build():
+                        tables, modes = build_tables(self.specs)
+                        return tables, modes, file_cursors(self.specs, tables, modes, fingerprints)
+
+                    tables, _, cursors = self._build_snapshot(fingerprints, build)
+                    self._current = Snapshot(
+                        1,
+                        SnapshotTables(tables),
+                        MappingProxyType(dict.fromkeys(tables, 1)),
+                        MappingProxyType(fingerprints),
+                        MappingProxyType(cursors),
+                    )
+                snapshot = self._current
+            self.start_watcher()
+        return snapshot
+
+    def pin(self) -> Snapshot:
+        """
+        Pin the current snapshot for the rest of this script run.
+
+        Every page calls this first (see modules.data_loader.pin_snapshot);
+        fragment reruns keep the snapshot of the run they belong to. The pin
+        is a weak reference in st.session_state, so a session never keeps a
+        replaced snapshot alive. Outside a script run, nothing is pinned.
+        """
+        snapshot = self.current()
+        state = _session_state()
+        if state is not None:
+            state[PIN_KEY] = weakref.ref(snapshot)
+        return snapshot
+
+    def pinned(self) -> Snapshot:
+        """
+        Return the snapshot of the running script.
+
+        The snapshot pinned by pin(), even if a reload swapped in a newer one
+        meanwhile; the current snapshot (pinned from then on) when the run
+        pinned none or its snapshot is gone. Outside a script run, the
+        current snapshot.
+        """
+        state = _session_state()
+        if state is None:
+            return self.current()
+        pin = state.get(PIN_KEY)
+        snapshot = pin() if pin is not None else None
+        return snapshot if snapshot is not None else self.pin()
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Update the tables affected by changed files and swap the new snapshot in.
+
+        Rows appended to an append-only file are parsed on their own and
+        applied as deltas; any other change rebuilds the affected tables.
+
+        A change is only applied once the file fingerprints are identical on two
+        consecutive checks, so a file still being written is never parsed.
+
+        Args:
+            force: Apply changes immediately, without waiting for them to settle
+
+        Returns:
+            True if a new snapshot was swapped in
+        """
+        current = self.current()
+        fingerprints = fingerprint_files(self.files, self.resolve)
+        changed = {f for f in self.files if fingerprints[f] != current.fingerprints.get(f)}
+        if not changed or fingerprints == self._failed:
+            self._pending = None
+            return False
+        if not force and fingerprints != self._pending:
+            self._pending = fingerprints
+            return False
+
+        started = time.perf_counter()
+        with self._build_lock:
+            rebuild = affected_tables(self.specs, changed)
+
+            def build():
+                appended, cursors = self._read_appended(current, changed, fingerprints)
+                tables, modes = build_tables(self.specs, current.tables.raw(), rebuild, appended)
+                cursors.update(file_cursors(self.specs, tables, modes, fingerprints))
+                return tables, modes, cursors
+
+            try:
+                tables, modes, cursors = self._build_snapshot(fingerprints, build)
+            except Exception as e:
+                # Keep serving the current snapshot; the next change triggers a new attempt
+                self.last_error = f"{type(e).__name__}: {e}"
+                self._failed = fingerprints
+                self._pending = None
+                return False
+            version = current.version + 1
+            # Attached tables are new objects even when their data did not change
+            table_versions = {
+                name: version if name in rebuild or self.shared is not None else current.table_versions[name]
+                for name in tables
+            }
+            snapshot = Snapshot(
+                version,
+                SnapshotTables(tables),
+                MappingProxyType(table_versions),
+                MappingProxyType(fingerprints),
+                MappingProxyType(cursors),
+            )
+            self._previous, self._current = current, snapshot
+        self._pending = None
+        self._failed = None
+        self.reloads += 1
+        self.last_reload_s = time.perf_counter() - started
+        self.last_reload_modes = {name: mode for name, mode in modes.items() if mode != "kept"}
+        self.last_error = None
+        return True
+
+    @profiled("loader")
+    def _build_snapshot(self, fingerprints: Mapping, build: Callable) -> tuple:
+        """
+        Run build, or with a shared data plane attach to the tables another process built.
+
+        Profiled as a loader: a call that builds (and every loader call it
+        runs under) is recorded as a cache miss, an attach as a hit.
+        """
+        build = cache_probe(build)
+        if self.shared is None:
+            return build()
+
+        def publishable():
+            tables, modes, cursors = build()
+            return tables, (modes, cursors)
+
+        tables, (modes, cursors) = self.shared.get_or_build(snapshot_key(fingerprints), publishable)
+        return tables, modes, cursors
+
+    def _read_appended(self, current: Snapshot, changed: set, fingerprints: Mapping) -> tuple:
+        """
+        Read the rows appended to changed append-only files.
+
+        Returns:
+            (appended rows by file, append cursors for the new snapshot); a
+            changed file that was not simply appended to loses its cursor
+        """
+        appended, cursors = {}, dict(current.append_cursors)
+        for filename in changed:
+            cursor = cursors.pop(filename, None)
+            fingerprint = fingerprints[filename]
+            if cursor is None or fingerprint is None:
+                continue
+            rows, cursor = read_appended_rows(cursor, fingerprint[0], fingerprint[2])
+            if rows is not None:
+                appended[filename] = rows
+                cursors[filename] = cursor
+        return appended, cursors
+
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.reload()
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+
+    def start_watcher(self):
+        """Start the background watcher thread (once; not when the interval is 0)."""
+        if self.interval <= 0 or self._watcher is not None:
+            return
+        with self._build_lock:
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._watch, name="la28-data-watcher", daemon=True)
+                self._watcher.start()
+
+    def stop_watcher(self):
+        """Stop the background watcher thread."""
+        self._stop.set()
+
+    def status(self) -> dict:
+        """Version, age and reload statistics of the current snapshot."""
+        snapshot = self._current
+        return {
+            "version": snapshot.version if snapshot else None,
+            "created_at": snapshot.created_at if snapshot else None,
+            "reloads": self.reloads,
+            "last_reload_s": self.last_reload_s,
+            "last_reload_modes": self.last_reload_modes,
+            "append_rows": {f: c.rows for f, c in snapshot.append_cursors.items()} if snapshot else {},
+            "missing_tables": sorted(
+                name for name, table in snapshot.tables.raw().items() if isinstance(table, MissingTable)
+            ) if snapshot else [],
+            "last_error": self.last_error,
+            "watching": self._watcher is not None and self._watcher.is_alive(),
+            "shared": self.shared.status() if self.shared is not None else None,
+        }
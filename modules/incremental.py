@@ -0,0 +1,218 @@
+"""
+Incremental ingestion of append-only CSV feeds.
+During competition days medals.csv, medallists.csv and the results files only
+grow by appended rows. An AppendCursor remembers how far a file was read, so
+a reload parses just the appended tail, after checking that the header and
+the bytes before the cursor are unchanged (otherwise the file was rewritten
+and must be read in full).
+"""
+import hashlib
+import io
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+# Bytes before the cursor that must be unchanged for a file to count as appended to
+BOUNDARY_BYTES = 4096
+
+
+@dataclass(frozen=True)
+class AppendCursor:
+    """Position after the last row read from an append-only CSV file."""
+    path: str
+    offset: int
+    rows: int
+    header: bytes
+    boundary: str
+
+
+def _boundary_digest(f, offset: int) -> str:
+    start = max(0, offset - BOUNDARY_BYTES)
+    f.seek(start)
+    return hashlib.md5(f.read(offset - start)).hexdigest()
+
+
+def make_cursor(path: str, offset: int, rows: int) -> AppendCursor:
+    """
+    Create the cursor of a CSV file read up to offset.
+
+    Args:
+        path: CSV file path
+        offset: Number of bytes read (ending on a line break)
+        rows: Number of data rows in those bytes
+
+    Returns:
+        AppendCursor, or None if the file is not a CSV file
+    """
+    if not path.endswith(".csv"):
+        return None
+    with open(path, "rb") as f:
+        header = f.readline()
+        return AppendCursor(path, offset, rows, header, _boundary_digest(f, offset))
+
+
+def read_appended_rows(cursor: AppendCursor, path: str, size: int) -> tuple:
+    """
+    Parse only the rows appended to a CSV file since the cursor.
+
+    Rows are read up to the last complete line within size bytes; a partial
+    last line is left for the next read.
+
+    Args:
+        cursor: Cursor of the previous read
+        path: Current path of the file
+        size: Current file size
+
+    Returns:
+        (rows, cursor) with the appended rows as a DataFrame (columns from the
+        header) and the advanced cursor, or (None, None) when the file was
+        not simply appended to
+    """
+    if cursor is None or path != cursor.path or size < cursor.offset:
+        return None, None
+    with open(path, "rb") as f:
+        if f.readline() != cursor.header or _boundary_digest(f, cursor.offset) != cursor.boundary:
+            return None, None
+        f.seek(cursor.offset)
+        tail = f.read(size - cursor.offset)
+
+    complete = tail.rfind(b"\n") + 1
+    tail = tail[:complete]
+    if not tail.strip():
+        rows = pd.read_csv(io.BytesIO(cursor.header), nrows=0)
+    else:
+        rows = pd.read_csv(io.BytesIO(cursor.header + tail))
+
+    offset = cursor.offset + complete
+    with open(path, "rb") as f:
+        boundary = _boundary_digest(f, offset)
+    return rows, AppendCursor(path, offset, cursor.rows + len(rows), cursor.header, boundary)
+
+
+# Arrow-backed columns gain a chunk per append; past this many, the appended
+# chunks are merged into one
+MAX_APPENDED_CHUNKS = 64
+
+# Rows in use of each column buffer, by id of the buffer: a table grows in
+# place only if it holds every row in use, so appending to an older table
+# never overwrites rows a newer table holds
+_BUFFER_ROWS = {}
+_BUFFER_LOCK = threading.Lock()
+
+
+def _buffer_of(values: np.ndarray) -> np.ndarray:
+    """The buffer of a column grown by _append_column, if the column is its start; else None."""
+    buffer = values
+    while isinstance(buffer.base, np.ndarray):
+        buffer = buffer.base
+    entry = _BUFFER_ROWS.get(id(buffer))
+    if entry is None or entry[0]() is not buffer or entry[1] != len(values) or buffer.dtype != values.dtype:
+        return None
+    if buffer.ndim != 1 or values.strides != buffer.strides or \
+            values.__array_interface__["data"][0] != buffer.__array_interface__["data"][0]:
+        return None
+    return buffer
+
+
+def _append_column(values, new_values):
+    """Column values followed by new values of the same dtype."""
+    if not isinstance(values, np.ndarray):
+        # Extension arrays; Arrow-backed ones gain a chunk, without copying
+        appended = type(values)._concat_same_type([values, new_values])
+        if not hasattr(appended, "__arrow_array__"):
+            return appended
+        chunks = appended.__arrow_array__().chunks
+        if len(chunks) <= MAX_APPENDED_CHUNKS:
+            return appended
+        import pyarrow as pa
+
+        # Merge the appended chunks, leaving the rows of the full read alone
+        tail = pa.concat_arrays(chunks[1:])
+        return pd.array(pa.chunked_array([chunks[0], tail], type=tail.type), dtype=values.dtype)
+
+    n, k = len(values), len(new_values)
+    with _BUFFER_LOCK:
+        buffer = _buffer_of(values)
+        if buffer is None or n + k > len(buffer):
+            # Grow by doubling, so each row is copied O(1) times on average
+            buffer = np.empty(max(2 * (n + k), 16), dtype=values.dtype)
+            buffer[:n] = values
+        buffer[n:n + k] = new_values
+        key = id(buffer)
+        _BUFFER_ROWS[key] = (weakref.ref(buffer, lambda _: _BUFFER_ROWS.pop(key, None)), n + k)
+    return buffer[:n + k]
+
+
+def _column_values(column: pd.Series):
+    return column.to_numpy() if isinstance(column.dtype, np.dtype) else column.array
+
+
+def append_rows(table: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Append parsed rows to a table, keeping the table's column dtypes where the rows allow it.
+
+    Costs as much as the appended rows, not the table: NumPy columns grow
+    into spare capacity and Arrow-backed columns gain a chunk, so the rows
+    already read are not copied again.
+
+    Args:
+        table: Table read so far
+        rows: Appended rows (same columns)
+
+    Returns:
+        New DataFrame; the inputs are not modified
+    """
+    if rows.empty:
+        return table
+    rows = rows.reindex(columns=table.columns)
+    for column, dtype in table.dtypes[rows.dtypes != table.dtypes].items():
+        try:
+            rows[column] = rows[column].astype(dtype)
+        except (TypeError, ValueError):
+            pass
+    if (rows.dtypes != table.dtypes).any() or not table.columns.is_unique \
+            or not table.index.equals(pd.RangeIndex(len(table))):
+        return pd.concat([table, rows], ignore_index=True)
+    return pd.DataFrame(
+        {column: _append_column(_column_values(values), _column_values(new_values))
+         for (column, values), (_, new_values) in zip(table.items(), rows.items())},
+        copy=False,
+    )
+
+
+def file_size(path: str) -> int:
+    """Current size of a file in bytes (-1 if it is missing)."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return -1
+
+
+def prefix_digest(path: str, size: int) -> str:
+    """
+    MD5 of the first size bytes of a file.
+
+    Unlike an AppendCursor's boundary check, it covers every byte before
+    size, so it also tells a file corrected in place from one appended to.
+
+    Returns:
+        Hex digest, or None if the file is missing or shorter than size
+    """
+    digest = hashlib.md5()
+    try:
+        with open(path, "rb") as f:
+            remaining = size
+            while remaining > 0:
+                chunk = f.read(min(remaining, 1 << 20))
+                if not chunk:
+                    return None
+                digest.update(chunk)
+                remaining -= len(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
@@ -0,0 +1,80 @@
+"""
+Lazy imports for heavy optional dependencies.
+A lazily imported module is only loaded the first time one of its attributes
+is used, so sections that never render never pay for plotly.express,
+geopy, requests or pycountry. Load times are recorded for the startup profiler.
+"""
+import importlib
+import sys
+import threading
+import time
+import types
+
+import plotly.graph_objects as go
+
+
+# Module name -> seconds its first load took (None until loaded)
+LAZY_IMPORT_TIMES = {}
+
+_lock = threading.Lock()
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_module"]
+        if module is None:
+            with _lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self.__name__)
+                    # Several proxies may share a module; keep the cost of the real first load
+                    if LAZY_IMPORT_TIMES.get(self.__name__) is None:
+                        LAZY_IMPORT_TIMES[self.__name__] = time.perf_counter() - started
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        value = getattr(self._load(), attr)
+        # Later lookups of the same attribute skip __getattr__ entirely
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Return a lazily imported module (e.g. ``px = lazy_import("plotly.express")``).
+
+    If the module was already imported, it is returned directly.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    LAZY_IMPORT_TIMES.setdefault(name, None)
+    return LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType) -> bool:
+    """Whether a (possibly lazy) module has actually been imported."""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_module"] is not None
+    return True
+
+
+# Plotly for the chart components (``from modules.lazy_imports import px, go``).
+# plotly.express loads on first use; Streamlit imports plotly.graph_objects
+# itself, so go is a plain module
+px = lazy_import("plotly.express")
@@ -0,0 +1,238 @@
+"""
+Athlete leaderboard engine.
+Keeps medallist rows as integer-coded arrays keyed by athlete code, so top-k
+queries for any filter combination are a bincount plus an argpartition.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+MEDAL_TYPES = ["Gold Medal", "Silver Medal", "Bronze Medal"]
+
+# Bits reserved per medal count in the packed sort key (up to 1023 medals each)
+_KEY_BITS = 10
+
+GROUP_FIELDS = ["discipline", "country", "gender"]
+
+
+@dataclass(frozen=True)
+class Leaderboard:
+    """Integer-coded medallist rows plus per-athlete display attributes."""
+    athlete_codes: np.ndarray
+    athlete_names: np.ndarray
+    athlete_countries: np.ndarray
+    athlete_disciplines: np.ndarray
+    row_athlete: np.ndarray
+    row_medal: np.ndarray
+    row_codes: dict
+    labels: dict
+
+    @property
+    def n_athletes(self) -> int:
+        return len(self.athlete_codes)
+
+    def _row_mask(self, countries: list = None, genders: list = None, sports: list = None) -> np.ndarray:
+        """Boolean mask over medallist rows for the given filters (empty/None means no filter)."""
+        mask = np.ones(len(self.row_athlete), dtype=bool)
+        if countries:
+            mask &= np.isin(self.row_codes["country"], _label_codes(self.labels["country"], countries))
+        if genders:
+            mask &= np.isin(self.row_codes["gender"], _label_codes(self.labels["gender"], genders))
+        if sports:
+            # Substring match, as the sidebar sports come from the athletes' discipline lists
+            patterns = [s.lower() for s in sports]
+            allowed = [i for i, label in enumerate(self.labels["discipline"])
+                       if any(p in label.lower() for p in patterns)]
+            mask &= np.isin(self.row_codes["discipline"], allowed)
+        return mask
+
+    def medal_counts(self, **filters) -> np.ndarray:
+        """Return an (n_athletes, 3) array of gold/silver/bronze counts under the filters."""
+        mask = self._row_mask(**filters)
+        flat = self.row_athlete[mask] * len(MEDAL_TYPES) + self.row_medal[mask]
+        counts = np.bincount(flat, minlength=self.n_athletes * len(MEDAL_TYPES))
+        return counts.reshape(self.n_athletes, len(MEDAL_TYPES))
+
+    def top_k(self, k: int = 10, **filters) -> pd.DataFrame:
+        """
+        Return the top-k athletes ranked by gold, then silver, then bronze.
+
+        Args:
+            k: Number of athletes to return
+            **filters: countries, genders and/or sports lists
+
+        Returns:
+            DataFrame with code_athlete, name, country, discipline, medal columns and total_medals
+        """
+        top, counts = self.top_k_indices(k, **filters)
+        return self._frame(top, counts)
+
+    def top_k_indices(self, k: int = 10, **filters) -> tuple:
+        """Return (athlete positions, (k, 3) medal counts) of the top-k athletes, best first."""
+        counts = self.medal_counts(**filters)
+        keys = pack_sort_keys(counts)
+        candidates = np.flatnonzero(keys)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-keys[candidates], k - 1)[:k]]
+        # Highest key first; ties broken by athlete code for stable output
+        top = candidates[np.lexsort((candidates, -keys[candidates]))]
+        return top, counts[top]
+
+    def top_k_by(self, group_field: str, k: int = 3, **filters) -> pd.DataFrame:
+        """
+        Return the top-k athletes within every discipline, country or gender.
+
+        Args:
+            group_field: One of GROUP_FIELDS
+            k: Number of athletes per group
+            **filters: countries, genders and/or sports lists
+
+        Returns:
+            DataFrame like top_k with an extra group column and a rank within the group
+        """
+        if group_field not in GROUP_FIELDS:
+            raise ValueError(f"group_field must be one of {GROUP_FIELDS}")
+
+        mask = self._row_mask(**filters)
+        group_codes = self.row_codes[group_field][mask]
+        pair = group_codes.astype(np.int64) * self.n_athletes + self.row_athlete[mask]
+        pairs, inverse = np.unique(pair, return_inverse=True)
+        counts = np.zeros((len(pairs), len(MEDAL_TYPES)), dtype=np.int64)
+        np.add.at(counts, (inverse, self.row_medal[mask]), 1)
+
+        groups, athletes = np.divmod(pairs, self.n_athletes)
+        keys = pack_sort_keys(counts)
+        order = np.lexsort((athletes, -keys, groups))
+
+        # Rank within each group: position minus the start of the group's run
+        sorted_groups = groups[order]
+        starts = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+        ranks = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        keep = order[ranks < k]
+
+        frame = self._frame(athletes[keep], counts[keep])
+        frame[group_field] = self.labels[group_field][groups[keep]]
+        frame["rank"] = ranks[ranks < k] + 1
+        return frame[[group_field, "rank"] + [c for c in frame.columns if c not in (group_field, "rank")]]
+
+    def _frame(self, athletes: np.ndarray, counts: np.ndarray) -> pd.DataFrame:
+        """Assemble the display frame for selected athletes."""
+        columns = {
+            "code_athlete": self.athlete_codes[athletes],
+            "name": self.athlete_names[athletes],
+            "country": self.athlete_countries[athletes],
+            "discipline": self.athlete_disciplines[athletes],
+        }
+        for m, medal_type in enumerate(MEDAL_TYPES):
+            columns[medal_type] = counts[:, m]
+        columns["total_medals"] = counts.sum(axis=1)
+        return pd.DataFrame(columns, copy=False)
+
+
+def pack_sort_keys(counts: np.ndarray) -> np.ndarray:
+    """Pack (gold, silver, bronze) counts into one integer that sorts lexicographically."""
+    counts = np.minimum(counts.astype(np.int64), (1 << _KEY_BITS) - 1)
+    return (counts[:, 0] << (2 * _KEY_BITS)) | (counts[:, 1] << _KEY_BITS) | counts[:, 2]
+
+
+def _label_codes(labels: np.ndarray, values: list) -> np.ndarray:
+    """Integer codes of the given values within a sorted label array."""
+    values = np.asarray(values, dtype=object)
+    positions = np.searchsorted(labels, values)
+    positions = np.clip(positions, 0, max(len(labels) - 1, 0))
+    return positions[labels[positions] == values] if len(labels) else positions[:0]
+
+
+def build_leaderboard(df_medallists: pd.DataFrame) -> Leaderboard:
+    """
+    Build the leaderboard engine from the medallists table.
+
+    Args:
+        df_medallists: Medallists data (one row per athlete medal, with code_athlete)
+
+    Returns:
+        Leaderboard with one entry per distinct athlete code
+    """
+    df = df_medallists[df_medallists["medal_type"].isin(MEDAL_TYPES)]
+
+    row_athlete, athlete_codes = pd.factorize(df["code_athlete"].astype(str), sort=True)
+    row_codes, labels = {}, {}
+    for field in GROUP_FIELDS:
+        row_codes[field], uniques = pd.factorize(df[field].fillna("Unknown"), sort=True)
+        labels[field] = np.asarray(uniques, dtype=object)
+
+    # Display attributes from each athlete's first medal row
+    _, first_rows = np.unique(row_athlete, return_index=True)
+
+    return Leaderboard(
+        athlete_codes=np.asarray(athlete_codes, dtype=object),
+        athlete_names=df["name"].to_numpy(dtype=object)[first_rows],
+        athlete_countries=df["country"].to_numpy(dtype=object)[first_rows],
+        athlete_disciplines=df["discipline"].to_numpy(dtype=object)[first_rows],
+        row_athlete=row_athlete.astype(np.int64),
+        row_medal=pd.Categorical(df["medal_type"], categories=MEDAL_TYPES).codes.astype(np.int64),
+        row_codes={field: codes.astype(np.int64) for field, codes in row_codes.items()},
+        labels=labels,
+    )
+
+
+def _merge_labels(labels: np.ndarray, values: np.ndarray) -> tuple:
+    """Sorted union of labels and values, with the old labels' positions in it."""
+    merged = np.union1d(labels, values).astype(object)
+    return merged, np.searchsorted(merged, labels)
+
+
+def append_leaderboard(board: Leaderboard, new_rows: pd.DataFrame) -> Leaderboard:
+    """
+    Add appended medallist rows to a leaderboard without re-coding the earlier rows' labels.
+
+    New athlete codes and group labels are merged into the sorted label
+    arrays, earlier row codes are remapped with one lookup, and the new rows
+    are coded and appended.
+
+    Args:
+        board: Leaderboard built from the medallist rows before the append
+        new_rows: The appended medallist rows
+
+    Returns:
+        New Leaderboard, equal to build_leaderboard on all rows
+    """
+    df = new_rows[new_rows["medal_type"].isin(MEDAL_TYPES)]
+    if df.empty:
+        return board
+
+    new_codes = df["code_athlete"].astype(str).to_numpy(dtype=object)
+    athlete_codes, old_positions = _merge_labels(board.athlete_codes, new_codes)
+    new_athletes = np.searchsorted(athlete_codes, new_codes)
+
+    # Display attributes: earlier athletes keep theirs, new ones take their first new row
+    first_athletes, first_rows = np.unique(new_athletes, return_index=True)
+    attributes = {}
+    for attribute, column in [("athlete_names", "name"), ("athlete_countries", "country"), ("athlete_disciplines", "discipline")]:
+        values = np.empty(len(athlete_codes), dtype=object)
+        values[first_athletes] = df[column].to_numpy(dtype=object)[first_rows]
+        values[old_positions] = getattr(board, attribute)
+        attributes[attribute] = values
+
+    row_codes, labels = {}, {}
+    for field in GROUP_FIELDS:
+        values = df[field].fillna("Unknown").to_numpy(dtype=object)
+        labels[field], old_field_positions = _merge_labels(board.labels[field], values)
+        row_codes[field] = np.concatenate([
+            old_field_positions[board.row_codes[field]],
+            np.searchsorted(labels[field], values),
+        ]).astype(np.int64)
+
+    return Leaderboard(
+        athlete_codes=athlete_codes,
+        row_athlete=np.concatenate([old_positions[board.row_athlete], new_athletes]).astype(np.int64),
+        row_medal=np.concatenate([
+            board.row_medal,
+            pd.Categorical(df["medal_type"], categories=MEDAL_TYPES).codes.astype(np.int64),
+        ]),
+        row_codes=row_codes,
+        labels=labels,
+        **attributes,
+    )
@@ -0,0 +1,287 @@
+"""
+Headless multi-session load tester.
+Drives 1_Overview.py and every page in pages/ with Streamlit's AppTest from
+many simulated sessions following scripted sidebar interactions, and reports
+rerun latency percentiles, throughput and per-session memory growth.
+
+AppTest installs a process-wide runtime for each script run, so one process
+executes one run at a time. Each worker process therefore hosts a group of
+sessions whose reruns are interleaved (like sessions sharing one replica and
+its caches), and worker processes run in parallel (like replicas).
+
+Usage:
+    python -m modules.load_test --sessions 20 --steps 5
+    python -m modules.load_test --sessions 40 --workers 4 --pages Overview Global
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import random
+import re
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TIMEOUT = 120  # seconds per script run
+
+
+def list_pages() -> list:
+    """Return the main script and every page script, as absolute paths."""
+    return [os.path.join(PROJECT_DIR, "1_Overview.py")] + sorted(glob.glob(os.path.join(PROJECT_DIR, "pages", "*.py")))
+
+
+def page_name(path: str) -> str:
+    """Short display name of a page script (e.g. "Global_Analysis")."""
+    return re.sub(r"^\d+_(\W*_)?", "", os.path.splitext(os.path.basename(path))[0])
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# -------------------------------------------------------
+# Scripted interactions
+# -------------------------------------------------------
+
+def _sample(rng: random.Random, options: list, low: int, high: int) -> list:
+    return rng.sample(list(options), min(len(options), rng.randint(low, high)))
+
+
+def sidebar_interactions(at) -> list:
+    """
+    List the scripted sidebar interactions available on the current page.
+
+    Widgets are found by label: country, sport and medal multiselects,
+    checkboxes (medal types, genders) and selectboxes (continent).
+
+    Returns:
+        List of callables taking an rng and applying one widget change
+    """
+    actions = []
+    for widget in at.sidebar.multiselect:
+        label = widget.label.lower()
+        if "countr" in label:
+            actions.append(lambda rng, w=widget: w.set_value(_sample(rng, w.options, 0, 3)))
+        elif "sport" in label:
+            actions.append(lambda rng, w=widget: w.set_value(_sample(rng, w.options, 0, 2)))
+        elif "medal" in label:
+            actions.append(lambda rng, w=widget: w.set_value(_sample(rng, w.options, 1, len(w.options))))
+    for widget in at.sidebar.checkbox:
+        actions.append(lambda rng, w=widget: w.set_value(not w.value))
+    for widget in at.sidebar.selectbox:
+        actions.append(lambda rng, w=widget: w.set_value(rng.choice(list(w.options))))
+    return actions
+
+
+# -------------------------------------------------------
+# Worker
+# -------------------------------------------------------
+
+def run_worker(worker_id: int, pages: list, sessions: int, steps: int, seed: int) -> dict:
+    """
+    Run a group of sessions in this process, interleaving their reruns.
+
+    Args:
+        worker_id: Index of the worker (used in the report)
+        pages: Page scripts; sessions are assigned round-robin
+        sessions: Number of sessions hosted by this worker
+        steps: Scripted interactions per session after the initial run
+        seed: Random seed for the interactions
+
+    Returns:
+        Dictionary with per-run records and RSS samples
+    """
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+
+    set_log_level("error")
+    os.chdir(PROJECT_DIR)
+    rng = random.Random(seed + worker_id)
+    records = []
+
+    def timed_run(session_id: int, page: str, kind: str, at):
+        started = time.perf_counter()
+        error = None
+        try:
+            at.run()
+            if at.exception:
+                error = at.exception[0].value
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        records.append({
+            "worker": worker_id,
+            "session": session_id,
+            "page": page_name(page),
+            "kind": kind,
+            "latency_ms": (time.perf_counter() - started) * 1000,
+            "error": error,
+        })
+
+    rss_start = current_rss_mb()
+    started = time.perf_counter()
+
+    # Open every session (first page load)
+    apps = []
+    for session_id in range(sessions):
+        page = pages[(worker_id + session_id) % len(pages)]
+        at = AppTest.from_file(page, default_timeout=DEFAULT_TIMEOUT)
+        timed_run(session_id, page, "initial", at)
+        apps.append((session_id, page, at))
+    rss_samples = [current_rss_mb()]
+
+    # Interleave the scripted interactions, one round = one rerun per session
+    for _ in range(steps):
+        for session_id, page, at in apps:
+            actions = sidebar_interactions(at)
+            if actions:
+                rng.choice(actions)(rng)
+            timed_run(session_id, page, "rerun", at)
+        rss_samples.append(current_rss_mb())
+
+    return {
+        "worker": worker_id,
+        "sessions": sessions,
+        "records": records,
+        "rss_start_mb": rss_start,
+        "rss_samples_mb": rss_samples,
+        "wall_s": time.perf_counter() - started,
+    }
+
+
+# -------------------------------------------------------
+# Report
+# -------------------------------------------------------
+
+def summarize(results: list, wall_s: float) -> dict:
+    """
+    Aggregate worker results into latency, throughput and memory figures.
+
+    Returns:
+        Dictionary with a per-page latency table ("pages"), overall figures
+        ("overall") and per-worker memory ("memory")
+    """
+    df = pd.DataFrame([record for result in results for record in result["records"]])
+    reruns = df[df["kind"] == "rerun"]
+
+    def percentiles(group: pd.DataFrame) -> pd.Series:
+        p50, p95, p99 = np.percentile(group["latency_ms"], [50, 95, 99])
+        return pd.Series({
+            "runs": len(group),
+            "p50_ms": round(p50, 1),
+            "p95_ms": round(p95, 1),
+            "p99_ms": round(p99, 1),
+            "errors": int(group["error"].notna().sum()),
+        })
+
+    pages = df.groupby(["page", "kind"]).apply(percentiles).reset_index()
+    pages[["runs", "errors"]] = pages[["runs", "errors"]].astype(int)
+
+    memory = []
+    for result in results:
+        samples = result["rss_samples_mb"]
+        after_open = samples[0]
+        memory.append({
+            "worker": result["worker"],
+            "sessions": result["sessions"],
+            "rss_start_mb": round(result["rss_start_mb"], 1),
+            "rss_end_mb": round(samples[-1], 1),
+            "mb_per_session": round((after_open - result["rss_start_mb"]) / max(result["sessions"], 1), 2),
+            # Growth per interaction round once every session is open; steady growth hints at a leak
+            "mb_per_round": round(float(np.polyfit(range(len(samples)), samples, 1)[0]), 2) if len(samples) > 1 else 0.0,
+        })
+
+    overall = {
+        "sessions": int(sum(result["sessions"] for result in results)),
+        "workers": len(results),
+        "runs": int(len(df)),
+        "errors": int(df["error"].notna().sum()),
+        "throughput_runs_per_s": round(len(df) / wall_s, 2),
+    }
+    if not reruns.empty:
+        p50, p95, p99 = np.percentile(reruns["latency_ms"], [50, 95, 99])
+        overall.update({"rerun_p50_ms": round(p50, 1), "rerun_p95_ms": round(p95, 1), "rerun_p99_ms": round(p99, 1)})
+
+    return {"pages": pages, "overall": overall, "memory": pd.DataFrame(memory)}
+
+
+def run_load_test(sessions: int, workers: int = 1, steps: int = 5, pages: list = None, seed: int = 0) -> dict:
+    """
+    Run the load test and return its summary (see summarize).
+
+    Args:
+        sessions: Total number of simulated sessions
+        workers: Worker processes; sessions are split evenly between them
+        steps: Scripted interactions per session
+        pages: Page scripts to drive (default: every page)
+        seed: Random seed
+    """
+    pages = pages or list_pages()
+    per_worker = [sessions // workers + (1 if w < sessions % workers else 0) for w in range(workers)]
+
+    started = time.perf_counter()
+    if workers == 1:
+        results = [run_worker(0, pages, sessions, steps, seed)]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = [
+                executor.submit(run_worker, w, pages, n, steps, seed)
+                for w, n in enumerate(per_worker) if n > 0
+            ]
+            results = [future.result() for future in futures]
+    return summarize(results, time.perf_counter() - started)
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point; returns 1 when any script run raised."""
+    parser = argparse.ArgumentParser(description="Headless multi-session load test of the dashboard pages.")
+    parser.add_argument("--sessions", type=int, default=10, help="Total simulated sessions")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (replicas)")
+    parser.add_argument("--steps", type=int, default=5, help="Scripted interactions per session")
+    parser.add_argument("--pages", nargs="+", help="Only pages whose file name contains one of these")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--json", help="Also write the summary to this JSON file")
+    args = parser.parse_args(argv)
+
+    pages = list_pages()
+    if args.pages:
+        pages = [page for page in pages if any(p in os.path.basename(page) for p in args.pages)]
+    if not pages:
+        print("No page matches --pages", file=sys.stderr)
+        return 1
+
+    summary = run_load_test(args.sessions, args.workers, args.steps, pages, args.seed)
+
+    print(summary["pages"].to_string(index=False))
+    print()
+    print(summary["memory"].to_string(index=False))
+    print()
+    for key, value in summary["overall"].items():
+        print(f"{key}: {value}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "overall": summary["overall"],
+                "pages": summary["pages"].to_dict(orient="records"),
+                "memory": summary["memory"].to_dict(orient="records"),
+            }, f, indent=2)
+
+    return 1 if summary["overall"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Medal timeline module for the day-by-day medal race.
+Precomputes a day × country × medal type tensor once so that picking a day
+is array indexing instead of re-aggregating the medals table.
+"""
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+MEDAL_TYPES = ["Gold Medal", "Silver Medal", "Bronze Medal"]
+
+MEDAL_COLORS = {
+    "Gold Medal": "gold",
+    "Silver Medal": "silver",
+    "Bronze Medal": "#cd7f32",
+}
+
+
+@dataclass(frozen=True)
+class MedalTimeline:
+    """Daily and cumulative medal counts indexed by (day, country, medal type)."""
+    days: list
+    countries: np.ndarray
+    medal_types: list
+    daily: np.ndarray
+    cumulative: np.ndarray
+    fingerprint: str
+
+    def day_index(self, day) -> int:
+        """Return the position of a date on the day axis."""
+        return (day - self.days[0]).days
+
+    def day_frame(self, day, cumulative: bool = False) -> pd.DataFrame:
+        """
+        Long-format medal counts for one day, ready for plotting.
+
+        Args:
+            day: Date on the day axis
+            cumulative: Return running totals up to the day instead of that day only
+
+        Returns:
+            DataFrame with country, medal_type and count columns (non-zero rows only)
+        """
+        counts = (self.cumulative if cumulative else self.daily)[self.day_index(day)]
+        country_idx, medal_idx = np.nonzero(counts)
+        return pd.DataFrame({
+            "country": self.countries[country_idx],
+            "medal_type": np.asarray(self.medal_types)[medal_idx],
+            "count": counts[country_idx, medal_idx],
+        })
+
+
+def _valid_medal_rows(df_medals: pd.DataFrame) -> tuple:
+    """Normalized medal days and the mask of rows usable in the timeline."""
+    medal_days = pd.to_datetime(df_medals["medal_date"]).dt.normalize()
+    valid = medal_days.notna() & df_medals["country"].notna() & df_medals["medal_type"].isin(MEDAL_TYPES)
+    return medal_days[valid], valid
+
+
+def _timeline(days: pd.DatetimeIndex, countries: np.ndarray, daily: np.ndarray) -> MedalTimeline:
+    return MedalTimeline(
+        days=[d.date() for d in days],
+        countries=np.asarray(countries, dtype=object),
+        medal_types=list(MEDAL_TYPES),
+        daily=daily,
+        cumulative=np.cumsum(daily, axis=0, dtype=np.int32),
+        fingerprint=hashlib.md5(daily.tobytes() + "|".join(countries).encode()).hexdigest(),
+    )
+
+
+def build_medal_timeline(df_medals: pd.DataFrame) -> MedalTimeline:
+    """
+    Build the day × country × medal type tensor from the medals table.
+
+    Args:
+        df_medals: Medals data with medal_date, country and medal_type columns
+
+    Returns:
+        MedalTimeline covering every calendar day between the first and last
+        medal (no days before the first medal is awarded)
+    """
+    medal_days, valid = _valid_medal_rows(df_medals)
+    if not valid.any():
+        return _timeline(pd.DatetimeIndex([]), np.array([], dtype=object),
+                         np.zeros((0, 0, len(MEDAL_TYPES)), dtype=np.int32))
+
+    first_day = medal_days.min()
+    all_days = pd.date_range(first_day, medal_days.max(), freq="D")
+    day_codes = (medal_days - first_day).dt.days.to_numpy()
+
+    country_codes, countries = pd.factorize(df_medals.loc[valid, "country"], sort=True)
+    medal_codes = pd.Categorical(df_medals.loc[valid, "medal_type"], categories=MEDAL_TYPES).codes
+
+    shape = (len(all_days), len(countries), len(MEDAL_TYPES))
+    flat_index = np.ravel_multi_index((day_codes, country_codes, medal_codes), shape)
+    daily = np.bincount(flat_index, minlength=int(np.prod(shape))).reshape(shape).astype(np.int32)
+    return _timeline(all_days, countries, daily)
+
+
+def append_medal_timeline(timeline: MedalTimeline, new_rows: pd.DataFrame) -> MedalTimeline:
+    """
+    Add appended medal rows to a timeline without re-reading the earlier rows.
+
+    The day and country axes are widened to cover the new rows, the existing
+    counts are copied into place and the new medals are added on top.
+
+    Args:
+        timeline: Timeline built from the medal rows before the append
+        new_rows: The appended medal rows
+
+    Returns:
+        New MedalTimeline, equal to build_medal_timeline on all rows
+    """
+    medal_days, valid = _valid_medal_rows(new_rows)
+    if not valid.any():
+        return timeline
+    if not timeline.days:
+        return build_medal_timeline(new_rows)
+
+    old_first = pd.Timestamp(timeline.days[0])
+    first_day = min(old_first, medal_days.min())
+    last_day = max(pd.Timestamp(timeline.days[-1]), medal_days.max())
+    all_days = pd.date_range(first_day, last_day, freq="D")
+    countries = np.union1d(timeline.countries, new_rows.loc[valid, "country"].to_numpy(dtype=object))
+
+    shape = (len(all_days), len(countries), len(MEDAL_TYPES))
+    daily = np.zeros(shape, dtype=np.int32)
+    day_offset = (old_first - first_day).days
+    country_positions = np.searchsorted(countries, timeline.countries)
+    daily[day_offset:day_offset + len(timeline.days), country_positions] = timeline.daily
+
+    day_codes = (medal_days - first_day).dt.days.to_numpy()
+    country_codes = np.searchsorted(countries, new_rows.loc[valid, "country"].to_numpy(dtype=object))
+    medal_codes = pd.Categorical(new_rows.loc[valid, "medal_type"], categories=MEDAL_TYPES).codes
+    np.add.at(daily, (day_codes, country_codes, medal_codes), 1)
+    return _timeline(all_days, countries, daily)
+
+
+def build_schedule_day_index(df_schedule: pd.DataFrame) -> dict:
+    """
+    Map each calendar day to the row positions of events starting that day.
+
+    Args:
+        df_schedule: Schedule data with a datetime start_date column
+
+    Returns:
+        Dictionary mapping datetime.date to an array of row positions
+    """
+    days = pd.to_datetime(df_schedule["start_date"]).dt.date
+    return days.groupby(days).indices
+
+
+def build_medal_race_frames(timeline: MedalTimeline, top_n: int = 10) -> list:
+    """
+    Build the top-N standings for every day of the Games.
+
+    Countries are ranked like the official medal table (gold, then silver,
+    then bronze) on the cumulative counts of each day.
+
+    Returns:
+        List of (day, countries, counts) tuples where counts is (top_n, 3)
+    """
+    frames = []
+    for i, day in enumerate(timeline.days):
+        cumulative = timeline.cumulative[i]
+        # Lexicographic ranking: np.lexsort uses the last key as primary
+        order = np.lexsort((cumulative[:, 2], cumulative[:, 1], cumulative[:, 0]))[::-1][:top_n]
+        order = order[cumulative[order].sum(axis=1) > 0]
+        frames.append((day, timeline.countries[order], cumulative[order]))
+    return frames
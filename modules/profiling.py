@@ -0,0 +1,236 @@
+"""
+Per-section profiling for components and data loaders.
+Records wall time, rows in/out, figure payload bytes and st.cache_data
+hit/miss for every profiled call, keeps them in a process-wide ring buffer
+and exports them as JSON lines or Prometheus text.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque, defaultdict
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+
+import pandas as pd
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+# Set LA28_PROFILING=0 to skip instrumentation entirely (decorators become no-ops)
+PROFILING_ENABLED = os.environ.get("LA28_PROFILING", "1") != "0"
+
+# Optional path of a JSON lines file every record is appended to
+PROFILE_LOG_PATH = os.environ.get("LA28_PROFILE_LOG")
+
+DEFAULT_MAX_RECORDS = 5000
+
+
+@dataclass
+class SectionRecord:
+    """Timing and payload figures of one profiled call."""
+    seq: int
+    timestamp: float
+    session_id: Optional[str]
+    kind: str
+    name: str
+    wall_ms: float = 0.0
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+    figure_bytes: int = 0
+    cache: Optional[str] = None
+    error: Optional[str] = None
+
+
+def count_rows(value) -> Optional[int]:
+    """Count rows in a DataFrame/Series (or the frames inside a tuple/list), else None."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        counts = [count_rows(item) for item in value]
+        counts = [c for c in counts if c is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+class Profiler:
+    """Thread-safe store of section records plus running totals for monitoring."""
+
+    def __init__(self, max_records: int = DEFAULT_MAX_RECORDS, log_path: str = None):
+        self.log_path = log_path
+        self._records = deque(maxlen=max_records)
+        self._totals = defaultdict(lambda: defaultdict(float))
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._local = threading.local()
+
+    def _stack(self) -> list:
+        """Records of the profiled calls currently running on this thread."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def current(self) -> Optional[SectionRecord]:
+        """Return the innermost profiled call running on this thread, if any."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def running(self) -> list:
+        """Return the profiled calls running on this thread, outermost first."""
+        return list(self._stack())
+
+    def start(self, kind: str, name: str, rows_in: Optional[int]) -> SectionRecord:
+        """Open a record for a call and make it the current one on this thread."""
+        ctx = get_script_run_ctx(suppress_warning=True)
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        record = SectionRecord(
+            seq=seq,
+            timestamp=time.time(),
+            session_id=ctx.session_id if ctx else None,
+            kind=kind,
+            name=name,
+            rows_in=rows_in,
+        )
+        self._stack().append(record)
+        return record
+
+    def finish(self, record: SectionRecord, started: float):
+        """Close a record, store it and update the running totals."""
+        record.wall_ms = (time.perf_counter() - started) * 1000
+        stack = self._stack()
+        if stack and stack[-1] is record:
+            stack.pop()
+
+        with self._lock:
+            self._records.append(record)
+            totals = self._totals[(record.kind, record.name)]
+            totals["calls"] += 1
+            totals["seconds"] += record.wall_ms / 1000
+            totals["figure_bytes"] += record.figure_bytes
+            totals["rows_out"] += record.rows_out or 0
+            if record.cache:
+                totals[f"cache_{record.cache}"] += 1
+            if record.error:
+                totals["errors"] += 1
+
+        if self.log_path:
+            with open(self.log_path, "a", encoding="utf-8") as log:
+                log.write(json.dumps(asdict(record)) + "\n")
+
+    def records(self, session_id: str = None, since: int = 0) -> list:
+        """Return stored records, optionally for one session and after a sequence number."""
+        with self._lock:
+            records = list(self._records)
+        return [
+            r for r in records
+            if r.seq > since and (session_id is None or r.session_id == session_id)
+        ]
+
+    def clear(self):
+        """Drop every record and running total."""
+        with self._lock:
+            self._records.clear()
+            self._totals.clear()
+
+    def to_jsonl(self, records: list = None) -> str:
+        """Serialize records (default: all stored) as JSON lines."""
+        records = self.records() if records is None else records
+        return "".join(json.dumps(asdict(r)) + "\n" for r in records)
+
+    def to_prometheus(self) -> str:
+        """Render the running totals in the Prometheus text exposition format."""
+        metrics = [
+            ("la28_section_calls_total", "counter", "Profiled calls", "calls"),
+            ("la28_section_seconds_total", "counter", "Wall time spent in profiled calls", "seconds"),
+            ("la28_section_figure_bytes_total", "counter", "Plotly figure JSON bytes emitted", "figure_bytes"),
+            ("la28_section_rows_out_total", "counter", "Rows returned by profiled calls", "rows_out"),
+            ("la28_cache_hits_total", "counter", "st.cache_data hits of profiled loaders", "cache_hit"),
+            ("la28_cache_misses_total", "counter", "st.cache_data misses of profiled loaders", "cache_miss"),
+            ("la28_section_errors_total", "counter", "Profiled calls that raised", "errors"),
+        ]
+        with self._lock:
+            totals = {key: dict(values) for key, values in self._totals.items()}
+
+        lines = []
+        for metric, metric_type, help_text, field in metrics:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {metric_type}")
+            for (kind, name), values in sorted(totals.items()):
+                value = values.get(field, 0)
+                lines.append(f'{metric}{{kind="{kind}",name="{name}"}} {value:g}')
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide profiler shared by every session
+PROFILER = Profiler(log_path=PROFILE_LOG_PATH)
+
+
+def profiled(kind: str = "component") -> Callable:
+    """
+    Decorator recording wall time, rows in/out and figure bytes of each call.
+
+    Args:
+        kind: Record category, e.g. "component" for render_* functions or
+            "loader" for load_* functions
+
+    Returns:
+        Decorator; a no-op when LA28_PROFILING=0
+    """
+    def decorator(fn: Callable) -> Callable:
+        if not PROFILING_ENABLED:
+            return fn
+
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            rows_in = count_rows(list(args) + list(kwargs.values()))
+            record = PROFILER.start(kind, name, rows_in)
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+                record.rows_out = count_rows(result)
+                if kind == "loader" and record.cache is None:
+                    record.cache = "hit"
+                return result
+            except Exception as e:
+                record.error = type(e).__name__
+                raise
+            finally:
+                PROFILER.finish(record, started)
+
+        return wrapper
+
+    return decorator
+
+
+def cache_probe(fn: Callable) -> Callable:
+    """
+    Mark the running profiled loader calls as cache misses whenever fn's body runs.
+
+    Place it under @st.cache_data (or around any build that only runs when
+    its result is not cached), on a function called from (or itself
+    decorated with) @profiled("loader"): the body only runs on a miss, so
+    any loader call that does not reach it is a hit. Every loader call on
+    the thread's stack is marked, since each of them waited for the build.
+    """
+    if not PROFILING_ENABLED:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for record in PROFILER.running():
+            if record.kind == "loader":
+                record.cache = "miss"
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def record_figure_bytes(size: int):
+    """Attribute a figure's serialized size to the current profiled call."""
+    record = PROFILER.current()
+    if record is not None:
+        record.figure_bytes += size
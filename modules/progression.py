@@ -0,0 +1,304 @@
+"""
+Event progression engine.
+Builds, from the results files, how every event progressed through its rounds
+(heats → semi-finals → final, group play → knockout rounds, ...). Each
+stage_code encodes the event, the round (phase) and the unit (heat, race,
+group or match) of a result row. The index sorts all rows by event and round
+order, and precomputes the rounds and round-to-round flows of every event and,
+per row, the next round its participant reached. Assembling one event is then
+slicing contiguous blocks of these tables.
+"""
+import os
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+# stage_code layout: event code (22 chars, padded with "-"), phase (4), unit (4), suffix
+EVENT_CODE_WIDTH = 22
+PHASE_WIDTH = 4
+
+# Phase of the overall standings rows ("Final Results"); not a round of the event
+STANDINGS_PHASE = "----"
+
+# Group play phases (GPA-, GPB-, ...) are the groups of one round
+GROUP_PHASE = re.compile(r"^GP[A-Z]?-?$")
+GROUP_ROUND = "GP"
+
+# Rank of each phase in an event, earliest first. Phases not listed (combined
+# events disciplines, equestrian tests, omnium races, ...) rank as OTHER_PHASE_RANK.
+PHASE_RANKS = {
+    "QUAL": 0, "RANK": 0, "PREL": 1, "HEAT": 2, GROUP_ROUND: 4,
+    "R128": 10, "R64-": 11, "R32-": 12, "8FNL": 13, "QFNL": 14,
+    "SF5-": 15, "SF9-": 15, "SFNL": 16, "REPF": 17, "FNL-": 18,
+}
+# Numbered rounds (RND1, RND2, ...) rank 3.1, 3.2, ...
+NUMBERED_ROUND = re.compile(r"^RND(\d)$")
+OTHER_PHASE_RANK = 5
+
+# Repechage and lucky loser rounds come right after the latest ranked round
+# their participants played before them (or, failing dates, all played):
+# after the heats in rowing, the quarterfinals in judo, each elimination
+# round in track sprint, ...
+REPECHAGE_PHASES = ("REP-", "REP1", "REP2", "REP3", "LL--")
+
+# Trailing unit designations stripped from stage names to name a round
+UNIT_SUFFIX = re.compile(r"\s*[-–]\s*(Heat|Race|Group|Match|Bout|Game|Pool|Run)\b.*$")
+
+RESULT_COLUMNS = [
+    "event_code", "event_name", "discipline_name", "gender", "stage_code", "stage", "date",
+    "participant_code", "participant_name", "participant_type", "participant_country",
+    "rank", "result", "result_type", "result_diff", "result_WLT", "qualification_mark",
+]
+
+
+def read_results(paths: list) -> pd.DataFrame:
+    """Read results partition files (CSV or Parquet) into one frame of RESULT_COLUMNS."""
+    frames = []
+    for path in paths:
+        df = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path, dtype={"result": str})
+        frames.append(df.reindex(columns=RESULT_COLUMNS))
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def round_name(stage_names: list) -> str:
+    """Name of a round from the stage names of its units ("Semi-Final 1", "Semi-Final 2" -> "Semi-Final")."""
+    names = sorted(set(stage_names))
+    if len(names) == 1:
+        return UNIT_SUFFIX.sub("", names[0]) or names[0]
+    prefix = os.path.commonprefix(names)
+    cleaned = UNIT_SUFFIX.sub("", prefix.rstrip(" -–:0123456789")).strip()
+    if cleaned:
+        return cleaned
+    return " / ".join(names) if len(names) <= 3 else names[0]
+
+
+@dataclass(frozen=True)
+class EventProgression:
+    """
+    The rounds of one event and how its participants moved through them.
+
+    Attributes:
+        event_code: Event code (e.g. "ATHM100M")
+        event_name: Event name
+        rounds: One row per round in order: round_code, order, round_name,
+            start, units and participants
+        edges: Round-to-round flows: from_round, to_round, participants
+        rows: Result rows of the event's rounds, in round order
+        standings: Overall standings rows ("Final Results"), possibly empty
+    """
+    event_code: str
+    event_name: str
+    rounds: pd.DataFrame
+    edges: pd.DataFrame
+    rows: pd.DataFrame
+    standings: pd.DataFrame
+
+    def participant_path(self, participant_code: str) -> pd.DataFrame:
+        """Rows of one participant, round by round."""
+        return self.rows[self.rows["participant_code"] == participant_code]
+
+    def qualifiers(self, round_code: str = None) -> pd.DataFrame:
+        """
+        How the participants of a round got there.
+
+        Args:
+            round_code: Round to explain (default: the last round, usually the final)
+
+        Returns:
+            One row per participant of the round, with their rank, result and
+            qualification mark in every earlier round (columns
+            "<round name> rank", "... result", "... mark"), ordered by their
+            rank in the round
+        """
+        if self.rounds.empty:
+            return pd.DataFrame()
+        round_code = round_code or self.rounds["round_code"].iloc[-1]
+        order = self.rounds.set_index("round_code")["order"]
+        target = self.rows[self.rows["round_code"] == round_code]
+        participants = target.drop_duplicates("participant_code").set_index("participant_code")
+        earlier = self.rows[
+            self.rows["participant_code"].isin(participants.index)
+            & (self.rows["round_order"] < order[round_code])
+        ]
+        # Group play has several rows per participant and round: keep the best rank
+        earlier = earlier.sort_values("rank", kind="stable").drop_duplicates(["participant_code", "round_code"])
+
+        table = participants[["participant_name", "participant_country", "rank", "result"]].copy()
+        for code, label in self.rounds[["round_code", "round_name"]].itertuples(index=False):
+            if order[code] >= order[round_code]:
+                break
+            round_rows = earlier[earlier["round_code"] == code].set_index("participant_code")
+            table[f"{label} rank"] = round_rows["rank"].reindex(table.index)
+            table[f"{label} result"] = round_rows["result"].reindex(table.index)
+            # Qualification mark (Q, q, ...), or the match outcome in knockout rounds
+            table[f"{label} mark"] = round_rows["qualification_mark"].fillna(round_rows["result_WLT"]).reindex(table.index)
+        return table.sort_values("rank", kind="stable").reset_index()
+
+
+def contiguous_ranges(codes: np.ndarray) -> dict:
+    """(start, stop) positions of each run of equal codes in a sorted array."""
+    if not len(codes):
+        return {}
+    boundaries = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    starts = np.concatenate([[0], boundaries])
+    stops = np.concatenate([boundaries, [len(codes)]])
+    return {codes[a]: (int(a), int(b)) for a, b in zip(starts, stops)}
+
+
+@dataclass(frozen=True)
+class ProgressionIndex:
+    """
+    Result rows, rounds and round-to-round flows of every event, each sorted by event.
+
+    Attributes:
+        rows: Result rows with round_code, round_order, round_name, unit,
+            start and next_round (the participant's next round in the event, if any)
+        rounds: One row per event and round (see EventProgression.rounds)
+        edges: One row per event and round-to-round flow (see EventProgression.edges)
+        ranges: Dictionary mapping each event code to its (start, stop)
+            positions in rows, rounds and edges
+        events: One row per event: event_code, event_name, discipline_name, gender
+    """
+    rows: pd.DataFrame
+    rounds: pd.DataFrame
+    edges: pd.DataFrame
+    ranges: dict
+    events: pd.DataFrame
+
+    def event(self, event_code: str) -> EventProgression:
+        """
+        Assemble the progression of one event by slicing the precomputed tables.
+
+        Raises:
+            KeyError: Unknown event code
+        """
+        (row_start, row_stop), (round_start, round_stop), (edge_start, edge_stop) = self.ranges[event_code]
+        block = self.rows.iloc[row_start:row_stop]
+        is_standings = (block["round_code"] == STANDINGS_PHASE).to_numpy()
+        return EventProgression(
+            event_code=event_code,
+            event_name=block["event_name"].iloc[0],
+            rounds=self.rounds.iloc[round_start:round_stop].drop(columns="event_code").reset_index(drop=True),
+            edges=self.edges.iloc[edge_start:edge_stop].drop(columns="event_code").reset_index(drop=True),
+            rows=block[~is_standings],
+            standings=block[is_standings],
+        )
+
+    def events_for(self, discipline: str) -> pd.DataFrame:
+        """Events of one discipline, by name."""
+        return self.events[self.events["discipline_name"] == discipline].sort_values("event_name")
+
+
+def _phase_ranks(df: pd.DataFrame) -> pd.Series:
+    """Rank of each row's round in its event (see PHASE_RANKS); standings rank last."""
+    codes = df["round_code"]
+    ranks = codes.map(PHASE_RANKS).astype("float64")
+    numbered = codes.str.extract(NUMBERED_ROUND, expand=False).astype("float64")
+    ranks = ranks.fillna(3 + numbered / 10)
+    repechage = codes.isin(REPECHAGE_PHASES)
+    ranks = ranks.mask(repechage | ranks.isna() & (codes != STANDINGS_PHASE), OTHER_PHASE_RANK)
+    ranks = ranks.mask(codes == STANDINGS_PHASE, np.inf)
+
+    if repechage.any():
+        # Ranked rounds each repechage participant played before their
+        # repechage unit; a repechage leads to the bronze contests and finals,
+        # never follows them
+        keys = ["event_code", "participant_code"]
+        ranked = df.loc[~repechage & (codes != STANDINGS_PHASE), keys + ["start"]].assign(rank=ranks)
+        ranked = ranked[(ranked["rank"] != OTHER_PHASE_RANK) & (ranked["rank"] < PHASE_RANKS["REPF"])]
+        entrants = df.loc[repechage].groupby(keys + ["round_code"], as_index=False)["start"].min()
+        played = entrants.merge(ranked, on=keys, suffixes=("", "_played"))
+        before = played[played["start_played"] <= played["start"]]
+        # Timestamps that run backwards leave nothing before: fall back to
+        # the latest ranked round all participants played
+        everyone = played.groupby(["event_code", "round_code", "rank"])["participant_code"].nunique().rename("played")
+        everyone = everyone.reset_index().join(
+            entrants.groupby(["event_code", "round_code"]).size().rename("entrants"), on=["event_code", "round_code"])
+        everyone = everyone[everyone["played"] == everyone["entrants"]]
+        feeder = before.groupby(["event_code", "round_code"])["rank"].max().combine_first(
+            everyone.groupby(["event_code", "round_code"])["rank"].max()) + 0.5
+        repechage_ranks = pd.MultiIndex.from_frame(df.loc[repechage, ["event_code", "round_code"]]).map(feeder.to_dict().get)
+        ranks[repechage] = pd.Series(repechage_ranks, index=ranks[repechage].index, dtype="float64").fillna(OTHER_PHASE_RANK)
+    return ranks
+
+
+def build_progression_index(results: pd.DataFrame) -> ProgressionIndex:
+    """
+    Build the progression index of all events in one vectorized pass.
+
+    Rounds are ordered by phase (see PHASE_RANKS), then by the start of their
+    first unit, since the timestamps of the results tie or run backwards
+    between rounds. Group play phases (GPA-, GPB-, ...) form one round. The overall standings rows keep the
+    round code "----" and are left out of the round order and flows.
+
+    Args:
+        results: Result rows (see read_results)
+
+    Returns:
+        ProgressionIndex
+    """
+    df = results.reset_index(drop=True)
+    phase = df["stage_code"].str.slice(EVENT_CODE_WIDTH, EVENT_CODE_WIDTH + PHASE_WIDTH)
+    df["round_code"] = phase.where(~phase.str.match(GROUP_PHASE.pattern), GROUP_ROUND)
+    df["unit"] = df["stage_code"].str.slice(EVENT_CODE_WIDTH)
+    df["start"] = pd.to_datetime(df["date"], utc=True, errors="coerce")
+
+    # Round order within each event: by phase, then first start (missing
+    # dates last), standings last
+    df["phase_rank"] = _phase_ranks(df)
+    df["round_start"] = df.groupby(["event_code", "round_code"])["start"].transform("min")
+    df = df.sort_values(
+        ["event_code", "phase_rank", "round_start", "round_code", "unit", "rank"],
+        kind="stable",
+        na_position="last",
+        ignore_index=True,
+    )
+    new_round = (df["event_code"] != df["event_code"].shift()) | (df["round_code"] != df["round_code"].shift())
+    df["round_order"] = new_round.astype(int).groupby(df["event_code"]).cumsum() - 1
+    df = df.drop(columns=["phase_rank", "round_start"])
+
+    # Rounds of every event, in order
+    round_rows = df[df["round_code"] != STANDINGS_PHASE]
+    grouped = round_rows.groupby(["event_code", "round_code"], sort=False)
+    rounds = pd.DataFrame({
+        "order": grouped["round_order"].first(),
+        "round_name": grouped["stage"].agg(lambda s: round_name(s.unique().tolist())),
+        "start": grouped["start"].min(),
+        "units": grouped["stage_code"].nunique(),
+        "participants": grouped["participant_code"].nunique(),
+    }).reset_index()
+    df["round_name"] = df.merge(rounds[["event_code", "round_code", "round_name"]], how="left",
+                                on=["event_code", "round_code"])["round_name"].values
+
+    # Next round reached by each participant (None after their last round)
+    firsts = round_rows.drop_duplicates(["event_code", "participant_code", "round_code"])[
+        ["event_code", "participant_code", "round_code"]
+    ]
+    firsts = firsts.assign(next_round=firsts.groupby(["event_code", "participant_code"], sort=False)["round_code"].shift(-1))
+    df["next_round"] = df.merge(firsts, how="left", on=["event_code", "participant_code", "round_code"])["next_round"].values
+
+    # Round-to-round flows, in the order of the rounds they leave
+    edges = (
+        firsts.dropna(subset=["next_round"])
+        .groupby(["event_code", "round_code", "next_round"], sort=False)
+        .size()
+        .reset_index(name="participants")
+        .rename(columns={"round_code": "from_round", "next_round": "to_round"})
+    )
+
+    row_ranges = contiguous_ranges(df["event_code"].to_numpy())
+    round_ranges = contiguous_ranges(rounds["event_code"].to_numpy())
+    edge_ranges = contiguous_ranges(edges["event_code"].to_numpy())
+    empty = (0, 0)
+    ranges = {
+        code: (rows, round_ranges.get(code, empty), edge_ranges.get(code, empty))
+        for code, rows in row_ranges.items()
+    }
+
+    events = df.drop_duplicates("event_code")[["event_code", "event_name", "discipline_name", "gender"]].reset_index(drop=True)
+    return ProgressionIndex(df, rounds, edges, ranges, events)
@@ -0,0 +1,106 @@
+"""
+Progressive page rendering.
+Heavy sections get a placeholder as soon as the page lays out, cheap KPIs
+paint first, and the heavy sections then stream into their placeholders.
+The heavy work of a section (loading data, simulating, building figures)
+can run on a background executor; Streamlit elements are only ever written
+from the script thread, as each section's work finishes.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+# Set LA28_PROGRESSIVE_RENDER=0 to prepare deferred sections sequentially
+PROGRESSIVE_RENDER = os.environ.get("LA28_PROGRESSIVE_RENDER", "1") != "0"
+
+DEFAULT_MAX_WORKERS = 4
+
+
+class ProgressiveRenderer:
+    """
+    Collects deferred sections of a page and renders them after the cheap ones.
+
+    A section's prepare callable runs on the background executor and must
+    not call Streamlit elements, since Streamlit does not support writing
+    elements from other threads; the section's render function then runs on
+    the script thread with the result. Sections without a prepare callable
+    render on the script thread while the others are being prepared.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, enabled: bool = None):
+        self.max_workers = max_workers
+        self.enabled = PROGRESSIVE_RENDER if enabled is None else enabled
+        self._sections = []
+
+    def defer(self, render_fn: Callable, *args, label: str = "Loading chart...", prepare: Callable = None, **kwargs):
+        """
+        Reserve a placeholder at the current position and defer the section.
+
+        Args:
+            render_fn: Component render function to run later
+            *args, **kwargs: Arguments for render_fn
+            label: Text shown in the placeholder until the section is ready
+            prepare: Optional callable without arguments doing the section's
+                heavy work off the script thread (no Streamlit elements); its
+                result is passed to render_fn before *args
+        """
+        placeholder = st.empty()
+        placeholder.caption(f"⏳ {label}")
+        self._sections.append((placeholder, render_fn, args, kwargs, prepare))
+
+    def run(self):
+        """Render every deferred section, streaming each one in as it completes."""
+        sections, self._sections = self._sections, []
+        prepared = [section for section in sections if section[4] is not None]
+        if not self.enabled or not prepared:
+            for section in sections:
+                self._render_section(section, self._prepare(section))
+            return
+
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="la28-render") as executor:
+            futures = {executor.submit(self._prepare_in_thread, ctx, section): section for section in prepared}
+            for section in sections:
+                if section[4] is None:
+                    self._render_section(section, (None, None))
+            for future in as_completed(futures):
+                self._render_section(futures[future], future.result())
+
+    def _prepare_in_thread(self, ctx, section: tuple) -> tuple:
+        """
+        Prepare a section on a worker thread.
+
+        The worker carries the session's script context so the loaders see
+        the session's caches and pinned snapshot; it writes no elements.
+        """
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return self._prepare(section)
+
+    @staticmethod
+    def _prepare(section: tuple) -> tuple:
+        """(result, error) of a section's prepare callable; (None, None) without one."""
+        prepare = section[4]
+        if prepare is None:
+            return None, None
+        try:
+            return prepare(), None
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def _render_section(section: tuple, prepared: tuple):
+        """Render one section into its placeholder, keeping errors local to it."""
+        placeholder, render_fn, args, kwargs, prepare = section
+        result, error = prepared
+        try:
+            if error is not None:
+                raise error
+            with placeholder.container():
+                render_fn(*((result,) if prepare is not None else ()), *args, **kwargs)
+        except Exception as e:
+            placeholder.error(f"❌ Could not render {render_fn.__name__}: {e}")
@@ -0,0 +1,295 @@
+"""
+Monte-Carlo medal projection.
+Projects the medal table of the next Games from the last one with results
+(see modules.editions.projection_edition). Each event's
+participants are ordered by how far they got (medallists.csv first, then the
+overall standings, the last round reached and their rank or outcome in it),
+and their position gives their strength. A trial draws every event's finishing
+order from a Plackett-Luce model (Gumbel top-k: strength plus Gumbel noise,
+best scores first) and hands out the event's medals, as many of each type as
+the event awarded. Trials are vectorized per event and run in blocks spread
+over worker processes; block seeds are spawned from one seed, so a projection
+is reproducible whatever the number of workers.
+
+Usage:
+    python -m modules.projection --trials 20000 --seed 0 --top 15
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+if __name__ == "__main__":
+    from streamlit.logger import set_log_level
+
+    # The CLI reads the data outside a script run; silence the bare-mode warnings
+    set_log_level("error")
+
+from modules.progression import STANDINGS_PHASE, ProgressionIndex
+
+
+MEDAL_TYPES = ["Gold Medal", "Silver Medal", "Bronze Medal"]
+
+# Strength of the participant in position p is p ** -STRENGTH_EXPONENT:
+# higher values make the last Games' results more likely to repeat
+STRENGTH_EXPONENT = 1.5
+
+DEFAULT_TRIALS = 20_000
+
+# Trials per block; a block is one unit of work with its own seed
+BLOCK_TRIALS = 2_500
+
+# Set LA28_PROJECTION_WORKERS to cap the worker processes of a projection
+PROJECTION_WORKERS = int(os.environ.get("LA28_PROJECTION_WORKERS", os.cpu_count() or 1))
+
+# Projected medal counts are reported with this central interval
+DEFAULT_INTERVAL = 0.9
+
+# Seed of the projection shown in the dashboard
+PROJECTION_SEED = int(os.environ.get("LA28_PROJECTION_SEED", "0"))
+
+
+@dataclass(frozen=True)
+class ProjectionModel:
+    """
+    Participants and medals of every event, as flat arrays.
+
+    Attributes:
+        event_codes: Event codes, in model order
+        offsets: Event i's participants are positions offsets[i]:offsets[i + 1], best first
+        log_strength: Log strength per participant
+        country: Country position per participant
+        countries: Country names, by position
+        slot_offsets: Event i's medals are slot_medals[slot_offsets[i]:slot_offsets[i + 1]]
+        slot_medals: Medal type (index in MEDAL_TYPES) per finishing position, best first
+    """
+    event_codes: np.ndarray
+    offsets: np.ndarray
+    log_strength: np.ndarray
+    country: np.ndarray
+    countries: np.ndarray
+    slot_offsets: np.ndarray
+    slot_medals: np.ndarray
+
+
+def build_projection_model(progression: ProgressionIndex, medallists: pd.DataFrame) -> ProjectionModel:
+    """
+    Order the participants of every event and derive their strength.
+
+    Args:
+        progression: Event progression index (see modules.progression)
+        medallists: Medallists (as in medallists.csv)
+
+    Returns:
+        ProjectionModel
+    """
+    rows = progression.rows
+    events = progression.events
+    is_standings = rows["round_code"] == STANDINGS_PHASE
+    rounds = rows[~is_standings]
+
+    # How far each participant got: last round reached, best rank and any win there
+    last = rounds[rounds["round_order"] == rounds.groupby(["event_code", "participant_code"])["round_order"].transform("max")]
+    entrants = last.assign(won=last["result_WLT"] == "W").groupby(["event_code", "participant_code"], as_index=False).agg(
+        country=("participant_country", "first"),
+        reached=("round_order", "first"),
+        rank=("rank", "min"),
+        won=("won", "any"),
+    )
+    standings = rows[is_standings].groupby(["event_code", "participant_code"])["rank"].min().rename("standing")
+
+    # Medallists, by the code of the athlete or team that won
+    winners = medallists.assign(
+        participant_code=medallists["code_team"].fillna(medallists["code_athlete"].astype("Int64").astype(str)),
+        medal=medallists["medal_type"].map({medal: i for i, medal in enumerate(MEDAL_TYPES)}),
+    ).merge(events, left_on=["discipline", "event"], right_on=["discipline_name", "event_name"])
+    winners = winners.drop_duplicates(["event_code", "participant_code", "medal"])
+    medal_of = winners.groupby(["event_code", "participant_code"])["medal"].min()
+
+    entrants = entrants.join(standings, on=["event_code", "participant_code"]).join(medal_of, on=["event_code", "participant_code"])
+    entrants = entrants.assign(
+        medal=entrants["medal"].fillna(len(MEDAL_TYPES)),
+        reached=-entrants["reached"],
+        won=~entrants["won"],
+    ).sort_values(
+        ["event_code", "medal", "standing", "reached", "won", "rank", "participant_code"],
+        na_position="last",
+        kind="stable",
+        ignore_index=True,
+    )
+    position = entrants.groupby("event_code").cumcount() + 1
+
+    event_codes, first = np.unique(entrants["event_code"].to_numpy(dtype=str), return_index=True)
+    countries, country = np.unique(entrants["country"].fillna("Unknown").to_numpy(dtype=str), return_inverse=True)
+
+    # Finishing positions that win a medal, e.g. gold, silver, bronze, bronze in judo
+    slots = (
+        winners.groupby(["event_code", "medal"]).size()
+        .reindex(pd.MultiIndex.from_product([event_codes, range(len(MEDAL_TYPES))]), fill_value=0)
+        .to_numpy(dtype=np.int64)
+        .reshape(len(event_codes), len(MEDAL_TYPES))
+    )
+    slot_counts = slots.sum(axis=1)
+    return ProjectionModel(
+        event_codes=event_codes,
+        offsets=np.append(first, len(entrants)),
+        log_strength=-STRENGTH_EXPONENT * np.log(position.to_numpy(dtype=np.float64)),
+        country=country.astype(np.int32),
+        countries=countries,
+        slot_offsets=np.concatenate([[0], np.cumsum(slot_counts)]),
+        slot_medals=np.repeat(np.tile(np.arange(len(MEDAL_TYPES)), len(event_codes)), slots.ravel()).astype(np.int8),
+    )
+
+
+def simulate_block(model: ProjectionModel, trials: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Run one block of trials.
+
+    Returns:
+        Medal counts per trial, country and medal type, shape (trials, countries, 3)
+    """
+    rng = np.random.default_rng(seed)
+    n_countries, n_medals = len(model.countries), len(MEDAL_TYPES)
+    trial_base = (np.arange(trials, dtype=np.int64) * n_countries)[:, None]
+    codes = []
+    for i in range(len(model.event_codes)):
+        start, stop = model.offsets[i], model.offsets[i + 1]
+        medals = model.slot_medals[model.slot_offsets[i]:model.slot_offsets[i + 1]]
+        k = min(len(medals), stop - start)
+        if k == 0:
+            continue
+        # Gumbel top-k: -log(Exp(1)) is Gumbel noise
+        n = stop - start
+        noise = rng.standard_exponential((trials, n))
+        scores = model.log_strength[start:stop] - np.log(noise, out=noise)
+        # The k best scores (in any order), then best first
+        top = np.argpartition(scores, n - k, axis=1)[:, n - k:] if k < n else np.argsort(scores, axis=1)
+        top = np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1), axis=1)[:, :k]
+        country = model.country[start + top]
+        codes.append(((trial_base + country) * n_medals + medals[:k]).ravel())
+    counts = np.bincount(np.concatenate(codes), minlength=trials * n_countries * n_medals) if codes else \
+        np.zeros(trials * n_countries * n_medals, dtype=np.int64)
+    return counts.astype(np.int16).reshape(trials, n_countries, n_medals)
+
+
+@dataclass(frozen=True)
+class MedalProjection:
+    """
+    Medal counts of every trial of a projection.
+
+    Attributes:
+        countries: Country names
+        counts: Medal counts, shape (trials, countries, 3) in MEDAL_TYPES order
+        seed: Seed of the projection
+    """
+    countries: np.ndarray
+    counts: np.ndarray
+    seed: int
+
+    @property
+    def trials(self) -> int:
+        return self.counts.shape[0]
+
+    def table(self, medal_types: list = None, interval: float = DEFAULT_INTERVAL) -> pd.DataFrame:
+        """
+        Projected medal table.
+
+        Args:
+            medal_types: Medal types counted in Total (default: all)
+            interval: Probability mass of the reported interval (0.9: 5th to 95th percentile)
+
+        Returns:
+            One row per country, by projected total: country, one column per
+            medal type and Total (mean over trials), with "<column> low" and
+            "<column> high" interval bounds, and "P(top)", the share of trials
+            in which the country won the most gold medals (ties shared)
+        """
+        selected = [MEDAL_TYPES.index(medal) for medal in medal_types or MEDAL_TYPES]
+        if not len(self.countries):
+            # Nothing to project from, e.g. an edition without results
+            columns = [c for medal in MEDAL_TYPES + ["Total"] for c in (medal, f"{medal} low", f"{medal} high")]
+            return pd.DataFrame({"country": pd.Series(dtype=str), **{c: pd.Series(dtype=float) for c in columns + ["P(top)"]}})
+        counts = self.counts.astype(np.int32)
+        totals = np.concatenate([counts, counts[:, :, selected].sum(axis=2, keepdims=True)], axis=2)
+        low, high = np.percentile(totals, [50 * (1 - interval), 50 * (1 + interval)], axis=0)
+        table = pd.DataFrame({"country": self.countries})
+        for i, column in enumerate(MEDAL_TYPES + ["Total"]):
+            table[column] = totals[:, :, i].mean(axis=0)
+            table[f"{column} low"] = low[:, i]
+            table[f"{column} high"] = high[:, i]
+        golds = counts[:, :, 0]
+        leaders = golds == golds.max(axis=1, keepdims=True)
+        table["P(top)"] = (leaders / leaders.sum(axis=1, keepdims=True)).mean(axis=0)
+        return table.sort_values(["Total", "Gold Medal"], ascending=False, ignore_index=True)
+
+
+def project_medals(model: ProjectionModel, trials: int = DEFAULT_TRIALS, seed: int = 0,
+                   workers: int = None) -> MedalProjection:
+    """
+    Run a Monte-Carlo projection of the medal table.
+
+    Args:
+        model: Projection model (see build_projection_model)
+        trials: Number of simulated Games
+        seed: Random seed; the result does not depend on the number of workers
+        workers: Worker processes (default: PROJECTION_WORKERS; 1 runs in-process)
+
+    Returns:
+        MedalProjection
+    """
+    if not len(model.event_codes):
+        return MedalProjection(model.countries, np.zeros((trials, 0, len(MEDAL_TYPES)), dtype=np.int16), seed)
+    sizes = [BLOCK_TRIALS] * (trials // BLOCK_TRIALS) + ([trials % BLOCK_TRIALS] if trials % BLOCK_TRIALS else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    workers = min(workers or PROJECTION_WORKERS, len(sizes))
+    if workers <= 1:
+        blocks = [simulate_block(model, size, block_seed) for size, block_seed in zip(sizes, seeds)]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            blocks = list(executor.map(simulate_block, [model] * len(sizes), sizes, seeds))
+    return MedalProjection(model.countries, np.concatenate(blocks), seed)
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Project the medal table of the next Games by Monte-Carlo simulation.")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS, help="Simulated Games")
+    parser.add_argument("--seed", type=int, default=PROJECTION_SEED, help="Random seed")
+    parser.add_argument("--workers", type=int, default=PROJECTION_WORKERS, help="Worker processes")
+    parser.add_argument("--top", type=int, default=15, help="Countries shown")
+    args = parser.parse_args(argv)
+
+    import time
+    from modules import data_loader
+    from modules.editions import CURRENT_EDITION, edition_dir, edition_file, projection_edition, results_files
+    from modules.progression import build_progression_index, read_results
+
+    started = time.perf_counter()
+    edition = CURRENT_EDITION if data_loader.DATA_DIR else projection_edition()
+    if edition in (None, CURRENT_EDITION):
+        files, medallists = results_files(data_loader.get_data_dir()), data_loader.read_data_file("medallists.csv")
+    else:
+        path = edition_file(edition, "medallists.csv")
+        files = results_files(edition_dir(edition))
+        medallists = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+    progression = build_progression_index(read_results(files))
+    model = build_projection_model(progression, medallists)
+    projection = project_medals(model, args.trials, args.seed, args.workers)
+    table = projection.table()
+    columns = ["country"] + [c for m in MEDAL_TYPES + ["Total"] for c in (m, f"{m} low", f"{m} high")] + ["P(top)"]
+    print(table[columns].head(args.top).to_string(index=False, float_format="%.1f"))
+    print(f"\n{args.trials} trials of {len(model.event_codes)} events in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
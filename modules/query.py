@@ -0,0 +1,362 @@
+"""
+Query backends for filtered rows and aggregates.
+Components ask for data through select() and aggregate() instead of filtering
+loaded frames themselves. The default pandas backend answers from the loaded
+data snapshot. The optional DuckDB backend (LA28_QUERY_BACKEND=duckdb, needs
+the duckdb package) runs the same queries as multi-threaded SQL directly over
+the Parquet (or CSV) files of the data folder and data/results/, with
+predicates and column selection pushed down into the scans, so a process
+never has to hold the full tables.
+
+Usage:
+    python -m modules.query --export-parquet /srv/la28/parquet   # Parquet snapshot of data/ for DuckDB
+"""
+import argparse
+import glob
+import os
+import sys
+import threading
+import warnings
+from functools import lru_cache
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+if __name__ == "__main__":
+    from streamlit.logger import set_log_level
+
+    # The export reads the data outside a script run; silence the bare-mode warnings
+    set_log_level("error")
+
+import pandas as pd
+
+from modules import data_loader
+from modules.editions import results_files
+
+
+# "pandas" (default) or "duckdb"
+QUERY_BACKEND = os.environ.get("LA28_QUERY_BACKEND", "pandas").lower()
+
+# DuckDB worker threads (0 lets DuckDB use every core)
+QUERY_THREADS = int(os.environ.get("LA28_QUERY_THREADS", "0"))
+
+RESULTS_TABLE = "results"
+
+# Results are partitioned by discipline: a filter on this column only reads the matching files
+RESULTS_PARTITION_COLUMN = "discipline_name"
+
+# Supported aggregate functions: name -> (pandas agg, SQL template)
+AGGREGATES = {
+    "count": ("size", "COUNT(*)"),
+    "sum": ("sum", "SUM({})"),
+    "mean": ("mean", "AVG({})"),
+    "min": ("min", "MIN({})"),
+    "max": ("max", "MAX({})"),
+    "nunique": ("nunique", "COUNT(DISTINCT {})"),
+}
+
+
+def table_files() -> dict:
+    """Map each queryable table to its data file (the loaders' file tables, plus results)."""
+    files = {
+        name: spec.files[0]
+        for name, spec in data_loader.TABLES.items()
+        if len(spec.files) == 1
+    }
+    files[RESULTS_TABLE] = os.path.join("results", "*.csv")
+    return files
+
+
+def _active_filters(where: dict) -> dict:
+    # Empty or None values mean "no filter", as for the sidebar selections
+    return {column: value for column, value in (where or {}).items() if value}
+
+
+def _results_partitions(where: dict) -> list:
+    """Results files a query has to read, pruned by its discipline filter."""
+    disciplines = _active_filters(where).get(RESULTS_PARTITION_COLUMN)
+    return results_files(data_loader.get_data_dir(), list(disciplines) if disciplines else None)
+
+
+def _parse_metrics(metrics: dict) -> dict:
+    metrics = metrics or {"count": ("count", None)}
+    for name, (func, _) in metrics.items():
+        if func not in AGGREGATES:
+            raise ValueError(f"Unsupported aggregate {func!r} for {name!r}")
+    return metrics
+
+
+# -------------------------------------------------------
+# pandas backend
+# -------------------------------------------------------
+
+class PandasBackend:
+    """
+    Answers queries from the in-memory data snapshot.
+
+    Queries only read the pinned snapshot tables (filtering and grouping
+    build new frames), so no private copy of a table is made.
+    """
+
+    name = "pandas"
+
+    def _frame(self, table: str, where: dict) -> pd.DataFrame:
+        if table == RESULTS_TABLE:
+            paths = _results_partitions(where)
+            return load_results_frame(tuple((path, os.path.getmtime(path)) for path in paths))
+        return data_loader.SNAPSHOTS.pinned().tables[table]
+
+    def _filtered(self, table: str, where: dict) -> pd.DataFrame:
+        df = self._frame(table, where)
+        for column, value in _active_filters(where).items():
+            df = df[df[column].isin(list(value))]
+        return df
+
+    def select(self, table: str, columns: list = None, where: dict = None,
+               order_by: list = None, limit: int = None) -> pd.DataFrame:
+        df = self._filtered(table, where)
+        if columns:
+            df = df[columns]
+        if order_by:
+            df = df.sort_values(order_by)
+        if limit is not None:
+            df = df.head(limit)
+        return df.reset_index(drop=True)
+
+    def aggregate(self, table: str, by: list, metrics: dict = None, where: dict = None,
+                  order_by: list = None, limit: int = None) -> pd.DataFrame:
+        metrics = _parse_metrics(metrics)
+        grouped = self._filtered(table, where).groupby(by, sort=True)
+        result = pd.DataFrame({
+            name: grouped.size() if func == "count" else grouped[column].agg(AGGREGATES[func][0])
+            for name, (func, column) in metrics.items()
+        }).reset_index()
+        if order_by:
+            result = result.sort_values(order_by, ignore_index=True)
+        if limit is not None:
+            result = result.head(limit)
+        return result
+
+
+@lru_cache(maxsize=8)
+def load_results_frame(files: tuple) -> pd.DataFrame:
+    """Results files as one frame, re-read when any (path, mtime) in files changes."""
+    if not files:
+        return pd.DataFrame()
+    return pd.concat(
+        [pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path) for path, _ in files],
+        ignore_index=True,
+    )
+
+
+# -------------------------------------------------------
+# DuckDB backend
+# -------------------------------------------------------
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class DuckDBBackend:
+    """
+    Answers queries with DuckDB over the data files.
+
+    Each table is a view over its Parquet file when one exists (same rule as
+    data_loader.read_data_file), else over the CSV file, so queries always see
+    the files as they are on disk. Every thread runs queries on its own cursor.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, duckdb_module, data_dir: str = None, threads: int = QUERY_THREADS):
+        self.data_dir = data_dir or data_loader.get_data_dir()
+        self._connection = duckdb_module.connect(database=":memory:")
+        if threads:
+            self._connection.execute(f"SET threads TO {int(threads)}")
+        self._local = threading.local()
+        for table, filename in table_files().items():
+            source = self._source(filename)
+            if source:
+                self._connection.execute(f"CREATE VIEW {_quote(table)} AS SELECT * FROM {source}")
+
+    def _source(self, filename: str) -> str:
+        """Scan expression for a data file (or glob), preferring Parquet."""
+        stem = os.path.join(self.data_dir, os.path.splitext(filename)[0])
+        parquet = stem + ".parquet"
+        csv = stem + ".csv"
+        if glob.glob(parquet):
+            return f"read_parquet('{parquet}', union_by_name = true)"
+        if glob.glob(csv):
+            return f"read_csv_auto('{csv}', union_by_name = true)"
+        return None
+
+    def _cursor(self):
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self._local.cursor = self._connection.cursor()
+        return cursor
+
+    @staticmethod
+    def _where(where: dict) -> tuple:
+        clauses, params = [], []
+        for column, value in _active_filters(where).items():
+            values = list(value)
+            clauses.append(f"{_quote(column)} IN ({', '.join('?' for _ in values)})")
+            params += values
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    @staticmethod
+    def _relation(table: str, where: dict) -> tuple:
+        """
+        FROM clause of a query and its parameters; a discipline filter on
+        results only scans the matching partitions.
+        """
+        if table == RESULTS_TABLE and RESULTS_PARTITION_COLUMN in _active_filters(where):
+            paths = _results_partitions(where)
+            formats = {os.path.splitext(path)[1] for path in paths}
+            if formats == {".parquet"}:
+                return "read_parquet(?, union_by_name = true)", [paths]
+            if formats == {".csv"}:
+                return "read_csv_auto(?, union_by_name = true)", [paths]
+        return _quote(table), []
+
+    @staticmethod
+    def _tail(order_by: list, limit: int) -> str:
+        sql = ""
+        if order_by:
+            sql += " ORDER BY " + ", ".join(_quote(column) for column in order_by)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return sql
+
+    def select(self, table: str, columns: list = None, where: dict = None,
+               order_by: list = None, limit: int = None) -> pd.DataFrame:
+        projection = ", ".join(_quote(c) for c in columns) if columns else "*"
+        relation, params = self._relation(table, where)
+        where_sql, where_params = self._where(where)
+        sql = f"SELECT {projection} FROM {relation}{where_sql}{self._tail(order_by, limit)}"
+        return self._cursor().execute(sql, params + where_params).df()
+
+    def aggregate(self, table: str, by: list, metrics: dict = None, where: dict = None,
+                  order_by: list = None, limit: int = None) -> pd.DataFrame:
+        metrics = _parse_metrics(metrics)
+        keys = ", ".join(_quote(column) for column in by)
+        aggregates = ", ".join(
+            AGGREGATES[func][1].format(_quote(column) if column else "") + f" AS {_quote(name)}"
+            for name, (func, column) in metrics.items()
+        )
+        relation, params = self._relation(table, where)
+        where_sql, where_params = self._where(where)
+        sql = (
+            f"SELECT {keys}, {aggregates} FROM {relation}{where_sql} "
+            f"GROUP BY {keys}{self._tail(order_by or by, limit)}"
+        )
+        result = self._cursor().execute(sql, params + where_params).df()
+        # COUNT returns int64 in pandas but may come back as another integer type from SQL
+        for name, (func, _) in metrics.items():
+            if func in ("count", "nunique"):
+                result[name] = result[name].astype("int64")
+        return result
+
+
+# -------------------------------------------------------
+# Backend selection
+# -------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def get_backend():
+    """
+    Return the configured query backend.
+
+    Falls back to the pandas backend (with a warning) when DuckDB is requested
+    but not installed.
+    """
+    if QUERY_BACKEND == "duckdb":
+        try:
+            import duckdb
+        except ImportError:
+            warnings.warn("LA28_QUERY_BACKEND=duckdb but the duckdb package is not installed; using pandas")
+            return PandasBackend()
+        return DuckDBBackend(duckdb)
+    return PandasBackend()
+
+
+def select(table: str, columns: list = None, where: dict = None, order_by: list = None, limit: int = None) -> pd.DataFrame:
+    """
+    Return the rows of a table that match the filters.
+
+    Args:
+        table: Table name (a data_loader table read from one file, or "results")
+        columns: Columns to return (default: all)
+        where: Column -> allowed values; empty values mean no filter
+        order_by: Columns to sort by
+        limit: Maximum number of rows
+
+    Returns:
+        DataFrame with a fresh RangeIndex
+    """
+    return get_backend().select(table, columns, where, order_by, limit)
+
+
+def aggregate(table: str, by: list, metrics: dict = None, where: dict = None,
+              order_by: list = None, limit: int = None) -> pd.DataFrame:
+    """
+    Group the matching rows of a table and aggregate them.
+
+    Args:
+        table: Table name (a data_loader table read from one file, or "results")
+        by: Group-by columns
+        metrics: Output column -> (function, input column), function one of
+            AGGREGATES (input column None for "count"); default a "count" column
+        where: Column -> allowed values; empty values mean no filter
+        order_by: Columns to sort by (default: the group-by columns)
+        limit: Maximum number of groups
+
+    Returns:
+        DataFrame with the group-by columns followed by the metrics
+    """
+    return get_backend().aggregate(table, by, metrics, where, order_by, limit)
+
+
+# -------------------------------------------------------
+# Parquet export
+# -------------------------------------------------------
+
+def export_parquet(out_dir: str) -> list:
+    """
+    Write a Parquet snapshot of every data table and results file.
+
+    Point LA28_DATA_DIR at out_dir to use it (both backends prefer Parquet).
+
+    Returns:
+        List of written paths
+    """
+    written = []
+    os.makedirs(os.path.join(out_dir, "results"), exist_ok=True)
+    for table, filename in table_files().items():
+        paths = [data_loader.resolve_data_file(filename)] if table != RESULTS_TABLE else sorted(
+            glob.glob(os.path.join(data_loader.get_data_dir(), filename))
+        )
+        for path in paths:
+            relative = os.path.relpath(path, data_loader.get_data_dir())
+            target = os.path.join(out_dir, os.path.splitext(relative)[0] + ".parquet")
+            df = pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+            df.to_parquet(target, index=False)
+            written.append(target)
+    return written
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Query backend utilities.")
+    parser.add_argument("--export-parquet", metavar="OUT_DIR", required=True,
+                        help="Write a Parquet snapshot of the data folder to OUT_DIR")
+    args = parser.parse_args(argv)
+
+    written = export_parquet(args.export_parquet)
+    print(f"Wrote {len(written)} Parquet files to {args.export_parquet}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+"""
+Elo rating engine for head-to-head results.
+Rates every athlete or team, and every country, within each discipline from
+the head-to-head matches of the results files (see modules.bracket), processed
+in chronological order. The state of a discipline is a few NumPy arrays
+indexed by participant (and country) position, with a dictionary from code to
+position; ratings after every match are kept as history for charts.
+
+The engine is incremental: update() rates only the matches it has not seen
+yet, so a results refresh that appends matches costs as much as its new
+matches. Corrected results need a rebuild, since matches already rated are
+never replayed. A full rebuild
+rates the disciplines independently, in parallel worker processes once there
+are enough matches to pay for them.
+
+Usage:
+    python -m modules.ratings --discipline Tennis --top 10
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+if __name__ == "__main__":
+    from streamlit.logger import set_log_level
+
+    # The CLI reads the data outside a script run; silence the bare-mode warnings
+    set_log_level("error")
+
+
+INITIAL_RATING = 1500.0
+
+# Rating points at stake per match
+K_FACTOR = 32.0
+
+# Score of side "a" per outcome (side "a" is the winner of a decided match)
+OUTCOME_SCORE = {"W": 1.0, "T": 0.5}
+
+# Set LA28_RATING_WORKERS to cap the worker processes of a full rebuild
+RATING_WORKERS = int(os.environ.get("LA28_RATING_WORKERS", os.cpu_count() or 1))
+
+# Below this many matches a rebuild runs in-process; spawning workers costs more
+PARALLEL_MIN_MATCHES = 50_000
+
+MATCH_COLUMNS = [
+    "discipline_name", "stage_code", "start",
+    "a_participant_code", "a_participant_name", "a_participant_country",
+    "b_participant_code", "b_participant_name", "b_participant_country",
+    "a_result_WLT",
+]
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    """Expected score of a player against an opponent (0 to 1)."""
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / 400.0))
+
+
+class _Pool:
+    """Ratings of a growing set of codes, in arrays indexed by position."""
+
+    def __init__(self):
+        self.positions = {}
+        self.ratings = np.empty(0)
+        self.matches = np.empty(0, dtype=np.int32)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def position(self, code: str) -> int:
+        """Position of a code, adding it at the initial rating when new."""
+        position = self.positions.get(code)
+        if position is None:
+            position = self.positions[code] = len(self.positions)
+            if position == len(self.ratings):
+                # Grow by doubling, so adding participants is amortized O(1)
+                capacity = max(2 * len(self.ratings), 16)
+                self.ratings = np.resize(self.ratings, capacity)
+                self.matches = np.resize(self.matches, capacity)
+            self.ratings[position] = INITIAL_RATING
+            self.matches[position] = 0
+        return position
+
+    def play(self, a: int, b: int, score: float) -> tuple:
+        """Update two ratings with the score of a (1 win, 0.5 tie, 0 loss); returns the new ratings."""
+        ratings = self.ratings
+        change = K_FACTOR * (score - expected_score(ratings[a], ratings[b]))
+        ratings[a] += change
+        ratings[b] -= change
+        self.matches[a] += 1
+        self.matches[b] += 1
+        return ratings[a], ratings[b]
+
+    def table(self) -> pd.DataFrame:
+        n = len(self.positions)
+        return pd.DataFrame({
+            "code": list(self.positions),
+            "rating": self.ratings[:n],
+            "matches": self.matches[:n],
+        })
+
+
+@dataclass
+class DisciplineRatings:
+    """
+    Participant and country ratings of one discipline.
+
+    Attributes:
+        discipline: Discipline name
+        participants: Ratings by participant code
+        countries: Ratings by country (matches between two countries only)
+        names: Dictionary mapping participant codes to (name, country)
+        history: Columns of the rating history: stage_code, start,
+            participant_code and rating (after the match), two entries per match
+        seen: Stage codes of the matches already rated
+    """
+    discipline: str
+    participants: _Pool = field(default_factory=_Pool)
+    countries: _Pool = field(default_factory=_Pool)
+    names: dict = field(default_factory=dict)
+    history: dict = field(default_factory=lambda: {"stage_code": [], "start": [], "participant_code": [], "rating": []})
+    seen: set = field(default_factory=set)
+
+    def update(self, matches: pd.DataFrame) -> int:
+        """
+        Rate the matches not seen yet, in chronological order.
+
+        A late match that started before matches already rated is rated
+        after them; ratings are never replayed, so a match already seen is
+        not re-rated if its result was corrected (use RatingEngine.rebuild).
+
+        Args:
+            matches: Matches of this discipline (see modules.bracket.head_to_head_matches)
+
+        Returns:
+            Number of matches rated
+        """
+        new = matches[~matches["stage_code"].isin(self.seen)].sort_values(["start", "stage_code"], kind="stable")
+        participants, countries, history = self.participants, self.countries, self.history
+        for stage, start, a, a_name, a_country, b, b_name, b_country, outcome in new[MATCH_COLUMNS[1:]].itertuples(index=False):
+            score = OUTCOME_SCORE.get(outcome, 0.0)
+            rating_a, rating_b = participants.play(participants.position(a), participants.position(b), score)
+            if a_country != b_country and isinstance(a_country, str) and isinstance(b_country, str):
+                countries.play(countries.position(a_country), countries.position(b_country), score)
+            self.names[a] = (a_name, a_country)
+            self.names[b] = (b_name, b_country)
+            history["stage_code"] += [stage, stage]
+            history["start"] += [start, start]
+            history["participant_code"] += [a, b]
+            history["rating"] += [rating_a, rating_b]
+        self.seen.update(new["stage_code"])
+        return len(new)
+
+    def participant_table(self) -> pd.DataFrame:
+        """Participants by rating: participant_code, participant_name, country, rating, matches."""
+        table = self.participants.table().rename(columns={"code": "participant_code"})
+        names = table["participant_code"].map(self.names)
+        table.insert(1, "participant_name", names.str[0])
+        table.insert(2, "country", names.str[1])
+        return table.sort_values("rating", ascending=False, ignore_index=True)
+
+    def country_table(self) -> pd.DataFrame:
+        """Countries by rating: country, rating, matches."""
+        return self.countries.table().rename(columns={"code": "country"}).sort_values("rating", ascending=False, ignore_index=True)
+
+    def history_frame(self, participant_codes: list = None) -> pd.DataFrame:
+        """Rating after each match, optionally for some participants only, in chronological order."""
+        history = pd.DataFrame(self.history)
+        if participant_codes is not None:
+            history = history[history["participant_code"].isin(participant_codes)]
+        history["participant_name"] = history["participant_code"].map(lambda code: self.names[code][0])
+        return history.reset_index(drop=True)
+
+
+def _rate_discipline(discipline: str, matches: pd.DataFrame) -> DisciplineRatings:
+    ratings = DisciplineRatings(discipline)
+    ratings.update(matches)
+    return ratings
+
+
+class RatingEngine:
+    """Ratings of every discipline, updated incrementally as results arrive."""
+
+    def __init__(self, disciplines: dict = None):
+        self.disciplines = disciplines or {}
+
+    @classmethod
+    def rebuild(cls, matches: pd.DataFrame, workers: int = None) -> "RatingEngine":
+        """
+        Rate all matches from scratch, one discipline per task.
+
+        Args:
+            matches: Head-to-head matches (see modules.bracket.head_to_head_matches)
+            workers: Worker processes (default: RATING_WORKERS; small inputs are
+                rated in-process regardless)
+
+        Returns:
+            RatingEngine
+        """
+        workers = min(workers or RATING_WORKERS, matches["discipline_name"].nunique())
+        groups = [(discipline, group[MATCH_COLUMNS]) for discipline, group in matches.groupby("discipline_name", sort=True)]
+        if workers <= 1 or len(matches) < PARALLEL_MIN_MATCHES:
+            rated = [_rate_discipline(discipline, group) for discipline, group in groups]
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                rated = list(executor.map(_rate_discipline, *zip(*groups)))
+        return cls({ratings.discipline: ratings for ratings in rated})
+
+    def update(self, matches: pd.DataFrame) -> int:
+        """
+        Rate the matches not seen yet (see DisciplineRatings.update).
+
+        Returns:
+            Number of matches rated
+        """
+        rated = 0
+        for discipline, group in matches.groupby("discipline_name", sort=True):
+            ratings = self.disciplines.setdefault(discipline, DisciplineRatings(discipline))
+            rated += ratings.update(group)
+        return rated
+
+    def __getitem__(self, discipline: str) -> DisciplineRatings:
+        return self.disciplines[discipline]
+
+    def __len__(self):
+        return len(self.disciplines)
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Rate athletes, teams and countries from head-to-head results.")
+    parser.add_argument("--discipline", help="Discipline to show (default: every discipline)")
+    parser.add_argument("--top", type=int, default=10, help="Participants shown per discipline")
+    parser.add_argument("--workers", type=int, default=RATING_WORKERS, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    from modules import data_loader
+    from modules.bracket import head_to_head_matches
+    from modules.editions import results_files
+    from modules.progression import build_progression_index, read_results
+
+    rows = build_progression_index(read_results(results_files(data_loader.get_data_dir()))).rows
+    engine = RatingEngine.rebuild(head_to_head_matches(rows), workers=args.workers)
+    for discipline in [args.discipline] if args.discipline else sorted(engine.disciplines):
+        print(f"\n{discipline}")
+        print(engine[discipline].participant_table().head(args.top).to_string(index=False, float_format="%.0f"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
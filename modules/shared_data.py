@@ -0,0 +1,250 @@
+"""
+Shared-memory data plane for several server processes on one host.
+One process materializes every snapshot table into memory-mapped files under
+a shared directory (ideally on tmpfs, e.g. /dev/shm): DataFrames as Arrow IPC
+files and the numeric arrays of aggregates as .npy files. The other processes
+attach to them zero-copy and read-only, so host memory grows with the data
+rather than with data × processes.
+
+The manifest of a generation is pickled, so the directory must be private to
+the user running the servers: it is created with mode 0700, and a directory
+that is not owned by the current user or is open to others is refused.
+"""
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import stat
+
+import numpy as np
+import pandas as pd
+
+from modules.lazy_imports import lazy_import
+
+# Only needed once the shared data plane is enabled
+pa = lazy_import("pyarrow")
+
+
+# Set LA28_SHARED_DATA to a directory (e.g. /dev/shm/la28) to share tables between server processes
+SHARED_DATA_DIR = os.environ.get("LA28_SHARED_DATA")
+
+# Published generations kept on disk (current and previous, like the snapshot double buffer)
+KEEP_GENERATIONS = 2
+
+MANIFEST = "manifest.pkl"
+
+
+def snapshot_key(fingerprints: dict) -> str:
+    """Key of the data generation described by the source file fingerprints."""
+    return hashlib.md5(json.dumps(sorted(fingerprints.items()), default=str).encode()).hexdigest()
+
+
+# -------------------------------------------------------
+# Value encoding
+# -------------------------------------------------------
+
+def _dump_frame(path: str, df: pd.DataFrame):
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _load_frame(path: str) -> pd.DataFrame:
+    # split_blocks keeps every column a view of the mapped buffers instead of consolidating them
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def _shareable_array(value) -> bool:
+    return isinstance(value, np.ndarray) and value.dtype != object and value.size > 0
+
+
+def _dump_field(directory: str, prefix: str, item) -> tuple:
+    """Descriptor of one dataclass field: numeric arrays (also in a dict) go to .npy files."""
+    if _shareable_array(item):
+        filename = f"{prefix}.npy"
+        np.save(os.path.join(directory, filename), item)
+        return ("array", filename)
+    if isinstance(item, dict) and item and all(_shareable_array(v) for v in item.values()):
+        return ("dict", {key: _dump_field(directory, f"{prefix}.{key}", v) for key, v in item.items()})
+    return ("pickle", item)
+
+
+def dump_value(directory: str, name: str, value) -> tuple:
+    """
+    Write one table to a generation directory.
+
+    DataFrames become Arrow IPC files; numeric arrays held by dataclass
+    aggregates (e.g. Leaderboard row codes) become .npy files; everything
+    else is pickled into the manifest.
+
+    Returns:
+        Descriptor understood by load_value (file names relative to directory)
+    """
+    if isinstance(value, pd.DataFrame):
+        filename = f"{name}.arrow"
+        try:
+            _dump_frame(os.path.join(directory, filename), value)
+            return ("frame", filename)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Columns Arrow cannot type (mixed objects) stay private to each process
+            return ("pickle", value)
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {
+            field.name: _dump_field(directory, f"{name}.{field.name}", getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+        return ("dataclass", type(value), fields)
+
+    return ("pickle", value)
+
+
+def load_value(directory: str, descriptor: tuple):
+    """Attach to a table written by dump_value (read-only, zero-copy where possible)."""
+    kind = descriptor[0]
+    if kind == "frame":
+        return _load_frame(os.path.join(directory, descriptor[1]))
+    if kind == "array":
+        return np.load(os.path.join(directory, descriptor[1]), mmap_mode="r")
+    if kind == "dict":
+        return {key: load_value(directory, item) for key, item in descriptor[1].items()}
+    if kind == "dataclass":
+        cls, fields = descriptor[1], descriptor[2]
+        return cls(**{name: load_value(directory, field) for name, field in fields.items()})
+    return descriptor[1]
+
+
+def private_view(value):
+    """
+    A per-caller view of a shared table that callers may modify.
+
+    DataFrames get a shallow copy: with pandas copy-on-write (always on
+    from pandas 3, see requirements.txt), writes copy only the touched
+    columns and never reach the shared buffers.
+    """
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=False)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+# -------------------------------------------------------
+# Publication
+# -------------------------------------------------------
+
+def check_private_directory(directory: str):
+    """
+    Make sure only the current user can write to a directory.
+
+    Raises:
+        PermissionError: The directory is a symbolic link, is not owned by
+            the current user, or grants any access to group or others
+    """
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{directory} is a symbolic link or not a directory")
+    if info.st_uid != os.geteuid():
+        raise PermissionError(f"{directory} is not owned by the current user")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"{directory} must have mode 0700 (it has {stat.S_IMODE(info.st_mode):04o})")
+
+
+class SharedDataPlane:
+    """Publishes and attaches generations of snapshot tables in a private shared directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        check_private_directory(directory)
+        self.attached = 0
+        self.published = 0
+
+    def _generation_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def attach(self, key: str):
+        """
+        Attach to a published generation.
+
+        Returns:
+            (tables, extra) or None if the generation was not published
+        """
+        # Unpickling runs code from the manifest: only trust a directory nobody else can write to
+        check_private_directory(self.directory)
+        directory = self._generation_dir(key)
+        try:
+            with open(os.path.join(directory, MANIFEST), "rb") as f:
+                descriptors, extra = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        self.attached += 1
+        return {name: load_value(directory, d) for name, d in descriptors.items()}, extra
+
+    def publish(self, key: str, tables: dict, extra=None) -> dict:
+        """
+        Write a generation and return its tables re-attached from the shared files.
+
+        The generation is written to a temporary directory that is renamed
+        into place, so it only becomes visible once complete.
+        """
+        final_dir = self._generation_dir(key)
+        tmp_dir = f"{final_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        descriptors = {name: dump_value(tmp_dir, name, value) for name, value in tables.items()}
+        with open(os.path.join(tmp_dir, MANIFEST), "wb") as f:
+            pickle.dump((descriptors, extra), f)
+        shutil.rmtree(final_dir, ignore_errors=True)
+        os.rename(tmp_dir, final_dir)
+        self.published += 1
+        self._prune(keep=key)
+        return {name: load_value(final_dir, d) for name, d in descriptors.items()}
+
+    def _prune(self, keep: str):
+        """Remove all but the newest generations; processes still mapping them keep their pages."""
+        generations = [
+            entry for entry in os.scandir(self.directory)
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, MANIFEST))
+        ]
+        generations.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in generations[KEEP_GENERATIONS:]:
+            if entry.name != keep:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def get_or_build(self, key: str, build) -> tuple:
+        """
+        Attach to the generation for key, building and publishing it first if needed.
+
+        The first process to take the directory lock builds; the others wait
+        for it and then attach.
+
+        Args:
+            key: Generation key (see snapshot_key)
+            build: Callable returning (tables, extra)
+
+        Returns:
+            (tables, extra) backed by the shared files
+        """
+        import fcntl
+
+        attached = self.attach(key)
+        if attached is not None:
+            return attached
+        with open(os.path.join(self.directory, ".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                attached = self.attach(key)
+                if attached is not None:
+                    return attached
+                tables, extra = build()
+                return self.publish(key, tables, extra), extra
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def status(self) -> dict:
+        return {"directory": self.directory, "published": self.published, "attached": self.attached}
@@ -0,0 +1,188 @@
+"""
+Startup-time profiler for the app entry points.
+Starts every page in a fresh interpreter (python -X importtime), renders it
+once headless with AppTest, and reports the cold start: import cost per
+module, heavy dependencies loaded lazily during the first render, and the
+first-render time of every component and loader.
+
+Usage:
+    python -m modules.startup_profile
+    python -m modules.startup_profile --pages Overview --top 15 --json startup.json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TOP = 10
+PROJECT_PACKAGES = ("components", "modules", "utils")
+
+# "import time:  self [us] | cumulative | imported package" lines of -X importtime
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+# Written to stderr by the child once Streamlit and AppTest are imported;
+# imports before it are the harness, imports after it belong to the page
+PAGE_MARKER = "--- la28 page start ---"
+
+
+def parse_import_times(stderr: str) -> list:
+    """
+    Parse -X importtime output (a block of stderr).
+
+    Returns:
+        List of (module, self_ms, cumulative_ms, depth); depth 0 marks an import
+        made directly by the script (or a lazily loaded dependency)
+    """
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(self_us) / 1000, int(cumulative_us) / 1000, (len(indent) - 1) // 2))
+    return imports
+
+
+def profile_child(page: str) -> dict:
+    """Render one page once in this (fresh) process and return its first-render figures."""
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+
+    set_log_level("error")
+    os.chdir(PROJECT_DIR)
+    print(PAGE_MARKER, file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    at = AppTest.from_file(os.path.join(PROJECT_DIR, page), default_timeout=300).run()
+    run_s = time.perf_counter() - started
+
+    from modules.lazy_imports import LAZY_IMPORT_TIMES
+    from modules.profiling import PROFILER
+
+    return {
+        "first_render_s": run_s,
+        "exception": at.exception[0].value if at.exception else None,
+        "lazy_imports": {name: secs for name, secs in LAZY_IMPORT_TIMES.items() if secs is not None},
+        "lazy_not_loaded": sorted(name for name, secs in LAZY_IMPORT_TIMES.items() if secs is None),
+        "sections": [
+            {"kind": r.kind, "name": r.name, "wall_ms": r.wall_ms, "cache": r.cache}
+            for r in PROFILER.records()
+        ],
+    }
+
+
+def profile_page(page: str, top: int = DEFAULT_TOP) -> dict:
+    """
+    Profile the cold start of one page in a fresh interpreter.
+
+    Returns:
+        Dictionary with the total cold start, heaviest top-level imports,
+        project module import cost, lazy imports and first-render sections
+    """
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "modules.startup_profile", "--child", page],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    cold_start_s = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(f"Profiling {page} failed:\n{proc.stderr[-2000:]}")
+
+    child = json.loads(proc.stdout.strip().splitlines()[-1])
+    harness_stderr, _, page_stderr = proc.stderr.partition(PAGE_MARKER)
+    harness_ms = sum(i[2] for i in parse_import_times(harness_stderr) if i[3] == 0)
+    imports = parse_import_times(page_stderr)
+    top_level = sorted((i for i in imports if i[3] == 0), key=lambda i: i[2], reverse=True)
+    project = [
+        i for i in imports
+        if i[0].split(".")[0] in PROJECT_PACKAGES
+    ]
+
+    from modules.load_test import page_name
+
+    return {
+        "page": page_name(page),
+        "cold_start_s": round(cold_start_s, 3),
+        "first_render_s": round(child["first_render_s"], 3),
+        "streamlit_import_ms": round(harness_ms, 1),
+        "import_total_ms": round(sum(i[2] for i in imports if i[3] == 0), 1),
+        "top_imports": [{"module": m, "cumulative_ms": round(c, 1)} for m, _, c, _ in top_level[:top]],
+        "project_imports": [{"module": m, "self_ms": round(s, 1), "cumulative_ms": round(c, 1)} for m, s, c, _ in project],
+        "lazy_imports": {name: round(secs * 1000, 1) for name, secs in child["lazy_imports"].items()},
+        "lazy_not_loaded": child["lazy_not_loaded"],
+        "sections": child["sections"],
+        "exception": child["exception"],
+    }
+
+
+def format_report(report: dict) -> str:
+    """Render one page's startup profile as text."""
+    lines = [
+        f"== {report['page']}: cold start {report['cold_start_s']:.2f}s "
+        f"(first render {report['first_render_s']:.2f}s incl. page imports {report['import_total_ms']:.0f} ms; "
+        f"streamlit + harness imports {report['streamlit_import_ms']:.0f} ms)"
+    ]
+    if report["exception"]:
+        lines.append(f"   !! exception: {report['exception']}")
+    lines.append("   heaviest imports:")
+    lines += [f"     {i['cumulative_ms']:8.1f} ms  {i['module']}" for i in report["top_imports"]]
+    lines.append("   project modules (cumulative):")
+    lines += [
+        f"     {i['cumulative_ms']:8.1f} ms  {i['module']}"
+        for i in sorted(report["project_imports"], key=lambda i: i["cumulative_ms"], reverse=True)
+    ]
+    lines.append("   lazy imports loaded during first render:")
+    lines += [f"     {ms:8.1f} ms  {name}" for name, ms in sorted(report["lazy_imports"].items(), key=lambda kv: -kv[1])]
+    if report["lazy_not_loaded"]:
+        lines.append(f"   lazy imports never loaded: {', '.join(report['lazy_not_loaded'])}")
+    lines.append("   first render:")
+    lines += [
+        f"     {s['wall_ms']:8.1f} ms  {s['kind']:<9} {s['name']}" + (f" ({s['cache']})" if s["cache"] else "")
+        for s in sorted(report["sections"], key=lambda s: -s["wall_ms"])
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Profile the cold start of every app entry point.")
+    parser.add_argument("--pages", nargs="+", help="Only pages whose file name contains one of these")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Heaviest imports to list per page")
+    parser.add_argument("--json", help="Also write the reports to this JSON file")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(profile_child(args.child)))
+        return 0
+
+    from modules.load_test import list_pages
+
+    pages = list_pages()
+    if args.pages:
+        pages = [page for page in pages if any(p in os.path.basename(page) for p in args.pages)]
+
+    reports = []
+    for page in pages:
+        report = profile_page(page, args.top)
+        reports.append(report)
+        print(format_report(report))
+        print()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+    return 1 if any(r["exception"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
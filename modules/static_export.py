@@ -0,0 +1,296 @@
+"""
+Static snapshot export of the dashboard pages.
+Renders the default (unfiltered) state of 1_Overview.py and every page
+headlessly and writes a static bundle that a CDN or any file server can
+serve: one HTML file per page, the Plotly figure JSON of every chart
+(content-addressed, so it can be cached forever), a JSON summary per page,
+and the Plotly.js bundle. Anonymous viewers of the default views then never
+reach a Python server; the live app is linked for interactive filtering.
+
+Usage:
+    python -m modules.static_export --out build/static --app-url https://dashboard.example.org
+    python -m modules.static_export --out build/static --pages Overview Global
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from datetime import datetime, timezone
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+if __name__ == "__main__":
+    from streamlit.logger import set_log_level
+
+    # Pages are rendered outside a server; silence the bare-mode warnings
+    set_log_level("error")
+
+from modules.load_test import DEFAULT_TIMEOUT, PROJECT_DIR, list_pages, page_name
+
+
+DEFAULT_OUT_DIR = os.path.join(PROJECT_DIR, "build", "static")
+
+# Rows of a table written into the static HTML
+MAX_TABLE_ROWS = 50
+
+STYLE = """
+body { font-family: "Source Sans Pro", -apple-system, sans-serif; margin: 0; color: #31333f; }
+nav { background: #f0f2f6; padding: 0.75rem 2rem; }
+nav a { margin-right: 1.5rem; color: #31333f; text-decoration: none; font-weight: 600; }
+main { max-width: 1200px; margin: 0 auto; padding: 1rem 2rem 3rem; }
+.row { display: flex; gap: 1rem; flex-wrap: wrap; }
+.row > .column { flex: 1 1 0; min-width: 220px; }
+.metric .label { font-size: 0.9rem; color: #808495; }
+.metric .value { font-size: 2rem; }
+.metric .delta { font-size: 0.9rem; color: #09ab3b; }
+.caption { color: #808495; font-size: 0.9rem; }
+.alert { padding: 0.75rem 1rem; border-radius: 0.5rem; background: #e8f0fe; margin: 0.5rem 0; }
+.alert.warning { background: #fffce7; } .alert.error { background: #ffecec; } .alert.success { background: #e8f9ee; }
+.widget { color: #808495; font-size: 0.85rem; margin: 0.25rem 0; }
+.chart { min-height: 450px; }
+table { border-collapse: collapse; font-size: 0.85rem; } td, th { border: 1px solid #e6e9ef; padding: 0.25rem 0.5rem; }
+.interactive { float: right; font-weight: 400; }
+"""
+
+# Loads each chart's figure JSON on demand
+CHART_SCRIPT = """
+document.querySelectorAll(".chart[data-figure]").forEach(function (el) {
+  fetch(el.dataset.figure).then(function (r) { return r.json(); }).then(function (fig) {
+    Plotly.newPlot(el, fig.data, fig.layout, Object.assign({responsive: true}, fig.config || {}));
+  });
+});
+"""
+
+
+def page_slug(path: str) -> str:
+    """File name stem of a page in the bundle (e.g. "global_analysis")."""
+    return page_name(path).lower()
+
+
+# -------------------------------------------------------
+# Markup
+# -------------------------------------------------------
+
+def markdown_to_html(text: str) -> str:
+    """Convert the small Markdown subset the pages use (emphasis, code, headings, line breaks)."""
+    lines = []
+    for line in html.escape(text).splitlines():
+        heading = re.match(r"^(#{1,6})\s+(.*)$", line)
+        if heading:
+            level = len(heading.group(1))
+            line = f"<h{level}>{heading.group(2)}</h{level}>"
+        lines.append(line)
+    body = "<br>".join(lines)
+    body = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", body)
+    body = re.sub(r"\*(.+?)\*", r"<em>\1</em>", body)
+    return re.sub(r"`(.+?)`", r"<code>\1</code>", body)
+
+
+class FigureStore:
+    """Writes figure JSON files named by their content hash."""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        os.makedirs(os.path.join(out_dir, "figures"), exist_ok=True)
+        self.bytes_written = 0
+
+    def add(self, spec: str, config: str = None) -> str:
+        """Store one figure (Plotly JSON spec plus chart config) and return its bundle path."""
+        figure = json.loads(spec)
+        if config:
+            figure["config"] = json.loads(config)
+        body = json.dumps(figure, separators=(",", ":")).encode("utf-8")
+        path = f"figures/{hashlib.sha1(body).hexdigest()[:16]}.json"
+        target = os.path.join(self.out_dir, path)
+        if not os.path.exists(target):
+            with open(target, "wb") as f:
+                f.write(body)
+            self.bytes_written += len(body)
+        return path
+
+
+def render_node(node, figures: FigureStore, summary: dict) -> str:
+    """
+    Static HTML of one rendered element or block (recursively).
+
+    Widgets are shown with their default value as plain text; charts become
+    placeholders loading their figure file.
+    """
+    kind = node.type
+    proto = node.proto
+    children = "".join(render_node(child, figures, summary) for child in getattr(node, "children", {}).values())
+
+    if kind in ("title", "header", "subheader"):
+        tag = {"title": "h1", "header": "h2", "subheader": "h3"}[kind]
+        if kind == "title":
+            summary.setdefault("title", proto.body)
+        return f"<{tag}>{html.escape(proto.body)}</{tag}>"
+    if kind == "markdown":
+        return f"<div>{markdown_to_html(proto.body)}</div>"
+    if kind == "caption":
+        return f'<p class="caption">{markdown_to_html(proto.body)}</p>'
+    if kind == "divider":
+        return "<hr>"
+    if kind in ("info", "success", "warning", "error"):
+        return f'<div class="alert {kind}">{markdown_to_html(proto.body)}</div>'
+    if kind == "metric":
+        summary["metrics"].append({"label": node.label, "value": node.value, "delta": node.delta or None})
+        delta = f'<div class="delta">{html.escape(node.delta)}</div>' if node.delta else ""
+        return (
+            f'<div class="metric"><div class="label">{html.escape(node.label)}</div>'
+            f'<div class="value">{html.escape(node.value)}</div>{delta}</div>'
+        )
+    if kind == "plotly_chart":
+        path = figures.add(proto.spec, proto.config)
+        summary["figures"].append(path)
+        return f'<div class="chart" data-figure="../{path}"></div>'
+    if kind == "dataframe":
+        df = node.value
+        table = df.head(MAX_TABLE_ROWS).to_html(index=False, border=0)
+        more = f'<p class="caption">{len(df) - MAX_TABLE_ROWS} more rows in the interactive dashboard</p>' if len(df) > MAX_TABLE_ROWS else ""
+        return table + more
+    if kind == "link_button":
+        return f'<a class="link" href="{html.escape(proto.url)}">{html.escape(proto.label)}</a> '
+    if kind in ("selectbox", "multiselect", "slider", "radio", "checkbox", "toggle", "select_slider"):
+        value = node.value
+        if isinstance(value, (list, tuple)):
+            value = ", ".join(map(str, value)) or "all"
+        return f'<div class="widget">{html.escape(proto.label)}: {html.escape(str(value))}</div>'
+    if kind == "column":
+        return f'<div class="column">{children}</div>'
+    if kind == "expander":
+        return f"<details><summary>{html.escape(proto.label)}</summary>{children}</details>"
+    if kind == "tab":
+        return f"<section><h3>{html.escape(proto.label)}</h3>{children}</section>"
+    if kind == "flex_container" and any(child.type == "column" for child in node.children.values()):
+        return f'<div class="row">{children}</div>'
+    return children
+
+
+def page_html(title: str, body: str, nav: str, app_url: str = None) -> str:
+    interactive = f'<a class="interactive" href="{html.escape(app_url)}">Interactive dashboard →</a>' if app_url else ""
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\">"
+        "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">"
+        f"<title>{html.escape(title)}</title><link rel=\"stylesheet\" href=\"../assets/style.css\">"
+        "<script src=\"../assets/plotly.min.js\"></script></head>"
+        f"<body><nav>{nav}{interactive}</nav><main>{body}</main>"
+        f"<script>{CHART_SCRIPT}</script></body></html>\n"
+    )
+
+
+# -------------------------------------------------------
+# Export
+# -------------------------------------------------------
+
+def render_page(path: str):
+    """Run a page headlessly in its default state and return the AppTest."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(path, default_timeout=DEFAULT_TIMEOUT).run()
+    if at.exception:
+        raise RuntimeError(f"{page_name(path)} raised: {at.exception[0].value}")
+    return at
+
+
+def _write_assets(out_dir: str):
+    from plotly.offline import get_plotlyjs
+
+    os.makedirs(os.path.join(out_dir, "assets"), exist_ok=True)
+    with open(os.path.join(out_dir, "assets", "plotly.min.js"), "w", encoding="utf-8") as f:
+        f.write(get_plotlyjs())
+    with open(os.path.join(out_dir, "assets", "style.css"), "w", encoding="utf-8") as f:
+        f.write(STYLE)
+
+
+def export_site(out_dir: str = DEFAULT_OUT_DIR, pages: list = None, app_url: str = None) -> dict:
+    """
+    Render every page in its default state and write the static bundle.
+
+    The bundle is built next to out_dir and swapped in when complete, so a
+    server publishing out_dir never serves a half-written export.
+
+    Args:
+        out_dir: Bundle directory (replaced)
+        pages: Page scripts to export (default: all)
+        app_url: URL of the live dashboard, linked from every page
+
+    Returns:
+        The bundle manifest (also written as manifest.json)
+    """
+    from modules import data_loader, progressive
+
+    # Deferred sections must be rendered before the page is captured
+    progressive.PROGRESSIVE_RENDER = False
+    pages = pages or list_pages()
+    os.chdir(PROJECT_DIR)
+
+    build_dir = f"{out_dir.rstrip(os.sep)}.{os.getpid()}.tmp"
+    shutil.rmtree(build_dir, ignore_errors=True)
+    os.makedirs(os.path.join(build_dir, "pages"))
+    _write_assets(build_dir)
+    figures = FigureStore(build_dir)
+
+    nav = "".join(f'<a href="../pages/{page_slug(p)}.html">{html.escape(page_name(p).replace("_", " "))}</a>' for p in pages)
+    manifest = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "data_dir": data_loader.get_data_dir(),
+        "pages": {},
+    }
+    for path in pages:
+        started = time.perf_counter()
+        at = render_page(path)
+        slug = page_slug(path)
+        summary = {"page": page_name(path), "metrics": [], "figures": []}
+        body = render_node(at.main, figures, summary)
+        with open(os.path.join(build_dir, "pages", f"{slug}.html"), "w", encoding="utf-8") as f:
+            f.write(page_html(summary.get("title", summary["page"]), body, nav, app_url))
+        with open(os.path.join(build_dir, "pages", f"{slug}.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        manifest["pages"][slug] = {
+            "html": f"pages/{slug}.html",
+            "json": f"pages/{slug}.json",
+            "figures": len(summary["figures"]),
+            "render_s": round(time.perf_counter() - started, 3),
+        }
+
+    manifest["data_version"] = data_loader.SNAPSHOTS.status()["version"]
+    manifest["figure_bytes"] = figures.bytes_written
+    first = next(iter(manifest["pages"].values()))["html"]
+    with open(os.path.join(build_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(f'<!DOCTYPE html>\n<meta http-equiv="refresh" content="0; url={first}">\n<a href="{first}">Dashboard</a>\n')
+    with open(os.path.join(build_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.rename(build_dir, out_dir)
+    return manifest
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Export the default view of every page as static files.")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="Output directory (replaced)")
+    parser.add_argument("--app-url", help="URL of the live dashboard, linked from every page")
+    parser.add_argument("--pages", nargs="*", help="Only export pages whose file name contains one of these")
+    args = parser.parse_args(argv)
+
+    pages = list_pages()
+    if args.pages:
+        pages = [p for p in pages if any(name in os.path.basename(p) for name in args.pages)]
+
+    manifest = export_site(os.path.abspath(args.out), pages, args.app_url)
+    for slug, page in manifest["pages"].items():
+        print(f"{slug:<24} {page['figures']:>3} figures  {page['render_s']:6.2f}s")
+    print(f"Wrote {len(manifest['pages'])} pages to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+"""
+Synthetic data generator for load testing.
+Scales the Paris 2024 CSVs N× into referentially consistent datasets: every
+replica gets its own athletes, teams and events (remapped codes, suffixed
+event names) while countries, disciplines and venues keep their real
+cardinality, and person attributes are drawn from the distributions learned
+from the source data.
+
+Usage:
+    python -m modules.synthetic --factor 10 --out data_x10
+    python -m modules.synthetic --factor 100 --out data_x100 --format parquet
+    LA28_DATA_DIR=data_x10 streamlit run 1_Overview.py
+"""
+import argparse
+import glob
+import os
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from streamlit.logger import set_log_level
+
+# Headless run: silence the "No runtime found" warnings of st.cache_data
+set_log_level("error")
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.data_loader import get_data_dir
+
+
+# Datasets scaled per replica (name -> file); every other data file is copied as-is
+SCALED_FILES = {
+    "athletes": "athletes.csv",
+    "medallists": "medallists.csv",
+    "medals": "medals.csv",
+    "schedules": "schedules.csv",
+    "teams": "teams.csv",
+    "events": "events.csv",
+}
+RESULTS_DIR = "results"
+
+# Numeric person codes of replica k are offset by k * CODE_OFFSET (source codes have 7 digits)
+CODE_OFFSET = 10_000_000
+
+MEDAL_COLUMNS = ["Gold Medal", "Silver Medal", "Bronze Medal"]
+
+
+@dataclass
+class SyntheticProfile:
+    """Distributions learned from the source data for synthesized person attributes."""
+    family_names: np.ndarray
+    given_names: np.ndarray
+    donors: dict  # gender -> DataFrame of (birth_date, height, weight) to draw from
+
+
+def fit_profile(sources: dict) -> SyntheticProfile:
+    """
+    Learn name token pools and per-gender attribute distributions.
+
+    Names are split into family and given name tokens ("FAMILY Given", as in
+    athletes and medallists). Birth date, height and weight are drawn jointly
+    from real athletes of the same gender, so their correlations are kept.
+    """
+    people = sources.get("athletes", sources.get("medallists"))
+    names = people["name"].dropna().astype(str).str.split(" ", n=1, expand=True)
+    names = names.dropna()
+
+    attribute_cols = [col for col in ["birth_date", "height", "weight"] if col in people.columns]
+    donors = {
+        gender: group[attribute_cols].reset_index(drop=True)
+        for gender, group in people.groupby("gender")
+    }
+    return SyntheticProfile(
+        family_names=names[0].unique(),
+        given_names=names[1].unique(),
+        donors=donors,
+    )
+
+
+# -------------------------------------------------------
+# Vectorized building blocks
+# -------------------------------------------------------
+
+def replicate_rows(df: pd.DataFrame, factor: int) -> tuple:
+    """Stack `factor` copies of df; returns (frame, replica number of each row)."""
+    positions = np.tile(np.arange(len(df)), factor)
+    replica = np.repeat(np.arange(factor), len(df))
+    return df.iloc[positions].reset_index(drop=True), replica
+
+
+def remap_codes(codes: pd.Series, replica: np.ndarray) -> pd.Series:
+    """
+    Give every replica its own entity codes.
+
+    Numeric codes (athletes) are offset by replica * CODE_OFFSET, other codes
+    (teams, events, stages) get a "-R<k>" suffix; replica 0 keeps the source
+    codes and missing values stay missing. The same code maps to the same new
+    code in every file, which keeps the datasets joinable.
+    """
+    if pd.api.types.is_integer_dtype(codes):
+        return codes + replica * CODE_OFFSET
+
+    text = codes.astype("string")
+    numeric = pd.to_numeric(text.where(text.str.fullmatch(r"\d+").fillna(False)), errors="coerce")
+    offset_codes = (numeric + replica * CODE_OFFSET).astype("Int64").astype("string")
+    suffixed = text + "-R" + pd.Series(replica, index=codes.index).astype("string")
+    remapped = offset_codes.fillna(suffixed)
+    return remapped.where(replica > 0, text).astype(object).where(codes.notna(), np.nan)
+
+
+def remap_code_lists(lists: pd.Series, replica: np.ndarray) -> pd.Series:
+    """Offset every numeric code inside list-like strings such as "['1913366', '1913367']"."""
+    text = lists.astype("string")
+    result = text.copy()
+    for k in np.unique(replica[replica > 0]):
+        mask = replica == k
+        offset = int(k) * CODE_OFFSET
+        result[mask] = text[mask].str.replace(r"\d+", lambda m: str(int(m.group(0)) + offset), regex=True)
+    return result.astype(object).where(lists.notna(), np.nan)
+
+
+def suffix_labels(labels: pd.Series, replica: np.ndarray) -> pd.Series:
+    """Suffix labels (event names) with their replica, e.g. "Men's Team (R2)"."""
+    suffix = " (R" + pd.Series(replica, index=labels.index).astype(str) + ")"
+    return labels.where(replica == 0, labels.astype(str) + suffix)
+
+
+def synthesize_people(codes: pd.Series, genders: pd.Series, profile: SyntheticProfile, rng) -> pd.DataFrame:
+    """
+    Draw names and attributes for synthetic people.
+
+    Args:
+        codes: Unique person codes of replicas > 0
+        genders: Gender of each code (same order)
+        profile: Learned distributions (see fit_profile)
+        rng: numpy Generator
+
+    Returns:
+        DataFrame indexed by code with family, given, name, birth_date, height, weight
+    """
+    n = len(codes)
+    family = profile.family_names[rng.integers(0, len(profile.family_names), n)]
+    given = profile.given_names[rng.integers(0, len(profile.given_names), n)]
+    people = pd.DataFrame({"family": family, "given": given}, index=pd.Index(codes.to_numpy(), name="code"))
+    people["name"] = people["family"] + " " + people["given"]
+
+    genders = genders.to_numpy()
+    attribute_cols = next((list(d.columns) for d in profile.donors.values()), [])
+    attributes = {col: np.full(n, None, dtype=object) for col in attribute_cols}
+    for gender, donors in profile.donors.items():
+        rows = np.flatnonzero(genders == gender)
+        if len(rows) == 0 or donors.empty:
+            continue
+        picks = rng.integers(0, len(donors), len(rows))
+        for col in attribute_cols:
+            attributes[col][rows] = donors[col].to_numpy()[picks]
+    for col, values in attributes.items():
+        people[col] = pd.Series(values, index=people.index).infer_objects()
+    return people
+
+
+# -------------------------------------------------------
+# Generator
+# -------------------------------------------------------
+
+def load_sources(data_dir: str = None) -> dict:
+    """Read the source datasets (and every results file) from a data folder."""
+    data_dir = data_dir or get_data_dir()
+    sources = {}
+    for name, filename in SCALED_FILES.items():
+        path = os.path.join(data_dir, filename)
+        if os.path.exists(path):
+            sources[name] = pd.read_csv(path)
+    sources["results"] = {
+        os.path.splitext(os.path.basename(path))[0]: pd.read_csv(path)
+        for path in sorted(glob.glob(os.path.join(data_dir, RESULTS_DIR, "*.csv")))
+    }
+    return sources
+
+
+def generate_datasets(sources: dict, factor: int, seed: int = 0) -> dict:
+    """
+    Generate N× scaled, referentially consistent datasets.
+
+    Args:
+        sources: Output of load_sources (missing datasets are skipped)
+        factor: Scale factor; replica 0 is the source data itself
+        seed: Random seed for the synthesized person attributes
+
+    Returns:
+        Dictionary with the same keys as sources plus a recomputed "medals_total"
+    """
+    rng = np.random.default_rng(seed)
+    profile = fit_profile(sources)
+    out = {}
+
+    for name in ["athletes", "medallists", "medals", "schedules", "teams", "events"]:
+        if name in sources:
+            out[name], out[f"_{name}_replica"] = replicate_rows(sources[name], factor)
+
+    # Remap entity codes and suffix event names per replica
+    if "athletes" in out:
+        out["athletes"]["code"] = remap_codes(out["athletes"]["code"], out["_athletes_replica"])
+    if "medallists" in out:
+        replica = out["_medallists_replica"]
+        df = out["medallists"]
+        df["code_athlete"] = remap_codes(df["code_athlete"], replica)
+        df["code_team"] = remap_codes(df["code_team"], replica)
+        df["event"] = suffix_labels(df["event"], replica)
+    if "medals" in out:
+        replica = out["_medals_replica"]
+        out["medals"]["code"] = remap_codes(out["medals"]["code"], replica)
+        out["medals"]["event"] = suffix_labels(out["medals"]["event"], replica)
+    if "schedules" in out:
+        out["schedules"]["event"] = suffix_labels(out["schedules"]["event"], out["_schedules_replica"])
+    if "teams" in out:
+        replica = out["_teams_replica"]
+        df = out["teams"]
+        df["code"] = remap_codes(df["code"], replica)
+        df["events"] = suffix_labels(df["events"], replica)
+        df["athletes_codes"] = remap_code_lists(df["athletes_codes"], replica)
+    if "events" in out:
+        out["events"]["event"] = suffix_labels(out["events"]["event"], out["_events_replica"])
+
+    results = {}
+    for discipline, df_results in sources.get("results", {}).items():
+        df, replica = replicate_rows(df_results, factor)
+        for col in ["participant_code", "event_code", "stage_code"]:
+            if col in df.columns:
+                df[col] = remap_codes(df[col], replica)
+        if "event_name" in df.columns:
+            df["event_name"] = suffix_labels(df["event_name"], replica)
+        out[f"_results_{discipline}_replica"] = replica
+        results[discipline] = df
+    out["results"] = results
+
+    _apply_synthetic_people(out, profile, rng)
+    out = {name: df for name, df in out.items() if not name.startswith("_")}
+    if "medals" in out:
+        out["medals_total"] = build_medals_total(out["medals"])
+    return out
+
+
+def _apply_synthetic_people(out: dict, profile: SyntheticProfile, rng):
+    """Synthesize every replica person once and write their attributes into each dataset."""
+    person_frames = []
+    if "athletes" in out:
+        df = out["athletes"]
+        person_frames.append(df.loc[out["_athletes_replica"] > 0, ["code", "gender"]])
+    if "medallists" in out:
+        df = out["medallists"]
+        person_frames.append(
+            df.loc[out["_medallists_replica"] > 0, ["code_athlete", "gender"]].rename(columns={"code_athlete": "code"})
+        )
+    if not person_frames:
+        return
+
+    persons = pd.concat(person_frames, ignore_index=True).drop_duplicates("code")
+    people = synthesize_people(persons["code"].astype(str), persons["gender"], profile, rng)
+
+    people_index = pd.Index(people.index.astype(str).to_numpy(dtype=object))
+
+    def apply(df: pd.DataFrame, replica: np.ndarray, code_col: str, columns: dict):
+        positions = people_index.get_indexer(df[code_col].astype(str).to_numpy(dtype=object))
+        rows = (replica > 0) & (positions >= 0)
+        for target, source in columns.items():
+            if target in df.columns and source in people.columns:
+                values = df[target].to_numpy(dtype=object, copy=True)
+                values[rows] = people[source].to_numpy()[positions[rows]]
+                df[target] = pd.Series(values, index=df.index).infer_objects()
+
+    if "athletes" in out:
+        apply(out["athletes"], out["_athletes_replica"], "code",
+              {"name": "name", "birth_date": "birth_date", "height": "height", "weight": "weight"})
+    if "medallists" in out:
+        apply(out["medallists"], out["_medallists_replica"], "code_athlete",
+              {"name": "name", "birth_date": "birth_date"})
+    if "medals" in out:
+        # medals.csv writes names as "Given FAMILY"
+        people["name_given_first"] = people["given"] + " " + people["family"]
+        apply(out["medals"], out["_medals_replica"], "code", {"name": "name_given_first"})
+    for key in [k for k in out if k.startswith("_results_")]:
+        discipline = key[len("_results_"):-len("_replica")]
+        apply(out["results"][discipline], out[key], "participant_code", {"participant_name": "name"})
+
+
+def build_medals_total(df_medals: pd.DataFrame) -> pd.DataFrame:
+    """Recompute the per-country medal table (medals_total.csv layout) from medals."""
+    counts = pd.crosstab(
+        [df_medals["country_code"], df_medals["country"], df_medals["country_long"]],
+        df_medals["medal_type"]
+    ).reindex(columns=MEDAL_COLUMNS, fill_value=0)
+    counts["Total"] = counts.sum(axis=1)
+    counts = counts.reset_index().sort_values(MEDAL_COLUMNS, ascending=False, ignore_index=True)
+    counts.columns.name = None
+    return counts
+
+
+def write_datasets(datasets: dict, out_dir: str, fmt: str = "csv", source_dir: str = None):
+    """
+    Write generated datasets in the data folder layout the loaders expect.
+
+    Args:
+        datasets: Output of generate_datasets
+        out_dir: Target folder (created if needed)
+        fmt: "csv" or "parquet" (parquet needs pyarrow)
+        source_dir: Data folder whose unscaled files (nocs, venues, ...) are copied along
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"Unknown format: {fmt}")
+
+    def write(df: pd.DataFrame, path_without_ext: str):
+        if fmt == "parquet":
+            df.to_parquet(path_without_ext + ".parquet", index=False)
+        else:
+            df.to_csv(path_without_ext + ".csv", index=False)
+
+    os.makedirs(os.path.join(out_dir, RESULTS_DIR), exist_ok=True)
+    for name, df in datasets.items():
+        if name == "results":
+            for discipline, df_results in df.items():
+                write(df_results, os.path.join(out_dir, RESULTS_DIR, discipline))
+        else:
+            write(df, os.path.join(out_dir, name))
+
+    source_dir = source_dir or get_data_dir()
+    for path in glob.glob(os.path.join(source_dir, "*.csv")):
+        name = os.path.splitext(os.path.basename(path))[0]
+        if name not in datasets:
+            shutil.copy(path, os.path.join(out_dir, os.path.basename(path)))
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Generate N× scaled synthetic LA28 datasets.")
+    parser.add_argument("--factor", type=int, required=True, help="Scale factor (1 = copy of the source data)")
+    parser.add_argument("--out", required=True, help="Output data folder")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv", help="Output file format")
+    parser.add_argument("--source", default=None, help="Source data folder (default: the app's data folder)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    sources = load_sources(args.source)
+    datasets = generate_datasets(sources, args.factor, args.seed)
+    generated = time.perf_counter()
+    write_datasets(datasets, args.out, args.format, args.source)
+    written = time.perf_counter()
+
+    rows = sum(len(df) for name, df in datasets.items() if name != "results")
+    rows += sum(len(df) for df in datasets["results"].values())
+    print(
+        f"Generated {rows:,} rows at {args.factor}x in {generated - started:.1f}s, "
+        f"wrote {args.format} to {args.out} in {written - generated:.1f}s"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,15 @@ Uses parallel processing and caching for efficiency.
 """
 import pandas as pd
 import streamlit as st
-from geopy.geocoders import Nominatim
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
 import hashlib
 
+from modules.lazy_imports import lazy_import
+
+# geopy is only needed when a venue has no fallback coordinates
+geocoders = lazy_import("geopy.geocoders")
+
 
 # Venue type categories for legend
 VENUE_TYPES = {
@@ -88,6 +92,20 @@ FALLBACK_COORDS = {
 }
 
 
+def match_fallback_coords(venue_name: str):
+    """
+    Match a venue against the known fallback coordinates (case-insensitive substring).
+
+    Returns:
+        (latitude, longitude) tuple, or None if no fallback matches
+    """
+    venue_lower = venue_name.lower()
+    for key, coords in FALLBACK_COORDS.items():
+        if key.lower() in venue_lower:
+            return coords
+    return None
+
+
 def _geocode_single(venue_name: str, city: str = "Paris, France") -> tuple:
     """
     Geocode a single venue (internal function for parallel processing).
@@ -96,13 +114,13 @@ def _geocode_single(venue_name: str, city: str = "Paris, France") -> tuple:
         Tuple of (venue_name, latitude, longitude)
     """
     # Check fallback first
-    for key, coords in FALLBACK_COORDS.items():
-        if key.lower() in venue_name.lower():
-            return (venue_name, coords[0], coords[1])
+    coords = match_fallback_coords(venue_name)
+    if coords is not None:
+        return (venue_name, coords[0], coords[1])
     
     try:
         # Create a new geocoder instance for thread safety
-        geolocator = Nominatim(user_agent=f"la28_dashboard_{hashlib.md5(venue_name.encode()).hexdigest()[:8]}")
+        geolocator = geocoders.Nominatim(user_agent=f"la28_dashboard_{hashlib.md5(venue_name.encode()).hexdigest()[:8]}")
         
         search_queries = [
             f"{venue_name}, {city}",
@@ -141,13 +159,10 @@ def geocode_venues_parallel(venue_names: list, max_workers: int = 5) -> dict:
     
     # First, check fallback for all venues
     for venue in venue_names:
-        found = False
-        for key, fallback_coords in FALLBACK_COORDS.items():
-            if key.lower() in venue.lower():
-                coords[venue] = fallback_coords
-                found = True
-                break
-        if not found:
+        fallback_coords = match_fallback_coords(venue)
+        if fallback_coords is not None:
+            coords[venue] = fallback_coords
+        else:
             venues_to_geocode.append(venue)
     
     # Geocode remaining venues in parallel
@@ -162,13 +177,14 @@ def geocode_venues_parallel(venue_names: list, max_workers: int = 5) -> dict:
     return coords
 
 
-def add_coordinates_to_venues(df_venues: pd.DataFrame) -> pd.DataFrame:
+def add_coordinates_to_venues(df_venues: pd.DataFrame, show_spinner: bool = True) -> pd.DataFrame:
     """
     Add latitude, longitude, and venue_type columns to venues dataframe.
     Uses parallel geocoding for efficiency.
     
     Args:
         df_venues: DataFrame with venue information
+        show_spinner: Show a spinner while geocoding (False off the script thread)
     
     Returns:
         DataFrame with added latitude, longitude, and venue_type columns
@@ -190,7 +206,10 @@ def add_coordinates_to_venues(df_venues: pd.DataFrame) -> pd.DataFrame:
     unique_venues = df["venue"].dropna().unique().tolist()
     
     # Show spinner while geocoding
-    with st.spinner(f"📍 Geocoding {len(unique_venues)} venues in parallel..."):
+    if show_spinner:
+        with st.spinner(f"📍 Geocoding {len(unique_venues)} venues in parallel..."):
+            coords_cache = geocode_venues_parallel(unique_venues)
+    else:
         coords_cache = geocode_venues_parallel(unique_venues)
     
     # Apply coordinates
@@ -0,0 +1,295 @@
+"""
+Cache warm-up and readiness gate for new replicas.
+Runs every data loader, builds the precomputed aggregates, maps countries to
+continents, resolves venue coordinates and optionally prefetches athlete
+profile images, so the first user of a replica hits warm caches. Progress is
+written to a machine-readable readiness file that an orchestrator can poll.
+
+Streamlit caches live in the server process, so --serve warms this process
+and only then starts the server in it; the health endpoint therefore only
+answers once every cache is hot.
+
+Usage:
+    python -m modules.warmup --serve --port 8501 --images 50   # warm, then serve
+    python -m modules.warmup                                   # warm this process, print the status
+    python -m modules.warmup --check                           # exit 0 only when the replica is ready
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+# Add parent directory to path for module imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+if __name__ == "__main__":
+    from streamlit.logger import set_log_level
+
+    # Caches are filled outside a script run; silence the bare-mode warnings
+    set_log_level("error")
+
+import pandas as pd
+
+from modules import data_loader
+from modules.helpers import get_continent
+from modules.venue_geocoder import add_coordinates_to_venues
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(PROJECT_DIR, "1_Overview.py")
+
+# Set LA28_READY_FILE to choose where the readiness status is written
+READY_FILE = os.environ.get("LA28_READY_FILE", os.path.join(tempfile.gettempdir(), "la28_ready.json"))
+IMAGE_WORKERS = 5
+
+LOADERS = [
+    "load_athletes_data",
+    "load_medals_data",
+    "load_medals_total_data",
+    "load_medallists_data",
+    "load_events_data",
+    "load_nocs_data",
+    "load_coaches_data",
+    "load_teams_data",
+    "load_schedule_data",
+    "load_venues_data",
+]
+
+AGGREGATES = [
+    "load_country_summary_data",
+    "load_medal_timeline",
+    "load_schedule_day_index",
+    "load_leaderboard",
+    "load_event_progression",
+    "load_brackets",
+    "load_ratings",
+    "load_medal_projection",
+]
+
+
+class ReadinessStatus:
+    """Per-cache warm-up state, persisted atomically after every change."""
+
+    def __init__(self, path: str = READY_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self.started_at = None
+        self.finished_at = None
+        self.caches = {}
+
+    def register(self, name: str, required: bool = True):
+        with self._lock:
+            self.caches[name] = {"state": "pending", "required": required, "seconds": None, "items": None, "error": None}
+
+    def update(self, name: str, **fields):
+        with self._lock:
+            self.caches[name].update(fields)
+        self.write()
+
+    @property
+    def ready(self) -> bool:
+        """True once warm-up finished and every required cache is hot."""
+        return self.finished_at is not None and all(
+            cache["state"] == "hot" for cache in self.caches.values() if cache["required"]
+        )
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "pid": os.getpid(),
+                "data_dir": data_loader.get_data_dir(),
+                "snapshot": data_loader.SNAPSHOTS.status(),
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "caches": {name: dict(cache) for name, cache in self.caches.items()},
+            }
+
+    def write(self):
+        """Write the status to the readiness file (write + rename, so readers never see half a file)."""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+READINESS = ReadinessStatus()
+
+
+def _count(result) -> int:
+    """Number of items in a warmed value (rows, keys, athletes)."""
+    if isinstance(result, (pd.DataFrame, pd.Series, dict, list)):
+        return len(result)
+    return getattr(result, "n_athletes", None)
+
+
+def _run_step(status: ReadinessStatus, name: str, fn):
+    """Run one warm-up step and record its outcome; errors are recorded, not raised."""
+    status.update(name, state="warming")
+    started = time.perf_counter()
+    try:
+        result = fn()
+    except Exception as e:
+        status.update(name, state="failed", seconds=round(time.perf_counter() - started, 3), error=f"{type(e).__name__}: {e}")
+        return None
+    status.update(name, state="hot", seconds=round(time.perf_counter() - started, 3), items=_count(result))
+    return result
+
+
+def warm_continents() -> dict:
+    """Map every country of the medal and athlete tables to its continent."""
+    countries = pd.concat([
+        data_loader.load_medals_total_data()["country"],
+        data_loader.load_medals_data()["country"],
+        data_loader.load_athletes_data()["country"],
+    ]).dropna().unique()
+    return {country: get_continent(country) for country in countries}
+
+
+def warm_venue_coordinates() -> pd.DataFrame:
+    """Resolve the coordinates of every venue the way the venues map does."""
+    df = add_coordinates_to_venues(data_loader.load_venues_data())
+    missing = int(df["latitude"].isna().sum())
+    if missing:
+        raise ValueError(f"{missing} venue rows have no coordinates")
+    return df
+
+
+def prefetch_profile_images(limit: int) -> dict:
+    """
+    Prefetch the profile images of the top-ranked athletes.
+
+    Args:
+        limit: Number of athletes, best ranked first
+
+    Returns:
+        Dictionary mapping athlete names to the image URL found (None if none)
+    """
+    from components.athlete_profile import get_athlete_image
+
+    top = data_loader.load_leaderboard().top_k(limit)
+    athletes = data_loader.load_athletes_data().drop_duplicates("code").set_index("code")
+    # Same (name, country) arguments as the profile search, so the cached entries match
+    profiles = athletes.reindex(top["code_athlete"])[["name", "country"]].dropna(subset=["name"])
+
+    with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as executor:
+        urls = executor.map(
+            lambda row: get_athlete_image(row[0], row[1] if pd.notna(row[1]) else ""),
+            profiles.itertuples(index=False),
+        )
+        return dict(zip(profiles["name"], urls))
+
+
+def warm_up(images: int = 0, status: ReadinessStatus = READINESS) -> ReadinessStatus:
+    """
+    Populate every data and derived cache of this process.
+
+    Args:
+        images: Number of top athletes whose profile images are prefetched (0 to skip)
+        status: Readiness status to record progress in
+
+    Returns:
+        The readiness status
+    """
+    import utils
+
+    steps = [(name, getattr(data_loader, name)) for name in LOADERS]
+    steps.append(("overview_data", utils.load_data))
+    steps += [(name, getattr(data_loader, name)) for name in AGGREGATES]
+    steps.append(("continents", warm_continents))
+    steps.append(("venue_coordinates", warm_venue_coordinates))
+
+    for name, _ in steps:
+        status.register(name)
+    if images:
+        # Image search is best effort and never holds back readiness
+        status.register("profile_images", required=False)
+
+    status.started_at = datetime.now(timezone.utc).isoformat()
+    status.finished_at = None
+    status.write()
+
+    for name, fn in steps:
+        _run_step(status, name, fn)
+    if images:
+        _run_step(status, "profile_images", lambda: prefetch_profile_images(images))
+
+    status.finished_at = datetime.now(timezone.utc).isoformat()
+    status.write()
+    return status
+
+
+def read_status(path: str = READY_FILE) -> dict:
+    """
+    Read a replica's readiness file.
+
+    Returns:
+        The status dictionary; "ready" is False when the file is missing or
+        the process that wrote it is gone
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        return {"ready": False, "caches": {}}
+    try:
+        os.kill(status["pid"], 0)
+    except (OSError, KeyError):
+        status["ready"] = False
+    return status
+
+
+def serve(port: int = None, script: str = MAIN_SCRIPT):
+    """Start the Streamlit server in this (already warmed) process."""
+    from streamlit.web import bootstrap
+
+    flag_options = {"server_port": port} if port else {}
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run(script, False, [], flag_options)
+
+
+def main(argv: list = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Warm the dashboard caches and report readiness.")
+    parser.add_argument("--serve", action="store_true", help="Start the server in this process once warm")
+    parser.add_argument("--port", type=int, help="Server port (with --serve)")
+    parser.add_argument("--images", type=int, default=0, help="Prefetch profile images of this many top athletes")
+    parser.add_argument("--check", action="store_true", help="Print the readiness file and exit 0 only when ready")
+    parser.add_argument("--ready-file", default=READY_FILE, help="Readiness status file")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        status = read_status(args.ready_file)
+        print(json.dumps(status, indent=2))
+        return 0 if status["ready"] else 1
+
+    os.chdir(PROJECT_DIR)
+    READINESS.path = args.ready_file
+    status = warm_up(args.images)
+
+    for name, cache in status.caches.items():
+        line = f"{cache['state']:<7} {name:<28} {cache['seconds'] or 0:7.3f}s"
+        if cache["error"]:
+            line += f"  {cache['error']}"
+        print(line)
+    print(f"ready: {status.ready}")
+
+    if not status.ready:
+        return 1
+    if args.serve:
+        from streamlit.logger import set_log_level
+
+        set_log_level("info")
+        serve(args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,15 +10,20 @@ import os
 # Add parent directory to path for module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from modules.data_loader import load_medals_total_data, load_athletes_data, load_medals_data
+from modules.data_loader import load_medals_total_data, load_athletes_data, load_medals_data, pin_snapshot, table_version
+from modules.editions import list_editions
 from modules.helpers import get_continent
+from modules.fragments import render_fragment
+from modules.progressive import ProgressiveRenderer
 
 # Import components
-from components.global_medal_distribution import render_global_medal_distribution
+from components.global_medal_distribution import prepare_global_medal_distribution, render_global_medal_distribution
 from components.medal_hierarchy import render_medal_hierarchy
-from components.continent_medals_bar import render_continent_medals_bar
-from components.top_countries_medals import render_top_countries_medals
+from components.continent_medals_bar import prepare_continent_medals_bar, render_continent_medals_bar
+from components.top_countries_medals import prepare_top_countries_medals, render_top_countries_medals
 from components.summary_statistics import render_summary_statistics
+from components.edition_comparison import render_edition_comparison
+from components.performance_panel import render_performance_panel
 
 # -------------------------------------------------------
 # Page Config
@@ -30,6 +35,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Every table this run reads comes from the same data snapshot
+pin_snapshot()
+
 st.title("🗺️ Global Medal Analysis")
 st.markdown("### Explore Olympic medals from a geographical and continental perspective")
 
@@ -94,23 +102,46 @@ else:
 
 # -------------------------------------------------------
 # Render Components
+# Sections with their own widgets run as fragments, so using them only
+# reruns that section. Widget-free charts are deferred: they get a
+# placeholder here, their data and figures are prepared in the background,
+# and they are drawn into it once the rest of the page (including the
+# summary statistics) has painted.
 # -------------------------------------------------------
 
+progressive = ProgressiveRenderer()
+
 # Global Medal Distribution (Map + Continent Detail)
-render_global_medal_distribution(df_medals, medal_columns, selected_continent)
+progressive.defer(render_global_medal_distribution, selected_continent,
+                  prepare=lambda: prepare_global_medal_distribution(df_medals, medal_columns, selected_continent),
+                  label="Loading medal map...")
 st.divider()
 
 # Medal Hierarchy
-render_medal_hierarchy(df_filtered, show_gold, show_silver, show_bronze)
+render_fragment(render_medal_hierarchy, df_filtered, show_gold, show_silver, show_bronze, df_medals,
+                medals_version=table_version("medals"))
 st.divider()
 
 # Continent vs. Medals Bar Chart
-render_continent_medals_bar(df_filtered)
+progressive.defer(render_continent_medals_bar, prepare=lambda: prepare_continent_medals_bar(df_filtered),
+                  label="Loading continent chart...")
 st.divider()
 
 # Top 20 Countries vs. Medals
-render_top_countries_medals(df_filtered)
+progressive.defer(render_top_countries_medals, prepare=lambda: prepare_top_countries_medals(df_filtered),
+                  label="Loading top countries...")
 st.divider()
 
 # Summary Statistics
 render_summary_statistics(df_filtered)
+
+# Edition Comparison (once more than one Games edition is available)
+editions = list_editions()
+if len(editions) > 1:
+    st.divider()
+    render_fragment(render_edition_comparison, editions, medal_columns)
+
+progressive.run()
+
+# Opt-in performance panel (sidebar), after every section has rendered
+render_performance_panel()
@@ -14,16 +14,23 @@ from modules.data_loader import (
     load_athletes_data,
     load_coaches_data,
     load_teams_data,
-    load_medallists_data
+    load_medallists_data,
+    load_leaderboard,
+    load_ratings,
+    pin_snapshot
 )
 from modules.helpers import get_continent
+from modules.fragments import render_fragment
+from modules.progressive import ProgressiveRenderer
 
 # Import components
 from components.athlete_profile import render_athlete_profile
-from components.age_distribution import render_age_distribution
+from components.age_distribution import prepare_age_distribution, render_age_distribution
 from components.gender_distribution import render_gender_distribution
 from components.top_athletes import render_top_athletes
 from components.athlete_summary import render_athlete_summary
+from components.ratings import render_ratings
+from components.performance_panel import render_performance_panel
 
 # -------------------------------------------------------
 # Page Config
@@ -35,6 +42,9 @@ st.set_page_config(
     layout="wide"
 )
 
+# Every table this run reads comes from the same data snapshot
+pin_snapshot()
+
 st.title("👤 Athlete Performance Analysis")
 st.markdown("### Explore athlete profiles, demographics, and achievements")
 
@@ -47,6 +57,8 @@ try:
     df_coaches = load_coaches_data()
     df_teams = load_teams_data()
     df_medallists = load_medallists_data()
+    leaderboard = load_leaderboard()
+    ratings = load_ratings()
 except FileNotFoundError as e:
     st.error(f"❌ {e}")
     st.stop()
@@ -119,23 +131,40 @@ if gender_filter:
 
 # -------------------------------------------------------
 # Render Components
+# Sections with their own widgets run as fragments, so using them only
+# reruns that section. Widget-free charts are deferred: they get a
+# placeholder here, their data and figures are prepared in the background,
+# and they are drawn into it once the rest of the page (including the
+# athlete summary) has painted.
 # -------------------------------------------------------
 
+progressive = ProgressiveRenderer()
+
 # Task 1: Athlete Detailed Profile Card
-render_athlete_profile(df_athletes, df_coaches, df_medallists)
+render_fragment(render_athlete_profile, df_athletes, df_coaches, df_medallists)
 st.divider()
 
 # Task 2: Athlete Age Distribution
-render_age_distribution(df_filtered)
+progressive.defer(render_age_distribution, prepare=lambda: prepare_age_distribution(df_filtered),
+                  label="Loading age distribution...")
 st.divider()
 
 # Task 3: Gender Distribution by Continent and Country
-render_gender_distribution(df_filtered)
+render_fragment(render_gender_distribution, df_filtered)
 st.divider()
 
 # Task 4: Top Athletes by Medals
-render_top_athletes(df_medallists, selected_countries, gender_filter, selected_sports)
+render_fragment(render_top_athletes, leaderboard, selected_countries, gender_filter, selected_sports)
+st.divider()
+
+# Head-to-Head Ratings
+render_fragment(render_ratings, ratings)
 st.divider()
 
 # Summary Statistics
 render_athlete_summary(df_filtered)
+
+progressive.run()
+
+# Opt-in performance panel (sidebar), after every section has rendered
+render_performance_panel()
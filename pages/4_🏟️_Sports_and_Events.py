@@ -10,17 +10,33 @@ import os
 # Add parent directory to path for module imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from modules.editions import edition_label
 from modules.helpers import get_continent
-from modules.data_loader import load_schedule_data, load_medals_data, load_venues_data
+from modules.fragments import render_fragment
+from modules.progressive import ProgressiveRenderer
+from modules.data_loader import (
+    load_schedule_data,
+    load_medals_data,
+    load_venues_data,
+    load_country_summary_data,
+    load_medal_timeline,
+    load_schedule_day_index,
+    load_event_progression,
+    load_brackets,
+    pin_snapshot
+)
 
 # Import components
-from components.event_schedule import render_event_schedule
-from components.medal_count_sport import render_medal_count_by_sport
-from components.venues_map import render_venues_map
+from components.event_schedule import prepare_event_schedule, render_event_schedule
+from components.medal_count_sport import prepare_medal_count_by_sport, render_medal_count_by_sport
+from components.venues_map import prepare_venues_map, render_venues_map
 from components.global_medal_distribution import render_global_medal_distribution
 from components.head_to_head import render_head_to_head
 from components.who_won_the_day import render_who_won_the_day
 from components.watch_highlights import render_watch_highlights
+from components.event_progression import render_event_progression
+from components.knockout_bracket import render_knockout_bracket
+from components.performance_panel import render_performance_panel
 
 
 # -------------------------------------------------------
@@ -33,8 +49,11 @@ st.set_page_config(
     layout="wide"
 )
 
+# Every table this run reads comes from the same data snapshot
+pin_snapshot()
+
 st.title("🏟️ Sports, Events & Venues")
-st.markdown("Explore the schedule, medal distribution by sport, and venue locations of the Paris 2024 Games.")
+st.markdown(f"Explore the schedule, medal distribution by sport, and venue locations of the {edition_label()} Games.")
 
 # -------------------------------------------------------
 # Data Loading
@@ -44,6 +63,11 @@ try:
     df_schedule = load_schedule_data()
     df_medals = load_medals_data()
     df_venues = load_venues_data()
+    df_country_summary = load_country_summary_data()
+    medal_timeline = load_medal_timeline()
+    schedule_day_index = load_schedule_day_index()
+    event_progression = load_event_progression()
+    brackets = load_brackets()
 except FileNotFoundError as e:
     st.error(f"❌ {e}")
     st.stop()
@@ -84,28 +108,50 @@ selected_continent = st.sidebar.selectbox(
 
 # -------------------------------------------------------
 # Render Components
+# Sections with their own widgets run as fragments, so using them only
+# reruns that section. Widget-free charts are deferred: they get a
+# placeholder here, their data and figures are prepared in the background,
+# and they are drawn into it once the rest of the page has painted.
 # -------------------------------------------------------
 
+progressive = ProgressiveRenderer()
+
 # Event Schedule
-render_event_schedule(df_schedule, selected_sports, selected_venues)
+progressive.defer(render_event_schedule,
+                  prepare=lambda: prepare_event_schedule(df_schedule, selected_sports, selected_venues),
+                  label="Loading event schedule...")
 st.divider()
 
 # Medal Count by Sport
-render_medal_count_by_sport(df_medals, selected_medals, selected_countries, selected_sports)
+progressive.defer(render_medal_count_by_sport,
+                  prepare=lambda: prepare_medal_count_by_sport(selected_medals, selected_countries, selected_sports),
+                  label="Loading medals by sport...")
 st.divider()
 
 # Venues Map
-render_venues_map(df_venues)
+progressive.defer(render_venues_map, prepare=lambda: prepare_venues_map(df_venues), label="Loading venues map...")
 st.divider()
 
-
 # Head-to-Head Comparison
-render_head_to_head(df_medals)
+render_fragment(render_head_to_head, df_country_summary)
 st.divider()
 
 # Who Won the Day
-render_who_won_the_day(df_medals, df_schedule)
+render_fragment(render_who_won_the_day, medal_timeline, df_schedule, schedule_day_index)
 st.divider()
 
 # Watch Highlights
-render_watch_highlights(df_schedule, df_medals)
\ No newline at end of file
+render_fragment(render_watch_highlights, df_schedule, df_medals)
+st.divider()
+
+# Event Progression
+render_fragment(render_event_progression, event_progression)
+st.divider()
+
+# Knockout Brackets
+render_fragment(render_knockout_bracket, brackets)
+
+progressive.run()
+
+# Opt-in performance panel (sidebar), after every section has rendered
+render_performance_panel()
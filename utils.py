@@ -1,13 +1,14 @@
 import pandas as pd
 import streamlit as st
 
-@st.cache_data
+from modules.data_loader import load_athletes_data, load_medals_total_data, load_events_data, load_nocs_data
+
 def load_data():
     try:
-        df_athletes = pd.read_csv('data/athletes.csv')
-        df_medals = pd.read_csv('data/medals_total.csv')
-        df_events = pd.read_csv('data/events.csv')
-        df_nocs = pd.read_csv('data/nocs.csv')
+        df_athletes = load_athletes_data()
+        df_medals = load_medals_total_data()
+        df_events = load_events_data()
+        df_nocs = load_nocs_data()
         return df_athletes, df_medals, df_events, df_nocs
     except FileNotFoundError:
         st.error("Data files not found. Please upload CSVs to the 'data/' folder.")